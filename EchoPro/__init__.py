@@ -1,6 +1,7 @@
+from .pipeline import Pipeline
 from .survey import Survey
+from .survey_collection import SurveyCollection
 
-__all__ = ["Survey"]
+__all__ = ["Survey", "Pipeline", "SurveyCollection"]
 
 __version__ = "0.3.0"
-
@@ -0,0 +1,256 @@
+"""
+Command line interface that runs the stages of a survey
+analysis without user interaction.
+"""
+import argparse
+import contextlib
+import json
+import sys
+import traceback
+from pathlib import Path
+from typing import List, Optional
+
+import yaml
+
+from .computation import SemiVariogram, krig_param_type
+from .pipeline import STAGE_DEPENDENCIES, Pipeline
+from .reports import REPORT_DEPENDENCIES, REPORT_FORMATS
+from .survey import Survey
+from .utils.precision import PRECISION_DTYPES
+
+# exit codes returned by ``main``, where argument errors exit with code 2
+EXIT_SUCCESS = 0
+EXIT_FAILURE = 1
+
+
+def load_kriging_params(file_path: Path) -> krig_param_type:
+    """
+    Reads Kriging parameters from a YAML file.
+
+    Parameters
+    ----------
+    file_path : Path
+        The path to a YAML file containing the Kriging parameters
+        (see ``Survey.get_kriging``), where ``s_v_model`` is the name
+        of a ``SemiVariogram`` model e.g. ``generalized_exp_bessel``
+
+    Returns
+    -------
+    params : dict
+        The Kriging parameters
+    """
+
+    with open(file_path) as f:
+        params = yaml.safe_load(f)
+
+    if not isinstance(params, dict):
+        raise ValueError(
+            f"The Kriging parameter file {file_path} must contain a mapping!"
+        )
+
+    # replace the semi-variogram model name with its function
+    model_name = params.get("s_v_model")
+    if model_name is not None:
+        model = getattr(SemiVariogram, str(model_name), None)
+        if (model is None) or str(model_name).startswith("_") or (not callable(model)):
+            raise ValueError(f"The semi-variogram model '{model_name}' does not exist!")
+        params["s_v_model"] = model
+
+    return params
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """
+    Constructs the parser of the command line arguments.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        The argument parser
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="echopro",
+        description="Runs the stages of a survey analysis and prints a JSON status.",
+    )
+
+    parser.add_argument("init_file", type=Path, help="The initialization YAML file")
+    parser.add_argument("survey_year_file", type=Path, help="The survey year YAML file")
+
+    parser.add_argument(
+        "--targets",
+        nargs="+",
+        choices=list(STAGE_DEPENDENCIES.keys()),
+        default=None,
+        help="The stages to run, along with all stages they depend on. By default, "
+        "all stages that can be ran with the provided options are ran.",
+    )
+    parser.add_argument(
+        "--source",
+        type=int,
+        choices=[1, 2, 3],
+        default=3,
+        help="The region of data to use: 1 = US, 2 = Canada, 3 = US and Canada",
+    )
+    parser.add_argument(
+        "--include-age1",
+        action="store_true",
+        help="Include age 1 hake in the analysis",
+    )
+    parser.add_argument(
+        "--precision",
+        choices=list(PRECISION_DTYPES.keys()),
+        default="float64",
+        help="The precision of the largest intermediate and stored arrays",
+    )
+    parser.add_argument(
+        "--transects",
+        nargs="+",
+        type=int,
+        default=None,
+        help="The subset of transects used in the calculations",
+    )
+    parser.add_argument(
+        "--kriging-params",
+        type=Path,
+        default=None,
+        help="A YAML file with the Kriging parameters, required by the Kriging stages",
+    )
+    parser.add_argument(
+        "--report-dir",
+        type=Path,
+        default=None,
+        help="The directory where reports are written, required by the 'reports' stage",
+    )
+    parser.add_argument(
+        "--reports",
+        nargs="+",
+        choices=list(REPORT_DEPENDENCIES.keys()),
+        default=None,
+        help="The reports to create. By default, all reports are created.",
+    )
+    parser.add_argument(
+        "--format",
+        nargs="+",
+        choices=REPORT_FORMATS,
+        default=["excel"],
+        help="The format(s) the reports are written in",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=2,
+        help="The maximum number of stages that are ran concurrently",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="The directory where transect results are cached",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Include the time taken by each stage and the peak memory in the status",
+    )
+
+    return parser
+
+
+def _get_peak_memory() -> Optional[float]:
+    """
+    Obtains the peak resident memory of this process.
+
+    Returns
+    -------
+    float or None
+        The peak resident memory, in megabytes, or None if it cannot be
+        obtained, since the module ``resource`` is not available on Windows
+    """
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is given in bytes on macOS and in kilobytes otherwise
+    if sys.platform == "darwin":
+        return max_rss / 1024**2
+
+    return max_rss / 1024
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the ``echopro`` command and prints its status,
+    as a JSON object, to standard output.
+
+    Parameters
+    ----------
+    argv : list of str or None
+        The command line arguments. If None, ``sys.argv`` is used.
+
+    Returns
+    -------
+    int
+        The exit code, which is ``EXIT_SUCCESS`` if all stages
+        ran successfully and ``EXIT_FAILURE`` otherwise
+    """
+
+    args = get_parser().parse_args(argv)
+
+    status = {"status": "success", "stages_ran": [], "error": None}
+
+    # messages printed by the stages are sent to standard
+    # error, so that standard output only contains the status
+    pipeline = None
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            kriging_params = (
+                None
+                if args.kriging_params is None
+                else load_kriging_params(args.kriging_params)
+            )
+
+            survey = Survey(
+                args.init_file,
+                args.survey_year_file,
+                source=args.source,
+                exclude_age1=not args.include_age1,
+                precision=args.precision,
+            )
+
+            pipeline = Pipeline(
+                survey,
+                kriging_params=kriging_params,
+                selected_transects=args.transects,
+                report_path=args.report_dir,
+                reports=args.reports,
+                report_format=args.format,
+                max_workers=args.workers,
+                cache_dir=args.cache_dir,
+            )
+
+            status["stages_ran"] = pipeline.run(args.targets)
+
+        except Exception as e:
+            status["status"] = "error"
+            status["error"] = {
+                "type": type(e).__name__,
+                "message": str(e),
+                "traceback": traceback.format_exc(),
+            }
+
+    if args.profile:
+        status["stage_times"] = {} if pipeline is None else pipeline.stage_times
+        status["peak_memory_mb"] = _get_peak_memory()
+
+    print(json.dumps(status, indent=2))
+
+    return EXIT_SUCCESS if status["status"] == "success" else EXIT_FAILURE
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,15 @@
 from .bin_dataset import generate_bin_ds
+from .biomass_age import add_biomass_age_columns, compute_biomass_age
 from .bootstrapping import Bootstrapping
 from .cv import run_jolly_hampton
 from .kriging import Kriging, krig_param_type, krig_type_dict
+from .kriging_results import (
+    get_kriging_results_ds,
+    get_kriging_results_gdf,
+    get_kriging_results_gdfs,
+    open_kriging_results,
+    save_kriging_results,
+)
 from .kriging_variables import ComputeKrigingVariables
 from .length_age_variables import (
     get_kriging_len_age_biomass,
@@ -14,6 +22,8 @@ from .transect_results import ComputeTransectVariables
 __all__ = [
     "ComputeTransectVariables",
     "generate_bin_ds",
+    "compute_biomass_age",
+    "add_biomass_age_columns",
     "ComputeKrigingVariables",
     "run_jolly_hampton",
     "Kriging",
@@ -21,6 +31,11 @@ __all__ = [
     "SemiVariogram",
     "krig_type_dict",
     "krig_param_type",
+    "get_kriging_results_ds",
+    "get_kriging_results_gdf",
+    "get_kriging_results_gdfs",
+    "save_kriging_results",
+    "open_kriging_results",
     "vario_type_dict",
     "vario_param_type",
     "get_len_age_abundance",
@@ -5,17 +5,20 @@ such as calculating variables over the Kriging mesh points,
 length-age defined variables, and creating variables for reports.
 """
 
-from typing import List, Tuple
+from typing import Dict, Tuple
 
 import numpy as np
 import pandas as pd
 import xarray as xr
 
+from ..utils.binning import get_bin_codes
 
-def _get_bin_ind(input_data: np.ndarray, bin_edges: np.ndarray) -> List[np.ndarray]:
+
+def _get_bin_codes(input_data: np.ndarray, bin_edges: np.ndarray) -> np.ndarray:
     """
-    This function manually finds those indices in ``input_data``
-    that are in each bin.
+    Obtains the bin of each element of ``input_data``, where
+    bin ``i`` contains the values ``bin_edges[i] <= x < bin_edges[i + 1]``
+    and the last bin contains all values ``x >= bin_edges[-1]``.
 
     Parameters
     ----------
@@ -26,8 +29,9 @@ def _get_bin_ind(input_data: np.ndarray, bin_edges: np.ndarray) -> List[np.ndarr
 
     Returns
     -------
-    hist_ind: list
-        The index values of ``input_data`` corresponding to the histogram
+    bin_codes: np.ndarray
+        The bin of each element of ``input_data``, values that
+        are not in a bin are assigned ``-1``
 
     Notes
     -----
@@ -36,43 +40,29 @@ def _get_bin_ind(input_data: np.ndarray, bin_edges: np.ndarray) -> List[np.ndarr
     version of EchoPro is inconsistent in how it is binning.
     """
 
-    # initialize list that will hold the indices
-    hist_ind = []
-
-    for i in range(len(bin_edges) - 1):
-
-        # get values greater or equal than lower bound
-        g_lb = bin_edges[i] <= input_data
-
-        # get values less than the upper bound
-        le_ub = input_data < bin_edges[i + 1]
-
-        # fill bin
-        hist_ind.append(np.argwhere(g_lb & le_ub).flatten())
+    bin_codes = np.searchsorted(bin_edges, input_data, side="right") - 1
+    bin_codes[np.isnan(input_data)] = -1
 
-    # fill in the last bin
-    hist_ind.append(np.argwhere(input_data >= bin_edges[-1]).flatten())
+    return bin_codes
 
-    return hist_ind
 
-
-def _get_bin_ind_age(input_data: np.ndarray, age_bins: np.ndarray) -> List[np.ndarray]:
+def _get_bin_codes_age(input_data: np.ndarray, age_bins: np.ndarray) -> np.ndarray:
     """
-    This function manually finds the indices of ``input_data``
-    for each age bin. An age bin here is described as all values
-    equal to the provided age
+    Obtains the age bin of each element of ``input_data``. An age
+    bin here is described as all values equal to the provided age.
 
     Parameters
     ----------
     input_data: np.ndarray
         The data to bin
     age_bins: np.ndarray
-        An array that specifies the age for each bin
+        A sorted array that specifies the age for each bin
 
     Returns
     -------
-    hist_ind: list
-        The index values of ``input_data`` corresponding to the histogram
+    bin_codes: np.ndarray
+        The age bin of each element of ``input_data``, values that
+        are not equal to an age in ``age_bins`` are assigned ``-1``
 
     Notes
     -----
@@ -81,22 +71,21 @@ def _get_bin_ind_age(input_data: np.ndarray, age_bins: np.ndarray) -> List[np.nd
     version of EchoPro is inconsistent in how it is binning ages.
     """
 
-    # initialize list that will hold indices
-    hist_ind = []
-
-    for age in age_bins:
-
-        # determine indices with a value equal to age
-        hist_ind.append(np.argwhere(input_data == age).flatten())
+    bin_codes = np.searchsorted(age_bins, input_data, side="left")
+    bin_codes = np.minimum(bin_codes, len(age_bins) - 1)
+    bin_codes[age_bins[bin_codes] != input_data] = -1
 
-    return hist_ind
+    return bin_codes
 
 
-def _initialize_ds(
-    stratum_ind: np.ndarray, len_bin: np.ndarray, age_bin: np.ndarray
+def _construct_ds(
+    stratum_ind: np.ndarray,
+    len_bin: np.ndarray,
+    age_bin: np.ndarray,
+    variables: Dict[str, np.ndarray],
 ) -> xr.Dataset:
     """
-    Initializes the parameter Dataset.
+    Constructs the parameter Dataset.
 
     Parameters
     ----------
@@ -106,60 +95,49 @@ def _initialize_ds(
         A one dimensional array specifying the length bin values
     age_bin: np.ndarray
         A one dimensional array specifying all age bin values
+    variables: dict
+        The values of all Dataset variables, the first
+        dimension of each array corresponds to ``stratum_ind``
 
     Returns
     -------
     ds: xr.Dataset
-        The parameter Dataset with all variables initialized
+        The parameter Dataset
     """
 
-    # initialize variable that will hold all Dataset initialized variables
-    data_vars_dict = {
-        "total_weight": ("stratum_num", np.zeros(len(stratum_ind))),
-        "aged_proportion": ("stratum_num", np.zeros(len(stratum_ind))),
-        "unaged_proportion": ("stratum_num", np.zeros(len(stratum_ind))),
-        "station_1_N": ("stratum_num", np.zeros(len(stratum_ind))),
-        "weight_len_all_normalized": (
-            ["stratum_num", "len_bin"],
-            np.zeros((len(stratum_ind), len(len_bin))),
-        ),
-    }
+    # variable names in the order they are stored in the Dataset
+    var_names = [
+        "total_weight",
+        "aged_proportion",
+        "unaged_proportion",
+        "station_1_N",
+        "weight_len_all_normalized",
+    ]
 
     # add all variables that have only male and female versions
     for sex in ["M", "F"]:
-        data_vars_dict[f"num_{sex}"] = ("stratum_num", np.zeros(len(stratum_ind)))
-        data_vars_dict[f"station_1_N_{sex}"] = (
-            "stratum_num",
-            np.zeros(len(stratum_ind)),
-        )
-        data_vars_dict[f"unaged_{sex}_wgt_proportion"] = (
-            "stratum_num",
-            np.zeros(len(stratum_ind)),
-        )
-        data_vars_dict[f"len_dist_station1_normalized_{sex}"] = (
-            ["stratum_num", "len_bin"],
-            np.zeros((len(stratum_ind), len(len_bin))),
-        )
+        var_names += [
+            f"num_{sex}",
+            f"station_1_N_{sex}",
+            f"unaged_{sex}_wgt_proportion",
+            f"len_dist_station1_normalized_{sex}",
+        ]
 
     # add all variables that have male, female, and all versions
     for sex in ["M", "F", "all"]:
-        data_vars_dict[f"len_age_weight_prop_{sex}"] = (
-            "stratum_num",
-            np.zeros(len(stratum_ind)),
-        )
-        data_vars_dict[f"len_age_dist_{sex}"] = (
-            ["stratum_num", "len_bin", "age_bin"],
-            np.zeros((len(stratum_ind), len(len_bin), len(age_bin))),
-        )
-        data_vars_dict[f"len_age_weight_dist_{sex}"] = (
-            ["stratum_num", "len_bin", "age_bin"],
-            np.zeros((len(stratum_ind), len(len_bin), len(age_bin))),
-        )
+        var_names += [
+            f"len_age_weight_prop_{sex}",
+            f"len_age_dist_{sex}",
+            f"len_age_weight_dist_{sex}",
+            f"len_age_weight_dist_{sex}_normalized",
+        ]
 
-        data_vars_dict[f"len_age_weight_dist_{sex}_normalized"] = (
-            ["stratum_num", "len_bin", "age_bin"],
-            np.zeros((len(stratum_ind), len(len_bin), len(age_bin))),
-        )
+    # the dimensions of a variable are determined by its number of dimensions
+    all_dims = ["stratum_num", "len_bin", "age_bin"]
+    data_vars_dict = {
+        name: (all_dims[: variables[name].ndim], variables[name].astype(np.float64))
+        for name in var_names
+    }
 
     # initialize Dataset that will hold length age distributions
     ds = xr.Dataset(
@@ -174,6 +152,54 @@ def _initialize_ds(
     return ds
 
 
+def _sum_by_stratum(
+    stratum_codes: np.ndarray, vals: np.ndarray, num_strata: int
+) -> np.ndarray:
+    """
+    Sums ``vals`` over all elements with the same stratum.
+
+    Parameters
+    ----------
+    stratum_codes: np.ndarray
+        The position of the stratum of each element of ``vals``
+    vals: np.ndarray
+        The values to sum
+    num_strata: int
+        The total number of strata
+
+    Returns
+    -------
+    np.ndarray
+        The sum of ``vals`` for each stratum
+    """
+
+    return np.bincount(stratum_codes, weights=vals, minlength=num_strata)
+
+
+def _normalize(vals: np.ndarray, totals: np.ndarray) -> np.ndarray:
+    """
+    Divides ``vals`` by the total of each stratum. Strata
+    with a total of zero produce NaN values.
+
+    Parameters
+    ----------
+    vals: np.ndarray
+        Values whose first dimension corresponds to the strata
+    totals: np.ndarray
+        The total of each stratum
+
+    Returns
+    -------
+    np.ndarray
+        The normalized values
+    """
+
+    totals = totals.reshape((-1,) + (1,) * (vals.ndim - 1))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return vals / totals
+
+
 def _get_len_wgt_distributions(survey) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Computes the length-weight distributions for each gender
@@ -221,247 +247,141 @@ def _get_len_wgt_distributions(survey) -> Tuple[np.ndarray, np.ndarray, np.ndarr
     return len_wgt_M, len_wgt_F, len_wgt_all
 
 
-def _set_age_distribution_data(
-    survey, stratum: int, ds: xr.Dataset, df_M: pd.DataFrame, df_F: pd.DataFrame
-) -> None:
+def _get_age_distribution_data(
+    survey,
+    stratum_ind: np.ndarray,
+    spec_drop_M: pd.DataFrame,
+    spec_drop_F: pd.DataFrame,
+) -> Dict[str, np.ndarray]:
     """
-    Computes distributions for each age using the input DataFrames.
-    Additionally, assigns these computed quantities to the Dataset ``ds``.
+    Computes the length-age distributions of all strata
+    using the input DataFrames.
 
     Parameters
     ----------
     survey : Survey
         An initialized Survey object
-    stratum: int
-        The stratum corresponding to the input data (used when
-        assigning values to ``ds``)
-    ds: xr.Dataset
-        The Dataset where computed quantities should be assigned to
-    df_M: pd.DataFrame
-        A DataFrame specifying length, age, and weight measurements
-        of a male animal within a stratum
-    df_F: pd.DataFrame
-        A DataFrame specifying length, age, and weight measurements
-        of a female animal within a stratum
-    """
+    stratum_ind: np.ndarray
+        A one dimensional array specifying all strata values
+    spec_drop_M: pd.DataFrame
+        A DataFrame, indexed by stratum, specifying length, age,
+        and weight measurements of male animals
+    spec_drop_F: pd.DataFrame
+        A DataFrame, indexed by stratum, specifying length, age,
+        and weight measurements of female animals
 
-    # account for the case when df is a Series
-    if isinstance(df_M, pd.Series):
-        # get numpy arrays of length, age, and weight
-        input_arr_len_M = np.array([df_M.length])
-        input_arr_age_M = np.array([df_M.age])
-        input_arr_wgt_M = np.array([df_M.weight])
-
-        input_arr_len_F = np.array([df_F.length])
-        input_arr_age_F = np.array([df_F.age])
-        input_arr_wgt_F = np.array([df_F.weight])
-
-    else:
-        # get numpy arrays of length, age, and weight
-        input_arr_len_M = df_M.length.values
-        input_arr_age_M = df_M.age.values
-        input_arr_wgt_M = df_M.weight.values
-
-        input_arr_len_F = df_F.length.values
-        input_arr_age_F = df_F.age.values
-        input_arr_wgt_F = df_F.weight.values
-
-    # bin the ages
-    # TODO: binning is occurring differently than in transect_results.py! It may be
-    #  better and more consistent to use the function self.krig.survey.bio_calc._get_bin_ind
-    age_bins_ind_M = _get_bin_ind_age(input_arr_age_M, survey.bio_calc.bio_hake_age_bin)
-    age_bins_ind_F = _get_bin_ind_age(input_arr_age_F, survey.bio_calc.bio_hake_age_bin)
-
-    # round input lengths
-    # TODO: this is necessary to match the Matlab output and may not be necessary!
-    input_arr_len_M = np.round(input_arr_len_M)
-    input_arr_len_F = np.round(input_arr_len_F)
-
-    # compute distributions for each age bin
-    for age_bin in range(len(age_bins_ind_M)):
-
-        # bin those lengths that correspond to the lengths in the given age bin
-        # TODO: binning is occurring differently than in transect_results.py!
+    Returns
+    -------
+    variables: dict
+        The number of animals, length-age distributions, and
+        normalized length-age weight distributions for each stratum
+    """
 
-        for sex in ["M", "F"]:
+    len_bin = survey.bio_calc.bio_hake_len_bin
+    age_bin = survey.bio_calc.bio_hake_age_bin
+    dist_shape = (len(stratum_ind), len(len_bin), len(age_bin))
 
-            if sex == "M":
-                input_arr_len = input_arr_len_M
-                age_bins_ind = age_bins_ind_M
-                input_arr_wgt = input_arr_wgt_M
-            else:
-                input_arr_len = input_arr_len_F
-                age_bins_ind = age_bins_ind_F
-                input_arr_wgt = input_arr_wgt_F
+    variables = dict()
+    for sex, df in [("M", spec_drop_M), ("F", spec_drop_F)]:
 
-            len_bin_ind = _get_bin_ind(
-                input_arr_len[age_bins_ind[age_bin]],
-                survey.bio_calc.bio_hake_len_bin,
-            )
+        # calculate the number of animals in each stratum
+        stratum_codes = pd.Index(stratum_ind).get_indexer(df.index)
+        variables[f"num_{sex}"] = np.bincount(
+            stratum_codes[stratum_codes >= 0], minlength=len(stratum_ind)
+        )
 
-            # get the distribution of weight for a particular age bin
-            ds[f"len_age_weight_dist_{sex}"].sel(stratum_num=stratum)[
-                :, age_bin
-            ] = np.array(
-                [np.sum(input_arr_wgt[age_bins_ind[age_bin]][i]) for i in len_bin_ind]
-            )
+        # bin the ages and the rounded lengths
+        # TODO: binning is occurring differently than in transect_results.py!
+        # TODO: rounding is necessary to match the Matlab output and may not be necessary!
+        age_codes = _get_bin_codes_age(df["age"].values, age_bin)
+        len_codes = _get_bin_codes(np.round(df["length"].values), len_bin)
+
+        # flat index of the (stratum, length bin, age bin) of each animal
+        in_bins = (stratum_codes >= 0) & (age_codes >= 0) & (len_codes >= 0)
+        flat_ind = np.ravel_multi_index(
+            (stratum_codes[in_bins], len_codes[in_bins], age_codes[in_bins]),
+            dist_shape,
+        )
 
-            # get the distribution of lengths for a particular age bin
-            ds[f"len_age_dist_{sex}"].sel(stratum_num=stratum)[:, age_bin] = np.array(
-                [len(i) for i in len_bin_ind]
-            )
+        # get the distribution of lengths for each length and age bin
+        variables[f"len_age_dist_{sex}"] = np.bincount(
+            flat_ind, minlength=np.prod(dist_shape)
+        ).reshape(dist_shape)
 
-        # get the distribution of weight for a particular age bin for all genders
-        ds.sel(stratum_num=stratum).len_age_weight_dist_all[:, age_bin] = (
-            ds.sel(stratum_num=stratum).len_age_weight_dist_M[:, age_bin]
-            + ds.sel(stratum_num=stratum).len_age_weight_dist_F[:, age_bin]
-        )
+        # get the distribution of weight for each length and age bin
+        variables[f"len_age_weight_dist_{sex}"] = np.bincount(
+            flat_ind,
+            weights=df["weight"].values[in_bins],
+            minlength=np.prod(dist_shape),
+        ).reshape(dist_shape)
 
-        # get the distribution of lengths for a particular age bin for all genders
-        ds.sel(stratum_num=stratum).len_age_dist_all[:, age_bin] = (
-            ds.sel(stratum_num=stratum).len_age_dist_M[:, age_bin]
-            + ds.sel(stratum_num=stratum).len_age_dist_F[:, age_bin]
-        )
+    # get the distributions for all genders
+    for name in ["len_age_dist", "len_age_weight_dist"]:
+        variables[f"{name}_all"] = variables[f"{name}_M"] + variables[f"{name}_F"]
 
     # obtain normalized distributions
     for sex in ["all", "M", "F"]:
-        ds[f"len_age_weight_dist_{sex}_normalized"].sel(stratum_num=stratum)[:, :] = ds[
-            f"len_age_weight_dist_{sex}"
-        ].sel(stratum_num=stratum) / np.nansum(
-            ds[f"len_age_weight_dist_{sex}"].sel(stratum_num=stratum)
+        weight_dist = variables[f"len_age_weight_dist_{sex}"]
+        variables[f"len_age_weight_dist_{sex}_normalized"] = _normalize(
+            weight_dist, np.nansum(weight_dist, axis=(1, 2))
         )
 
+    return variables
 
-def _set_total_weight(
-    survey, haul_nums: np.ndarray, stratum: int, ds: xr.Dataset
-) -> float:
+
+def _get_haul_stratum_pairs(survey, stratum_ind: np.ndarray) -> pd.DataFrame:
     """
-    Computes the total weight within the stratum using data from
-    both stations. Additionally, assigns the variable ``total_weight``
-    to ``ds``.
+    Obtains the hauls within each stratum of ``stratum_ind``.
 
     Parameters
     ----------
     survey : Survey
         An initialized Survey object
-    haul_nums: np.ndarray
-        A one dimensional array of haul numbers within the stratum
-        under consideration
-    stratum: int
-        The stratum corresponding to the input data (used when
-        assigning values to ``ds``)
-    ds: xr.Dataset
-        The Dataset where computed quantities should be assigned to
-
-    Returns
-    -------
-    wgt_station_1: float
-        The total weight at station 1 for the stratum
-    """
-
-    # calculate the total weight within the stratum for station 1
-    wgt_station_1 = np.array(
-        [
-            survey.catch_df.loc[j][
-                "haul_weight"
-            ].sum()  # TODO: make catch_df a bio_calc variable?
-            for j in haul_nums
-            if (j in survey.catch_df.index) and (j in survey.length_df.index)
-        ]
-    ).sum()
-
-    # calculate the total weight within the stratum for station 2
-    wgt_station_2 = survey.bio_calc.specimen_df.loc[stratum]["weight"].sum()
-
-    # the total weight within the stratum
-    ds.total_weight.loc[stratum] = wgt_station_1 + wgt_station_2
-
-    return wgt_station_1
-
-
-def _get_length_based_wgt_interp(
-    haul_nums: np.ndarray,
-    df: pd.DataFrame,
-    len_bin: np.ndarray,
-    len_wgt: np.ndarray,
-) -> float:
-    """
-    Obtains the weight of animals within a stratum using ``length_df``
-    data and interpolation.
-
-    Parameters
-    ----------
-    haul_nums: np.ndarray
-        A one dimensional array of haul numbers within the stratum
-        under consideration
-    df: pd.DataFrame
-        A DataFrame containing data from ``length_df``
-    len_bin: np.ndarray
-        Length bin values
-    len_wgt: np.ndarray
-        The length-weight distribution corresponding to ``df``
+    stratum_ind: np.ndarray
+        A one dimensional array specifying all strata values
 
     Returns
     -------
-    final_wgt: float
-        The total weight of animals within the stratum
+    pd.DataFrame
+        A DataFrame with columns ``haul_num`` and ``stratum_code``,
+        where ``stratum_code`` is the position of the stratum in
+        ``stratum_ind``
     """
 
-    # initialize weight value
-    final_wgt = 0.0
-
-    # obtain the hauls that are within df
-    len_haul = [round(df.loc[j]["length"]) for j in haul_nums if j in df.index]
-
-    if len_haul:
-
-        # get the number of lengths for each haul
-        len_haul_counts = np.concatenate(
-            [df.loc[j]["length_count"].values for j in haul_nums if j in df.index]
-        )
+    # obtain a mapping of hauls to strata
+    haul_vs_stratum = survey.bio_calc.strata_df.reset_index()[
+        ["haul_num", "stratum_num"]
+    ]
 
-        # calculate the weight of animals within the stratum
-        len_haul = np.concatenate(len_haul)
-        final_wgt = (np.interp(len_haul, len_bin, len_wgt) * len_haul_counts).sum()
+    haul_vs_stratum["stratum_code"] = pd.Index(stratum_ind).get_indexer(
+        haul_vs_stratum["stratum_num"]
+    )
 
-    return final_wgt
+    return haul_vs_stratum.loc[
+        haul_vs_stratum["stratum_code"] >= 0, ["haul_num", "stratum_code"]
+    ]
 
 
-def _get_length_df_based_wgt(
+def _get_station_1_data(
     survey,
-    stratum: int,
-    ds: xr.Dataset,
-    haul_nums: np.ndarray,
-    length_df_M: pd.DataFrame,
-    length_df_F: pd.DataFrame,
-    len_bin: np.ndarray,
+    stratum_ind: np.ndarray,
+    haul_pairs: pd.DataFrame,
     len_wgt_M: np.ndarray,
     len_wgt_F: np.ndarray,
     len_wgt_all: np.ndarray,
-) -> Tuple[float, float]:
+) -> Tuple[Dict[str, np.ndarray], np.ndarray, np.ndarray, np.ndarray]:
     """
-    Computes the weight of a particular stratum based off of the
-    length data. Additionally, assigns values to the ``ds`` variable
-    ``weight_len_all_normalized``.
+    Computes variables of each stratum that are based off of
+    the station 1 data (i.e. ``length_df`` and ``catch_df``).
 
     Parameters
     ----------
     survey : Survey
         An initialized Survey object
-    stratum: int
-        The stratum corresponding to the input data (used when
-        assigning values to ``ds``)
-    ds: xr.Dataset
-        The Dataset where computed quantities should be assigned to
-    haul_nums: np.ndarray
-        A one dimensional array of haul numbers within the stratum
-        under consideration
-    length_df_M: pd.DataFrame
-        Male data obtained from ``length_df``
-    length_df_F: pd.DataFrame
-        Female data obtained from ``length_df``
-    len_bin: np.ndarray
-        Length bin values
+    stratum_ind: np.ndarray
+        A one dimensional array specifying all strata values
+    haul_pairs: pd.DataFrame
+        The hauls within each stratum, as produced by ``_get_haul_stratum_pairs``
     len_wgt_M: np.ndarray
         The length-weight distribution for males
     len_wgt_F: np.ndarray
@@ -471,136 +391,178 @@ def _get_length_df_based_wgt(
 
     Returns
     -------
-    male_wgt: float
-        The total weight of males within the stratum
-    female_wgt: float
-        The total weight of females within the stratum
+    variables: dict
+        The number of animals and normalized length distributions
+        at station 1 for each stratum
+    wgt_station_1: np.ndarray
+        The total weight at station 1 for each stratum
+    male_wgt: np.ndarray
+        The total weight of males within each stratum
+    female_wgt: np.ndarray
+        The total weight of females within each stratum
     """
 
-    # calculate the weight of male and female animals within the stratum
-    male_wgt = _get_length_based_wgt_interp(haul_nums, length_df_M, len_bin, len_wgt_M)
-    female_wgt = _get_length_based_wgt_interp(
-        haul_nums, length_df_F, len_bin, len_wgt_F
+    len_bin = survey.params["bio_hake_len_bin"]
+    num_strata = len(stratum_ind)
+
+    # calculate the total weight within each stratum for station 1
+    # TODO: make catch_df a bio_calc variable?
+    haul_wgt = survey.catch_df["haul_weight"].groupby(level=0).sum()
+    haul_wgt = haul_wgt[haul_wgt.index.isin(survey.length_df.index)]
+    wgt_station_1 = _sum_by_stratum(
+        haul_pairs["stratum_code"].values,
+        haul_wgt.reindex(haul_pairs["haul_num"].values, fill_value=0.0).values,
+        num_strata,
     )
 
-    # obtain all haul numbers within the stratum and in length_df
-    hauls_in_all = [j for j in haul_nums if j in survey.length_df.index]
-
-    if hauls_in_all:
-
-        for sex in ["M", "F"]:
-
-            if sex == "M":
-                df = length_df_M
-            else:
-                df = length_df_F
-
-            # get normalized length distribution of length_df gender data
-            ds[f"len_dist_station1_normalized_{sex}"].sel(stratum_num=stratum)[
-                :
-            ] = survey.bio_calc._get_distribution_lengths_station_1(
-                df.loc[hauls_in_all]
-            )
-
-            # store the number of animals in station 1 for the stratum
-            ds[f"station_1_N_{sex}"].loc[stratum] = df.loc[hauls_in_all][
-                "length_count"
-            ].sum()
+    # obtain the length data of the hauls within each stratum
+    # TODO: does not use bio_calc.length_df value (it would give incorrect
+    #  answers as that df drops values)
+    length_df = survey.length_df.reset_index().merge(haul_pairs, on="haul_num")
+    length_dfs = {
+        "M": length_df[length_df["sex"] == 1],
+        "F": length_df[length_df["sex"] == 2],
+        "all": length_df,
+    }
 
-        # get normalized length distribution of length_df data
-        len_dist_station1_normalized = (
-            survey.bio_calc._get_distribution_lengths_station_1(
-                survey.length_df.loc[hauls_in_all]
+    # strata that have hauls within length_df
+    has_station_1 = np.bincount(length_df["stratum_code"], minlength=num_strata) > 0
+
+    variables = dict()
+    len_dist_station1 = dict()
+    for sex, df in length_dfs.items():
+
+        stratum_codes = df["stratum_code"].values
+        length_count = df["length_count"].values
+
+        # store the number of animals in station 1 for each stratum
+        station_1_N = _sum_by_stratum(stratum_codes, length_count, num_strata)
+
+        # get normalized length distribution of the length data
+        len_codes = get_bin_codes(df["length"].values, survey.bio_calc.bio_hake_len_bin)
+        in_bins = len_codes >= 0
+        len_bin_cnt = np.bincount(
+            stratum_codes[in_bins] * len(len_bin) + len_codes[in_bins],
+            weights=length_count[in_bins],
+            minlength=num_strata * len(len_bin),
+        ).reshape((num_strata, len(len_bin)))
+        len_dist_station1[sex] = _normalize(len_bin_cnt, len_bin_cnt.sum(axis=1))
+
+        if sex == "all":
+            variables["station_1_N"] = np.where(has_station_1, station_1_N, 0.0)
+        else:
+            variables[f"station_1_N_{sex}"] = np.where(has_station_1, station_1_N, 0.0)
+            variables[f"len_dist_station1_normalized_{sex}"] = np.where(
+                has_station_1[:, None], len_dist_station1[sex], 0.0
             )
-        )
-
-        # store the number of animals in station 1 for the stratum
-        ds.station_1_N.loc[stratum] = survey.length_df.loc[hauls_in_all][
-            "length_count"
-        ].sum()
 
-        # obtain the weight per unit length distribution
-        weight_len_all = len_wgt_all * len_dist_station1_normalized
+    # obtain the normalized weight per unit length distribution
+    weight_len_all = len_wgt_all * len_dist_station1["all"]
+    variables["weight_len_all_normalized"] = np.where(
+        has_station_1[:, None],
+        _normalize(weight_len_all, weight_len_all.sum(axis=1)),
+        0.0,
+    )
 
-        # normalized weight per unit length distribution
-        ds.sel(stratum_num=stratum).weight_len_all_normalized[:] = (
-            weight_len_all / weight_len_all.sum()
+    # calculate the weight of male and female animals within each stratum
+    sex_wgt = dict()
+    for sex, len_wgt in [("M", len_wgt_M), ("F", len_wgt_F)]:
+        df = length_dfs[sex]
+        sex_wgt[sex] = _sum_by_stratum(
+            df["stratum_code"].values,
+            np.interp(np.round(df["length"].values), len_bin, len_wgt)
+            * df["length_count"].values,
+            num_strata,
         )
 
-    return female_wgt, male_wgt
+    return variables, wgt_station_1, sex_wgt["M"], sex_wgt["F"]
 
 
-def _set_proportion_parameters(
-    stratum: int,
-    ds: xr.Dataset,
-    male_wgt: float,
-    female_wgt: float,
-    wgt_station_1: float,
-) -> None:
+def _get_proportion_parameters(
+    variables: Dict[str, np.ndarray],
+    male_wgt: np.ndarray,
+    female_wgt: np.ndarray,
+    wgt_station_1: np.ndarray,
+) -> Dict[str, np.ndarray]:
     """
-    Calculates and assigns proportion parameters to ``ds`` for a stratum.
+    Calculates proportion parameters for all strata.
 
     Parameters
     ----------
-    stratum: int
-        The stratum corresponding to the input data (used when
-        assigning values to ``ds``)
-    ds: xr.Dataset
-        The Dataset where computed quantities should be assigned to
-    male_wgt: float
-        The total weight of males within the stratum
-    female_wgt: float
-        The total weight of females within the stratum
-    wgt_station_1: float
-        The total weight at station 1 for the stratum
+    variables: dict
+        Variables of each stratum containing ``total_weight``
+        and all ``len_age_weight_dist`` variables
+    male_wgt: np.ndarray
+        The total weight of males within each stratum
+    female_wgt: np.ndarray
+        The total weight of females within each stratum
+    wgt_station_1: np.ndarray
+        The total weight at station 1 for each stratum
+
+    Returns
+    -------
+    prop_variables: dict
+        The proportion parameters for each stratum
     """
 
-    # calculate and assign the len_age_weight proportions
-    for sex in ["all", "M", "F"]:
-        ds[f"len_age_weight_prop_{sex}"].loc[stratum] = np.nansum(
-            ds[f"len_age_weight_dist_{sex}"].sel(stratum_num=stratum)
-        ) / ds.total_weight.sel(stratum_num=stratum)
+    total_weight = variables["total_weight"]
 
-    # calculate and assign aged proportions
-    ds.aged_proportion.loc[stratum] = (
-        ds.len_age_weight_prop_M.loc[stratum] + ds.len_age_weight_prop_F.loc[stratum]
-    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+
+        # calculate the len_age_weight proportions
+        prop_variables = {
+            f"len_age_weight_prop_{sex}": np.nansum(
+                variables[f"len_age_weight_dist_{sex}"], axis=(1, 2)
+            )
+            / total_weight
+            for sex in ["all", "M", "F"]
+        }
+
+        # calculate the aged and unaged proportions
+        prop_variables["aged_proportion"] = (
+            prop_variables["len_age_weight_prop_M"]
+            + prop_variables["len_age_weight_prop_F"]
+        )
+        prop_variables["unaged_proportion"] = 1.0 - prop_variables["aged_proportion"]
 
-    # calculate and assign the unaged proportions
-    ds.unaged_proportion.loc[stratum] = 1.0 - ds.aged_proportion.loc[stratum]
-
-    # obtain the normalized weight of station 1 for males and females
-    if (male_wgt != 0.0) and (female_wgt != 0.0):
-        nM_wgt1 = wgt_station_1 * male_wgt / (male_wgt + female_wgt)
-        nF_wgt1 = wgt_station_1 * female_wgt / (male_wgt + female_wgt)
-    else:
-        nM_wgt1 = 0.0
-        nF_wgt1 = 0.0
-
-    # obtain length and gender based weight proportion
-    Len_M_wgt_proportion = nM_wgt1 / ds.total_weight.sel(stratum_num=stratum).values
-    Len_F_wgt_proportion = nF_wgt1 / ds.total_weight.sel(stratum_num=stratum).values
-
-    # obtain the proportion of males and females
-    if (Len_M_wgt_proportion == 0.0) and (Len_F_wgt_proportion == 0.0):
-        M_proportion = 0.5
-        F_proportion = 0.5
-    else:
-        M_proportion = Len_M_wgt_proportion / (
-            Len_M_wgt_proportion + Len_F_wgt_proportion
+        # obtain the normalized weight of station 1 for males and females
+        has_wgt = (male_wgt != 0.0) & (female_wgt != 0.0)
+        nM_wgt1 = np.where(
+            has_wgt, wgt_station_1 * male_wgt / (male_wgt + female_wgt), 0.0
         )
-        F_proportion = Len_F_wgt_proportion / (
-            Len_M_wgt_proportion + Len_F_wgt_proportion
+        nF_wgt1 = np.where(
+            has_wgt, wgt_station_1 * female_wgt / (male_wgt + female_wgt), 0.0
         )
 
-    # calculate and assign the unaged weight proportion of males and females
-    ds.unaged_M_wgt_proportion.loc[stratum] = (
-        ds.unaged_proportion.loc[stratum].values * M_proportion
+        # obtain length and gender based weight proportion
+        Len_M_wgt_proportion = nM_wgt1 / total_weight
+        Len_F_wgt_proportion = nF_wgt1 / total_weight
+
+        # obtain the proportion of males and females
+        no_wgt_proportion = (Len_M_wgt_proportion == 0.0) & (
+            Len_F_wgt_proportion == 0.0
+        )
+        M_proportion = np.where(
+            no_wgt_proportion,
+            0.5,
+            Len_M_wgt_proportion / (Len_M_wgt_proportion + Len_F_wgt_proportion),
+        )
+        F_proportion = np.where(
+            no_wgt_proportion,
+            0.5,
+            Len_F_wgt_proportion / (Len_M_wgt_proportion + Len_F_wgt_proportion),
+        )
+
+    # calculate the unaged weight proportion of males and females
+    prop_variables["unaged_M_wgt_proportion"] = (
+        prop_variables["unaged_proportion"] * M_proportion
     )
-    ds.unaged_F_wgt_proportion.loc[stratum] = (
-        ds.unaged_proportion.loc[stratum].values * F_proportion
+    prop_variables["unaged_F_wgt_proportion"] = (
+        prop_variables["unaged_proportion"] * F_proportion
     )
 
+    return prop_variables
+
 
 def generate_bin_ds(survey) -> xr.Dataset:
     """
@@ -618,6 +580,11 @@ def generate_bin_ds(survey) -> xr.Dataset:
     -------
     ds: xr.Dataset
         A Dataset containing useful parameters
+
+    Notes
+    -----
+    The parameters of all strata are computed at once using
+    grouped reductions, and the Dataset is constructed from them.
     """
 
     # obtain specimen DataFrames without NA values
@@ -628,12 +595,6 @@ def generate_bin_ds(survey) -> xr.Dataset:
     spec_drop_M = spec_drop[spec_drop["sex"] == 1]
     spec_drop_F = spec_drop[spec_drop["sex"] == 2]
 
-    # obtain gender based length DataFrames
-    # TODO: does not use bio_calc.length_df value (it would give incorrect
-    #  answers as that df drops values)
-    length_df_M = survey.length_df[survey.length_df["sex"] == 1]
-    length_df_F = survey.length_df[survey.length_df["sex"] == 2]
-
     # get all unique stratum values that are contained in spec_drop, spec_drop_M, and spec_drop_F
     stratum_ind = np.intersect1d(spec_drop.index.unique(), spec_drop_M.index.unique())
     stratum_ind = np.intersect1d(stratum_ind, spec_drop_F.index.unique())
@@ -642,55 +603,36 @@ def generate_bin_ds(survey) -> xr.Dataset:
     len_bin = survey.params["bio_hake_len_bin"]
     age_bin = survey.params["bio_hake_age_bin"]
 
-    # initialize Dataset that will hold all parameters
-    ds = _initialize_ds(stratum_ind, len_bin, age_bin)
-
-    # obtain a mapping of hauls to strata
-    haul_vs_stratum = survey.bio_calc.strata_df.reset_index()[
-        ["haul_num", "stratum_num"]
-    ]
-
     # get length-weight distributions (includes all ages in quantity)
     len_wgt_M, len_wgt_F, len_wgt_all = _get_len_wgt_distributions(survey)
 
-    for i in stratum_ind:
-
-        # obtain haul numbers that are in the stratum i
-        haul_nums = haul_vs_stratum[haul_vs_stratum["stratum_num"] == i][
-            "haul_num"
-        ].values
+    # set age distribution related data
+    variables = _get_age_distribution_data(
+        survey, stratum_ind, spec_drop_M, spec_drop_F
+    )
 
-        # calculate and set the number of animals in the stratum based on gender
-        ds.num_M.loc[i] = len(spec_drop_M.loc[i])
-        ds.num_F.loc[i] = len(spec_drop_F.loc[i])
+    # get station 1 based variables and weights
+    station_1_vars, wgt_station_1, male_wgt, female_wgt = _get_station_1_data(
+        survey,
+        stratum_ind,
+        _get_haul_stratum_pairs(survey, stratum_ind),
+        len_wgt_M,
+        len_wgt_F,
+        len_wgt_all,
+    )
+    variables.update(station_1_vars)
 
-        # set age distribution related data
-        _set_age_distribution_data(
-            survey=survey,
-            stratum=i,
-            ds=ds,
-            df_M=spec_drop_M.loc[i],
-            df_F=spec_drop_F.loc[i],
-        )
+    # calculate the total weight within each stratum for station 2
+    wgt_station_2 = (
+        survey.bio_calc.specimen_df["weight"].groupby(level=0).sum().loc[stratum_ind]
+    )
 
-        # assign the total weight in both station to ds and obtain the weight in station 1
-        wgt_station_1 = _set_total_weight(survey, haul_nums, i, ds)
-
-        # get length_df based weight for males and females
-        female_wgt, male_wgt = _get_length_df_based_wgt(
-            survey,
-            i,
-            ds,
-            haul_nums,
-            length_df_M,
-            length_df_F,
-            len_bin,
-            len_wgt_M,
-            len_wgt_F,
-            len_wgt_all,
-        )
+    # the total weight in both stations
+    variables["total_weight"] = wgt_station_1 + wgt_station_2.values
 
-        # calculate and assign proportion parameters to ds
-        _set_proportion_parameters(i, ds, male_wgt, female_wgt, wgt_station_1)
+    # calculate proportion parameters
+    variables.update(
+        _get_proportion_parameters(variables, male_wgt, female_wgt, wgt_station_1)
+    )
 
-    return ds
+    return _construct_ds(stratum_ind, len_bin, age_bin, variables)
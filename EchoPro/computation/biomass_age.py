@@ -0,0 +1,124 @@
+"""
+Computes the biomass of each age bin for all sexes at once, where the
+results are stored in a single array and the ``biomass_age_bin_*``
+columns of the results GeoDataFrames are constructed from it.
+"""
+
+from typing import List, Union
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+from ..utils.coded_index import CodedIndex
+from ..utils.precision import get_precision_dtype
+
+# the name of each sex and the suffix of its results GeoDataFrame
+RESULTS_SEXES = {"all": "", "male": "_male", "female": "_female"}
+
+# the prefix of the weight fraction columns of each age bin
+WEIGHT_FRACTION_PREFIX = "age_bin_"
+
+
+def compute_biomass_age(
+    strata_index: CodedIndex,
+    stratum_codes: np.ndarray,
+    weight_fraction_dfs: List[pd.DataFrame],
+    biomass_columns: List[Union[pd.Series, np.ndarray]],
+    dim: str,
+    precision: str = "float64",
+) -> xr.DataArray:
+    """
+    Computes the biomass of each age bin for each sex in ``RESULTS_SEXES``.
+
+    Parameters
+    ----------
+    strata_index : CodedIndex
+        The index of all strata
+    stratum_codes : np.ndarray
+        The code of the stratum of each row of the results
+    weight_fraction_dfs : list of pd.DataFrame
+        The weight fraction of each age bin for each stratum, for
+        each sex in ``RESULTS_SEXES``
+    biomass_columns : list of pd.Series or np.ndarray
+        The adult biomass of each row of the results, for
+        each sex in ``RESULTS_SEXES``
+    dim : str
+        The name of the dimension corresponding to the rows of the results
+    precision : str
+        The precision of the biomass, either ``"float64"`` or ``"float32"``
+
+    Returns
+    -------
+    xr.DataArray
+        The biomass over ``(dim, sex, age_bin)``, stored as a single
+        C-contiguous array, where ``dim`` has no coordinate, so that it
+        corresponds to the rows of the results by position
+    """
+
+    age_columns = list(weight_fraction_dfs[0].columns)
+    if any(list(df.columns) != age_columns for df in weight_fraction_dfs):
+        raise ValueError(
+            "The weight fractions of all sexes must have the same age bins!"
+        )
+
+    dtype = get_precision_dtype(precision)
+    biomass_age = np.empty(
+        (len(stratum_codes), len(RESULTS_SEXES), len(age_columns)), dtype=dtype
+    )
+
+    # expand the weight fraction of each sex to the rows of the results
+    for i, weight_fraction_df in enumerate(weight_fraction_dfs):
+        biomass_age[:, i, :] = strata_index.expand(weight_fraction_df, stratum_codes)
+
+    biomass_age *= np.stack(
+        [np.asarray(biomass, dtype=dtype) for biomass in biomass_columns], axis=1
+    )[:, :, np.newaxis]
+
+    return xr.DataArray(
+        biomass_age,
+        dims=(dim, "sex", "age_bin"),
+        coords={
+            "sex": list(RESULTS_SEXES.keys()),
+            "age_bin": [int(col[len(WEIGHT_FRACTION_PREFIX) :]) for col in age_columns],
+        },
+    )
+
+
+def add_biomass_age_columns(
+    results_gdf: gpd.GeoDataFrame, biomass_age: xr.DataArray, sex: str
+) -> gpd.GeoDataFrame:
+    """
+    Adds the columns ``biomass_age_bin_*`` of a sex to a results GeoDataFrame.
+
+    Parameters
+    ----------
+    results_gdf : gpd.GeoDataFrame
+        The results of the sex, whose rows correspond to ``biomass_age``
+    biomass_age : xr.DataArray
+        The biomass constructed by ``compute_biomass_age``
+    sex : str
+        A sex in ``RESULTS_SEXES``
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        ``results_gdf`` with the biomass of each age bin appended
+
+    Notes
+    -----
+    The columns are added as a single block, rather than one column at
+    a time, which avoids fragmenting the GeoDataFrame.
+    """
+
+    biomass_age_df = pd.DataFrame(
+        biomass_age.sel(sex=sex).values,
+        index=results_gdf.index,
+        columns=[
+            f"biomass_age_bin_{age_bin}" for age_bin in biomass_age["age_bin"].values
+        ],
+        copy=False,
+    )
+
+    return pd.concat([results_gdf, biomass_age_df], axis=1)
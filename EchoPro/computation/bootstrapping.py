@@ -141,9 +141,8 @@ class Bootstrapping:
         # apply transect mesh transformation
         krig_mesh_obj.apply_coordinate_transformation(coord_type="transect")
 
-        # apply full mesh transformation
-        # TODO: they way this is setup is inefficient because we need
-        #  to transform the full mesh every time, can we avoid this?
+        # apply full mesh transformation, where the aligned mesh is
+        # reused and only the distance transformation is applied again
         krig_mesh_obj.apply_coordinate_transformation(coord_type="mesh")
 
         # get Kriged biomass estimate
@@ -1,10 +1,20 @@
-from typing import Callable, Tuple, TypedDict
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, TypedDict, Union
 
 import geopandas as gpd
 import numpy as np
 import pandas as pd
 
 from ..data_loader import KrigingMesh
+from ..utils.precision import get_precision_dtype
+from ..utils.profiler import get_profiler, profile_method
+from .kriging_results import (
+    add_kriging_results_columns,
+    init_kriging_results_ds,
+    open_kriging_results,
+    save_kriging_results,
+)
 from .kriging_variables import ComputeKrigingVariables
 from .numba_functions import nb_dis_mat, nb_subtract_outer
 
@@ -43,6 +53,10 @@ class Kriging:
         Dictionary specifying the parameter values for the semi-variogram model.
     s_v_model: Callable
         a Semi-variogram model from the ``SemiVariogram`` class
+    precision: str
+        The precision of the distance matrix between the mesh and the
+        data, either ``"float64"`` or ``"float32"``. The Kriging systems
+        are always assembled and solved in float64.
     """
 
     def __init__(
@@ -54,6 +68,7 @@ class Kriging:
         ratio: float = None,
         s_v_params: dict = None,
         s_v_model: Callable = None,
+        precision: str = "float64",
     ):
 
         self.survey = survey
@@ -71,6 +86,9 @@ class Kriging:
         # grab appropriate semi-variogram model
         self.s_v_model = s_v_model
 
+        # the dtype of the distance matrix
+        self.dtype = get_precision_dtype(precision)
+
     def _compute_k_smallest_distances(
         self,
         x_mesh: np.ndarray,
@@ -106,8 +124,12 @@ class Kriging:
         """
 
         # compute the distance between the mesh points and transect points
-        x_diff = nb_subtract_outer(x_mesh, x_data)
-        y_diff = nb_subtract_outer(y_mesh, y_data)
+        x_diff = nb_subtract_outer(
+            x_mesh.astype(self.dtype, copy=False), x_data.astype(self.dtype, copy=False)
+        )
+        y_diff = nb_subtract_outer(
+            y_mesh.astype(self.dtype, copy=False), y_data.astype(self.dtype, copy=False)
+        )
         dis = nb_dis_mat(x_diff, y_diff)
 
         # sort dis up to the kmax smallest elements in each row
@@ -169,7 +191,9 @@ class Kriging:
 
             # TODO: should we change this to how Chu does it?
             # tapered function to handle extrapolation
-            M2_weight = np.exp(-np.nanmean(dis[row, sel_ind[R_ind]]) / self.R)
+            M2_weight = np.exp(
+                -np.nanmean(dis[row, sel_ind[R_ind]], dtype=np.float64) / self.R
+            )
         else:
             R_ind_not = []
 
@@ -182,6 +206,7 @@ class Kriging:
         dis: np.ndarray,
         row: int,
         dis_sel_ind: np.ndarray,
+        mesh_point: Optional[Tuple[float, float]] = None,
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
 
@@ -198,6 +223,10 @@ class Kriging:
             Row index of ``dis_kmax_ind`` being considered
         dis_sel_ind : np.ndarray
             Indices of ``dis`` within the search radius
+        mesh_point : tuple of float or None
+            The (x, y) coordinates of the mesh point. If provided, the
+            distances between the mesh point and the selected data are
+            computed in float64, rather than obtained from ``dis``.
 
         Returns
         -------
@@ -207,8 +236,16 @@ class Kriging:
             2D array representing the matrix in Kriging
         """
 
+        # the system is always assembled in float64
+        if mesh_point is None:
+            dis_sel = dis[row, dis_sel_ind]
+        else:
+            x0_diff = mesh_point[0] - x_data[dis_sel_ind]
+            y0_diff = mesh_point[1] - y_data[dis_sel_ind]
+            dis_sel = np.sqrt(x0_diff * x0_diff + y0_diff * y0_diff)
+
         # calculate semi-variogram value
-        M20 = self.s_v_model(dis[row, dis_sel_ind], **self.s_v_params)
+        M20 = self.s_v_model(dis_sel, **self.s_v_params)
 
         # TODO: Should we put in statements for Objective mapping and Universal Kriging w/ Linear drift?  # noqa
         M2 = np.concatenate([M20, np.array([1.0])])  # for Ordinary Kriging
@@ -330,6 +367,7 @@ class Kriging:
 
         return field_var, field_samplevar, field_mean
 
+    @profile_method
     def run_kriging(
         self,
         x_mesh: np.ndarray,
@@ -368,12 +406,24 @@ class Kriging:
         Notes
         -----
         Currently, this routine only runs Ordinary Kriging.
+
+        The time taken to search for the data points near each mesh point,
+        to assemble the Kriging system of each mesh point, and to solve each
+        system are recorded as the sections ``"search"``, ``"assembly"``,
+        and ``"solve"`` by the profiler of ``self.survey``.
         """
 
+        search_start = time.perf_counter()
+
         dis, dis_kmax_ind = self._compute_k_smallest_distances(
             x_mesh, x_data, y_mesh, y_data
         )
 
+        # total time taken by each step of the loop below
+        search_time = time.perf_counter() - search_start
+        assembly_time = 0.0
+        solve_time = 0.0
+
         # initialize arrays that store calculated Kriging values
         field_var_arr = np.empty(dis_kmax_ind.shape[0])
         field_samplevar_arr = np.empty(dis_kmax_ind.shape[0])
@@ -383,6 +433,8 @@ class Kriging:
         # does Ordinary Kriging, follow Journel and Huijbregts, p. 307
         for row in range(dis_kmax_ind.shape[0]):
 
+            step_start = time.perf_counter()
+
             R_ind, R_ind_not, sel_ind, M2_weight = self._get_indices_and_weight(
                 dis_kmax_ind, row, dis
             )
@@ -390,7 +442,22 @@ class Kriging:
             # indices of dis within the search radius
             dis_sel_ind = sel_ind[R_ind]
 
-            M2, K = self._get_M2_K(x_data, y_data, dis, row, dis_sel_ind)
+            step_end = time.perf_counter()
+            search_time += step_end - step_start
+            step_start = step_end
+
+            M2, K = self._get_M2_K(
+                x_data,
+                y_data,
+                dis,
+                row,
+                dis_sel_ind,
+                None if dis.dtype == np.float64 else (x_mesh[row], y_mesh[row]),
+            )
+
+            step_end = time.perf_counter()
+            assembly_time += step_end - step_start
+            step_start = step_end
 
             lamb = self._compute_lambda_weights(M2, K)
 
@@ -398,6 +465,8 @@ class Kriging:
                 field_data, M2, lamb, M2_weight, R_ind, R_ind_not, dis_sel_ind
             )
 
+            solve_time += time.perf_counter() - step_start
+
             # store important calculated values
             field_var_arr[row] = field_var
             field_samplevar_arr[row] = field_samplevar
@@ -409,14 +478,27 @@ class Kriging:
         ).flatten()
         field_mean_arr[neg_nan_ind] = 0.0
 
+        # record the steps consecutively, since they are interleaved
+        profiler = get_profiler(self.survey)
+        num_rows = dis_kmax_ind.shape[0]
+        profiler.add_record("search", search_time, num_rows, search_start)
+        profiler.add_record(
+            "assembly", assembly_time, num_rows, search_start + search_time
+        )
+        profiler.add_record(
+            "solve", solve_time, num_rows, search_start + search_time + assembly_time
+        )
+
         return field_var_arr, field_samplevar_arr, field_mean_arr
 
+    @profile_method
     def run_biomass_kriging(self, krig_mesh: KrigingMesh) -> None:
         """
         A high-level interface that sets up and runs
         Kriging using the areal biomass density.
         The results are then stored in the ``Survey``
-        object as ``kriging_results_gdf``.
+        object as ``kriging_results_ds``, from which
+        ``kriging_results_gdf`` is constructed.
 
         Parameters
         ----------
@@ -451,53 +533,94 @@ class Kriging:
             ].values.flatten(),
         )
 
-        # add corresponding mesh variables
-        results_gdf = krig_mesh.mesh_gdf.copy(deep=True)
-
-        # add the stratum number to the results
-        results_gdf["stratum_num"] = pd.cut(
-            results_gdf["centroid_latitude"],
+        # add the stratum number of each cell to the mesh variables
+        mesh_df = krig_mesh.mesh_df
+        stratum_num = pd.cut(
+            mesh_df["centroid_latitude"],
             bins=[0.0]
             + list(self.survey.geo_strata_df["Latitude (upper limit)"])
             + [90.0],
             labels=list(self.survey.geo_strata_df["stratum_num"]) + [1],
             ordered=False,
-        )
+        ).array
 
-        # add adult biomass density Kriging results
-        results_gdf["biomass_density_adult_mean"] = field_mean_arr
-        results_gdf["biomass_density_adult_var"] = field_var_arr
-        results_gdf["biomass_density_adult_samplevar"] = field_samplevar_arr
+        # the results are stored in a single Dataset, where the Kriging results
+        # GeoDataFrame of each sex is only constructed when it is accessed
+        ds = init_kriging_results_ds(mesh_df, stratum_num)
 
-        # add area and adult biomass results
-        results_gdf["cell_area_nmi2"] = (
-            self.survey.params["kriging_A0"] * results_gdf["fraction_cell_in_polygon"]
+        # add adult biomass density Kriging results
+        ds["biomass_density_adult_mean"] = ("cell", field_mean_arr)
+        ds["biomass_density_adult_var"] = ("cell", field_var_arr)
+        ds["biomass_density_adult_samplevar"] = ("cell", field_samplevar_arr)
+
+        # add area and adult biomass results, where the biomass
+        # of males and females is computed by ``compute_kriging_variables``
+        cell_area_nmi2 = (
+            self.survey.params["kriging_A0"]
+            * mesh_df["fraction_cell_in_polygon"].to_numpy()
         )
-        results_gdf["biomass_adult"] = (
-            results_gdf["biomass_density_adult_mean"] * results_gdf["cell_area_nmi2"]
+        biomass_adult = np.full((ds.sizes["cell"], ds.sizes["sex"]), np.nan)
+        biomass_adult[:, 0] = field_mean_arr * cell_area_nmi2
+
+        ds["cell_area_nmi2"] = ("cell", cell_area_nmi2)
+        ds["biomass_adult"] = (("cell", "sex"), biomass_adult)
+
+        add_kriging_results_columns(
+            ds,
+            [
+                "biomass_density_adult_mean",
+                "biomass_density_adult_var",
+                "biomass_density_adult_samplevar",
+                "cell_area_nmi2",
+                "biomass_adult",
+            ],
+            sexes=["all"],
         )
 
-        self.survey.bio_calc.kriging_results_gdf = results_gdf
-
-        # initialize male and female GeoDataFrames
-        # TODO: do we want to include other columns here?
-        self.survey.bio_calc.kriging_results_male_gdf = results_gdf[
-            ["centroid_latitude", "centroid_longitude", "geometry", "stratum_num"]
-        ].copy(deep=True)
-        self.survey.bio_calc.kriging_results_female_gdf = results_gdf[
-            ["centroid_latitude", "centroid_longitude", "geometry", "stratum_num"]
-        ].copy(deep=True)
+        # results previously stored are replaced
+        self.survey.bio_calc.kriging_results_ds = ds
 
-    def compute_kriging_variables(self) -> None:
+    @profile_method
+    def compute_kriging_variables(
+        self,
+        results_path: Optional[Union[str, Path]] = None,
+        results_chunks: Optional[Dict[str, int]] = None,
+    ) -> None:
         """
         Computes useful variables corresponding to values at each
-        Kriging mesh point and assigns them to the GeoDataFrame
-        ``self.survey.bio_calc.kriging_results_gdf``. For example,
+        Kriging mesh point and assigns them to the Dataset
+        ``self.survey.bio_calc.kriging_results_ds``. For example,
         computes the ``abundance`` at each Kriging mesh point.
+
+        Parameters
+        ----------
+        results_path : str or Path or None
+            If provided, the path where the Kriging results are written
+            as a Dataset, with the precision of the survey, see
+            ``save_kriging_results``. The results are then
+            opened lazily as ``self.survey.bio_calc.kriging_results_ds``, such
+            that the results are removed from memory and only read when the
+            Kriging results GeoDataFrames are accessed.
+        results_chunks : dict or None
+            The chunk size of each dimension of ``kriging_results_ds``,
+            which requires the package ``dask``. Only used if
+            ``results_path`` is provided.
         """
 
         # initialize class object
         self.krig_bio_calc = ComputeKrigingVariables(self)
 
-        # calculate and assign variables to Kriging results GeoDataFrames
+        # calculate and assign variables to the Kriging results
         self.krig_bio_calc.set_variables()
+
+        if results_path is not None:
+            save_kriging_results(
+                self.survey.bio_calc.kriging_results_ds,
+                results_path,
+                precision=self.survey.params["precision"],
+            )
+
+            # replace the in-memory results with those opened lazily
+            self.survey.bio_calc.kriging_results_ds = open_kriging_results(
+                results_path, chunks=results_chunks
+            )
@@ -0,0 +1,338 @@
+"""
+Stores the Kriging results in a single Dataset, which can be written to
+disk and opened lazily, and constructs the Kriging results GeoDataFrame
+of each sex from it when that GeoDataFrame is needed.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+from ..utils.precision import get_precision_dtype
+from .biomass_age import RESULTS_SEXES, add_biomass_age_columns
+
+# the columns of each results GeoDataFrame that are coordinates of each cell
+CELL_COORDINATES = ["centroid_latitude", "centroid_longitude"]
+
+# the prefix of the columns containing the biomass of each age bin
+AGE_BIN_PREFIX = "biomass_age_bin_"
+
+
+def _set_stratum_num(ds: xr.Dataset, stratum_num: pd.Categorical) -> None:
+    """
+    Stores the stratum number of each cell and its categories in ``ds``.
+    """
+
+    values = np.asarray(stratum_num, dtype=float)
+    if not np.isnan(values).any():
+        values = values.astype(np.int64)
+
+    ds["stratum_num"] = ("cell", values)
+    ds["stratum_num"].attrs["categories"] = np.asarray(
+        stratum_num.categories, dtype=np.int64
+    )
+
+
+def init_kriging_results_ds(
+    mesh_df: pd.DataFrame, stratum_num: pd.Categorical
+) -> xr.Dataset:
+    """
+    Initializes the Kriging results Dataset with the variables of the mesh.
+
+    Parameters
+    ----------
+    mesh_df : pd.DataFrame
+        The mesh, whose geometry, if any, is not stored
+    stratum_num : pd.Categorical
+        The stratum number of each cell of the mesh
+
+    Returns
+    -------
+    ds : xr.Dataset
+        A Dataset with the layout of ``get_kriging_results_ds``, where the
+        GeoDataFrame of each sex contains the coordinates, geometry, and
+        stratum number of each cell, and the GeoDataFrame of the sex
+        ``"all"`` additionally contains the other mesh variables
+    """
+
+    ds = xr.Dataset(
+        coords={"cell": mesh_df.index.to_numpy(), "sex": list(RESULTS_SEXES.keys())}
+    )
+
+    mesh_columns = [col for col in mesh_df.columns if col != "geometry"]
+    for col in mesh_columns:
+        if col in CELL_COORDINATES:
+            ds.coords[col] = ("cell", mesh_df[col].to_numpy(dtype=np.float64))
+        else:
+            ds[col] = ("cell", mesh_df[col].to_numpy())
+
+    _set_stratum_num(ds, stratum_num)
+
+    ds.attrs["columns_all"] = ",".join(mesh_columns + ["geometry", "stratum_num"])
+    for sex in ["male", "female"]:
+        ds.attrs[f"columns_{sex}"] = ",".join(
+            CELL_COORDINATES + ["geometry", "stratum_num"]
+        )
+
+    return ds
+
+
+def add_kriging_results_columns(
+    ds: xr.Dataset, columns: List[str], sexes: Iterable[str] = RESULTS_SEXES
+) -> None:
+    """
+    Appends variables of ``ds`` to the columns of the Kriging
+    results GeoDataFrame of each sex in ``sexes``.
+
+    Parameters
+    ----------
+    ds : xr.Dataset
+        The Kriging results
+    columns : list of str
+        The names of the variables, which are defined over ``cell``
+        or ``(cell, sex)``
+    sexes : iterable of str
+        The sexes whose GeoDataFrames contain the variables
+    """
+
+    for sex in sexes:
+        ds.attrs[f"columns_{sex}"] = ",".join(
+            ds.attrs[f"columns_{sex}"].split(",") + columns
+        )
+
+
+def get_kriging_results_ds(bio_calc) -> xr.Dataset:
+    """
+    Collects the Kriging results GeoDataFrames into a Dataset.
+
+    Parameters
+    ----------
+    bio_calc : ComputeTransectVariables
+        An object with computed Kriging results and Kriging variables
+
+    Returns
+    -------
+    ds : xr.Dataset
+        A Dataset with the dimensions ``cell``, ``sex``, and ``age_bin``, where
+        the biomass of each age bin is stored as ``biomass_age`` over
+        ``(cell, sex, age_bin)``, the variables of all sexes e.g. ``biomass_adult``
+        are stored over ``(cell, sex)``, and all other variables are stored
+        over ``cell``. The column order of each GeoDataFrame is stored in the
+        attributes, so that ``get_kriging_results_gdfs`` can reconstruct them.
+    """
+
+    gdfs = {
+        sex: getattr(bio_calc, f"kriging_results{suffix}_gdf")
+        for sex, suffix in RESULTS_SEXES.items()
+    }
+    results_gdf = gdfs["all"]
+
+    age_columns = [col for col in results_gdf.columns if col.startswith(AGE_BIN_PREFIX)]
+    age_bins = [int(col[len(AGE_BIN_PREFIX) :]) for col in age_columns]
+
+    # the columns, other than the age bins, that are shared by all sexes
+    excluded_columns = set(CELL_COORDINATES + ["geometry", "stratum_num"] + age_columns)
+    sex_columns = [
+        col
+        for col in results_gdf.columns
+        if (col not in excluded_columns)
+        and all(col in gdf.columns for gdf in gdfs.values())
+    ]
+    cell_columns = [
+        col
+        for col in results_gdf.columns
+        if col not in excluded_columns.union(sex_columns)
+    ]
+
+    ds = xr.Dataset(
+        coords={
+            "cell": results_gdf.index.to_numpy(),
+            "sex": list(RESULTS_SEXES.keys()),
+            "age_bin": age_bins,
+        }
+    )
+
+    for col in CELL_COORDINATES:
+        ds.coords[col] = ("cell", results_gdf[col].to_numpy(dtype=np.float64))
+
+    for col in cell_columns:
+        ds[col] = ("cell", results_gdf[col].to_numpy(dtype=np.float64))
+
+    _set_stratum_num(ds, results_gdf["stratum_num"].array)
+
+    for col in sex_columns:
+        ds[col] = (
+            ("cell", "sex"),
+            np.stack(
+                [gdf[col].to_numpy(dtype=np.float64) for gdf in gdfs.values()], axis=1
+            ),
+        )
+
+    ds["biomass_age"] = (
+        ("cell", "sex", "age_bin"),
+        np.stack(
+            [gdf[age_columns].to_numpy(dtype=np.float64) for gdf in gdfs.values()],
+            axis=1,
+        ),
+    )
+
+    # NetCDF attributes cannot contain lists of strings
+    for sex, gdf in gdfs.items():
+        ds.attrs[f"columns_{sex}"] = ",".join(gdf.columns)
+
+    return ds
+
+
+def get_kriging_results_gdf(ds: xr.Dataset, sex: str) -> gpd.GeoDataFrame:
+    """
+    Constructs the Kriging results GeoDataFrame of a sex from a Dataset
+    with the layout of ``get_kriging_results_ds``.
+
+    Parameters
+    ----------
+    ds : xr.Dataset
+        The Kriging results, which may be opened lazily
+    sex : str
+        A sex in ``RESULTS_SEXES``
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        The Kriging results of ``sex``, where only the variables in
+        its columns are read from ``ds``
+    """
+
+    column_names = ds.attrs[f"columns_{sex}"].split(",")
+
+    columns = {}
+    for col in column_names:
+        if col == "geometry":
+            columns[col] = gpd.points_from_xy(
+                ds["centroid_longitude"].to_numpy(), ds["centroid_latitude"].to_numpy()
+            )
+        elif col == "stratum_num":
+            columns[col] = pd.Categorical(
+                ds["stratum_num"].to_numpy(),
+                categories=ds["stratum_num"].attrs["categories"],
+            )
+        elif col.startswith(AGE_BIN_PREFIX):
+            # the age bins are added as a single block below
+            continue
+        elif "sex" in ds[col].dims:
+            columns[col] = ds[col].sel(sex=sex).to_numpy()
+        else:
+            columns[col] = ds[col].to_numpy()
+
+    gdf = gpd.GeoDataFrame(columns, index=pd.Index(ds["cell"].to_numpy()))
+
+    age_columns = [col for col in column_names if col.startswith(AGE_BIN_PREFIX)]
+    if age_columns:
+        gdf = add_biomass_age_columns(gdf, ds["biomass_age"], sex)
+
+    if list(gdf.columns) != column_names:
+        gdf = gdf[column_names]
+
+    return gdf
+
+
+def get_kriging_results_gdfs(ds: xr.Dataset) -> Dict[str, gpd.GeoDataFrame]:
+    """
+    Constructs the Kriging results GeoDataFrames of all sexes from a
+    Dataset with the layout of ``get_kriging_results_ds``.
+
+    Parameters
+    ----------
+    ds : xr.Dataset
+        The Kriging results, which may be opened lazily
+
+    Returns
+    -------
+    gdfs : dict
+        The Kriging results GeoDataFrame of each sex, keyed by the name of
+        the corresponding ``ComputeTransectVariables`` variable e.g.
+        ``kriging_results_male_gdf``
+    """
+
+    return {
+        f"kriging_results{suffix}_gdf": get_kriging_results_gdf(ds, sex)
+        for sex, suffix in RESULTS_SEXES.items()
+    }
+
+
+def save_kriging_results(
+    ds: xr.Dataset, file_path: Union[str, Path], precision: str = "float64"
+) -> None:
+    """
+    Writes Kriging results constructed by ``get_kriging_results_ds``.
+
+    Parameters
+    ----------
+    ds : xr.Dataset
+        The Kriging results
+    file_path : str or Path
+        The path of the results, which are written to a Zarr store
+        if the path ends with ``.zarr`` and to a NetCDF file otherwise.
+        Zarr stores require the package ``zarr``.
+    precision : str
+        The precision of the stored floating point variables, either
+        ``"float64"`` or ``"float32"``. The coordinates, which
+        determine the geometry of each cell, are stored in float64.
+    """
+
+    dtype = get_precision_dtype(precision)
+    encoding = {
+        name: {"dtype": dtype}
+        for name, var in ds.data_vars.items()
+        if np.issubdtype(var.dtype, np.floating)
+    }
+
+    file_path = Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if file_path.suffix == ".zarr":
+        ds.to_zarr(file_path, mode="w", encoding=encoding)
+    else:
+        ds.to_netcdf(file_path, encoding=encoding)
+
+
+def open_kriging_results(
+    file_path: Union[str, Path], chunks: Optional[Dict[str, int]] = None
+) -> xr.Dataset:
+    """
+    Opens Kriging results written by ``save_kriging_results``,
+    where the variables are only read when they are accessed.
+
+    Parameters
+    ----------
+    file_path : str or Path
+        The path of the results
+    chunks : dict or None
+        The chunk size of each dimension e.g. ``{"cell": 100000}``,
+        which requires the package ``dask``. If None, the
+        results are not chunked.
+
+    Returns
+    -------
+    xr.Dataset
+        The Kriging results
+    """
+
+    file_path = Path(file_path)
+
+    if file_path.suffix == ".zarr":
+        ds = xr.open_zarr(file_path, chunks=chunks)
+    else:
+        ds = xr.open_dataset(file_path, chunks=chunks)
+
+    # NetCDF files may store integer coordinates with fewer bits
+    return ds.assign_coords(
+        {
+            name: coord.values.astype(np.int64)
+            for name, coord in ds.coords.items()
+            if np.issubdtype(coord.dtype, np.integer)
+        }
+    )
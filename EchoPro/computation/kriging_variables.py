@@ -1,8 +1,9 @@
-import geopandas as gpd
 import numpy as np
-import pandas as pd
 import xarray as xr
 
+from .biomass_age import RESULTS_SEXES, compute_biomass_age
+from .kriging_results import AGE_BIN_PREFIX, add_kriging_results_columns
+
 
 class ComputeKrigingVariables:
     # TODO: this class may not correctly account for bootstrapping!
@@ -21,11 +22,35 @@ class ComputeKrigingVariables:
 
         self.krig = krig
 
+        # the survey codes of the stratum of each mesh point
+        self.stratum_codes = None
+
+        # the Kriging results that the variables are added to
+        self.results_ds = None
+
+    def _expand_to_mesh(self, vals) -> np.ndarray:
+        """
+        Expands values defined for each stratum so that they
+        correspond to each cell of ``kriging_results_ds``.
+
+        Parameters
+        ----------
+        vals: pd.Series or pd.DataFrame
+            Values indexed by stratum
+
+        Returns
+        -------
+        np.ndarray
+            The values of ``vals`` at the stratum of each mesh point
+        """
+
+        return self.krig.survey.survey_index.strata.expand(vals, self.stratum_codes)
+
     def _set_gender_biomass(self, ds: xr.Dataset) -> None:
         """
         Calculates the biomass for males and females at
         each mesh point. Additionally, adds the corresponding
-        variables to ``kriging_results_gdf``.
+        variables to ``kriging_results_ds``.
 
         Parameters
         ----------
@@ -34,34 +59,29 @@ class ComputeKrigingVariables:
             desired variables
         """
 
-        # obtain stratum column from Kriging results
-        stratum_vals = self.krig.survey.bio_calc.kriging_results_gdf[
-            "stratum_num"
-        ].values
-
         # create variables to improve readability
-        biomass_density_adult_mean = self.krig.survey.bio_calc.kriging_results_gdf[
+        biomass_density_adult_mean = self.results_ds[
             "biomass_density_adult_mean"
-        ]
-        cell_area_nmi2 = self.krig.survey.bio_calc.kriging_results_gdf["cell_area_nmi2"]
+        ].values
+        cell_area_nmi2 = self.results_ds["cell_area_nmi2"].values
+        biomass_adult = self.results_ds["biomass_adult"].copy()
 
         # calculate the aged biomass for males and females
-        for sex in ["M", "F"]:
-            dist_weight_sum = (
+        for sex, results_sex in [("M", "male"), ("F", "female")]:
+            dist_weight_sum = self._expand_to_mesh(
                 (
                     ds[f"len_age_weight_dist_{sex}_normalized"]
                     * ds[f"len_age_weight_prop_{sex}"]
                 )
                 .sum(dim=["len_bin", "age_bin"])
-                .sel(stratum_num=stratum_vals)
-                .values
+                .to_series()
             )
 
             biomass_aged = biomass_density_adult_mean * dist_weight_sum * cell_area_nmi2
 
             # calculate the unaged biomass
-            unaged_wgt_prop_expan = (
-                ds[f"unaged_{sex}_wgt_proportion"].sel(stratum_num=stratum_vals).values
+            unaged_wgt_prop_expan = self._expand_to_mesh(
+                ds[f"unaged_{sex}_wgt_proportion"].to_series()
             )
 
             biomass_unaged = (
@@ -69,116 +89,111 @@ class ComputeKrigingVariables:
             )
 
             # calculate and assign the total biomass
-            total_biomass = biomass_aged + biomass_unaged
-            if sex == "M":
-                self.krig.survey.bio_calc.kriging_results_male_gdf[
-                    "biomass_adult"
-                ] = total_biomass
-            else:
-                self.krig.survey.bio_calc.kriging_results_female_gdf[
-                    "biomass_adult"
-                ] = total_biomass
+            biomass_adult.loc[{"sex": results_sex}] = biomass_aged + biomass_unaged
+
+        self.results_ds["biomass_adult"] = biomass_adult
+        add_kriging_results_columns(
+            self.results_ds, ["biomass_adult"], sexes=["male", "female"]
+        )
 
     def _set_abundance(self) -> None:
         """
         Calculates the abundance for males, females, and all sexes at
         each mesh point. Additionally, adds the corresponding
-        variables to ``kriging_results_gdf``.
+        variables to ``kriging_results_ds``.
         """
 
         # expand the bio parameters dataframe so that it corresponds to mesh points
-        averaged_weight_expanded = (
-            self.krig.survey.bio_calc.bio_param_df.averaged_weight.loc[
-                self.krig.survey.bio_calc.kriging_results_gdf["stratum_num"].values
-            ]
-        )
-
-        # calculate and add abundance to Kriging results
-        self.krig.survey.bio_calc.kriging_results_gdf["abundance_adult"] = (
-            self.krig.survey.bio_calc.kriging_results_gdf["biomass_adult"]
-            / averaged_weight_expanded.values
-        )
-
-        self.krig.survey.bio_calc.kriging_results_male_gdf["abundance_adult"] = (
-            self.krig.survey.bio_calc.kriging_results_male_gdf["biomass_adult"]
-            / averaged_weight_expanded.values
+        averaged_weight_expanded = self._expand_to_mesh(
+            self.krig.survey.bio_calc.bio_param_df.averaged_weight
         )
 
-        self.krig.survey.bio_calc.kriging_results_female_gdf["abundance_adult"] = (
-            self.krig.survey.bio_calc.kriging_results_female_gdf["biomass_adult"]
-            / averaged_weight_expanded.values
-        )
+        # calculate and add abundance of all sexes to Kriging results
+        self.results_ds["abundance_adult"] = self.results_ds[
+            "biomass_adult"
+        ] / xr.DataArray(averaged_weight_expanded, dims="cell")
+        add_kriging_results_columns(self.results_ds, ["abundance_adult"])
 
     def _set_biomass_cell_CV(self):
         """
         Compute the coefficient of Variation (CV) of biomass
         at each grid cell using Kriging output. Additionally,
-        assigns the created variable to ``kriging_results_gdf``.
+        assigns the created variable to ``kriging_results_ds``.
         """
 
         # create variables to improve readability
         biomass_density_adult = self.krig.survey.bio_calc.transect_results_gdf[
             "biomass_density_adult"
         ].values
-        biomass_density_adult_mean = self.krig.survey.bio_calc.kriging_results_gdf[
+        biomass_density_adult_mean = self.results_ds[
             "biomass_density_adult_mean"
-        ]
-        biomass_density_adult_var = self.krig.survey.bio_calc.kriging_results_gdf[
-            "biomass_density_adult_var"
-        ]
-        cell_area_nmi2 = self.krig.survey.bio_calc.kriging_results_gdf["cell_area_nmi2"]
+        ].values
+        biomass_density_adult_var = self.results_ds["biomass_density_adult_var"].values
+        cell_area_nmi2 = self.results_ds["cell_area_nmi2"].values
         kriging_A0 = self.krig.survey.params["kriging_A0"]
 
         C0 = np.std(biomass_density_adult, ddof=1) ** 2
         Bn = np.nansum(biomass_density_adult_mean * cell_area_nmi2) * 1e-9
-        self.krig.survey.bio_calc.kriging_results_gdf["biomass_adult_cell_CV"] = (
+        self.results_ds["biomass_adult_cell_CV"] = (
+            "cell",
             kriging_A0
             * np.sqrt(biomass_density_adult_var * C0)
             * 1e-9
             / Bn
-            * np.sqrt(len(biomass_density_adult_var))
+            * np.sqrt(len(biomass_density_adult_var)),
+        )
+        add_kriging_results_columns(
+            self.results_ds, ["biomass_adult_cell_CV"], sexes=["all"]
         )
 
-    def _compute_biomass_all_ages(
-        self,
-        weight_fraction_all_ages_df: pd.DataFrame,
-        biomass_column: pd.DataFrame,
-        results_gdf: gpd.GeoDataFrame,
-    ) -> None:
+    def _compute_biomass_all_ages(self) -> None:
         """
-        Compute the biomass for each age bin based off the provided input.
-        Additionally, add computed variables to the input ``results_gdf``.
-
-        Parameters
-        ----------
-        weight_fraction_all_ages_df: pd.DataFrame
-            A DataFrame containing the weight fraction at each age
-            bin for all strata (corresponds to ``biomass_column``)
-        biomass_column: pd.DataFrame
-            A DataFrame corresponding to a biomass column from the Kriging results
-        results_gdf: gpd.GeoDataFrame
-            A GeoDataFrame where the biomass at each age bin should be stored
+        Computes the biomass at each age bin for all sexes, which is added
+        to ``kriging_results_ds`` as ``biomass_age``. The ``biomass_age_bin_*``
+        columns of the Kriging results GeoDataFrames are only constructed
+        from it when a GeoDataFrame is accessed.
         """
 
-        # obtain stratum column from Kriging results
-        stratum_vals = results_gdf["stratum_num"].values
-
-        for bin_str in weight_fraction_all_ages_df:
-
-            # expand the weight fraction for all ages
-            expanded_age_bin = (
-                weight_fraction_all_ages_df[bin_str].loc[stratum_vals].values
-            )
+        # create variable to improve readability
+        bio_calc = self.krig.survey.bio_calc
+
+        biomass_age = compute_biomass_age(
+            self.krig.survey.survey_index.strata,
+            self.stratum_codes,
+            [
+                bio_calc.weight_fraction_all_ages_df,
+                bio_calc.weight_fraction_all_ages_male_df,
+                bio_calc.weight_fraction_all_ages_female_df,
+            ],
+            [
+                self.results_ds["biomass_adult"].sel(sex=sex).values
+                for sex in RESULTS_SEXES
+            ],
+            dim="cell",
+            precision=self.krig.survey.params["precision"],
+        )
 
-            results_gdf["biomass_" + bin_str] = expanded_age_bin * biomass_column
+        self.results_ds["biomass_age"] = biomass_age
+        add_kriging_results_columns(
+            self.results_ds,
+            [f"{AGE_BIN_PREFIX}{age_bin}" for age_bin in biomass_age["age_bin"].values],
+        )
 
     def set_variables(self) -> None:
         """
         Calculates variables over Kriging mesh points that are useful
         for analysis (e.g. abundance, NASC, CV). Additionally, assigns
-        these variables to the appropriate Kriging results GeoDataFrame.
+        these variables to the Kriging results Dataset, from which
+        the Kriging results GeoDataFrames are constructed.
         """
 
+        self.results_ds = self.krig.survey.bio_calc.kriging_results_ds
+
+        # obtain the survey codes of the stratum of each mesh point
+        self.stratum_codes = self.krig.survey.survey_index.strata.get_codes(
+            self.results_ds["stratum_num"].values
+        )
+
         # calculate and add the male and female biomass to Kriging results
         self._set_gender_biomass(self.krig.survey.bio_calc.bin_ds)
 
@@ -186,38 +201,23 @@ class ComputeKrigingVariables:
         self._set_abundance()
 
         # add sig_b values to Kriging results
-        self.krig.survey.bio_calc.kriging_results_gdf[
-            "sig_b"
-        ] = self.krig.survey.bio_calc.strata_sig_b.loc[
-            self.krig.survey.bio_calc.kriging_results_gdf["stratum_num"].values
-        ].values
+        self.results_ds["sig_b"] = (
+            "cell",
+            self._expand_to_mesh(self.krig.survey.bio_calc.strata_sig_b),
+        )
 
         # calculate and add NASC to Kriging results
-        self.krig.survey.bio_calc.kriging_results_gdf["NASC"] = (
-            self.krig.survey.bio_calc.kriging_results_gdf["abundance_adult"]
-            * self.krig.survey.bio_calc.kriging_results_gdf["sig_b"]
+        self.results_ds["NASC"] = (
+            self.results_ds["abundance_adult"].sel(sex="all", drop=True)
+            * self.results_ds["sig_b"]
         )
+        add_kriging_results_columns(self.results_ds, ["sig_b", "NASC"], sexes=["all"])
 
         # calculate and add biomass CV at each grid cell to Kriging results
         self._set_biomass_cell_CV()
 
-        # calculate and add male biomass for all ages to Kriging results
-        self._compute_biomass_all_ages(
-            self.krig.survey.bio_calc.weight_fraction_all_ages_male_df,
-            self.krig.survey.bio_calc.kriging_results_male_gdf["biomass_adult"],
-            self.krig.survey.bio_calc.kriging_results_male_gdf,
-        )
+        # calculate and add biomass for all ages and sexes to Kriging results
+        self._compute_biomass_all_ages()
 
-        # calculate and add female biomass for all ages to Kriging results
-        self._compute_biomass_all_ages(
-            self.krig.survey.bio_calc.weight_fraction_all_ages_female_df,
-            self.krig.survey.bio_calc.kriging_results_female_gdf["biomass_adult"],
-            self.krig.survey.bio_calc.kriging_results_female_gdf,
-        )
-
-        # calculate and add biomass for all ages to Kriging results
-        self._compute_biomass_all_ages(
-            self.krig.survey.bio_calc.weight_fraction_all_ages_df,
-            self.krig.survey.bio_calc.kriging_results_gdf["biomass_adult"],
-            self.krig.survey.bio_calc.kriging_results_gdf,
-        )
+        # discard the Kriging results GeoDataFrames constructed without these variables
+        self.krig.survey.bio_calc.kriging_results_ds = self.results_ds
@@ -5,6 +5,8 @@ import numpy as np
 import pandas as pd
 import xarray as xr
 
+from .numba_functions import nb_redistribute_unaged
+
 
 def _redistribute_age1_data(df: pd.DataFrame, unaged_column: bool):
     """
@@ -56,8 +58,9 @@ def _redistribute_unaged_kriged_biomass(
 
     Notes
     -----
-    This code was directly copied from the Matlab version of EchoPro with
-    only small modifications made to account for Python syntax
+    The algorithm follows the Matlab version of EchoPro, where the
+    redistribution for each length bin is computed by the compiled
+    function ``nb_redistribute_unaged``.
     """
 
     # get numpy arrays of the male and female DataFrames
@@ -65,10 +68,6 @@ def _redistribute_unaged_kriged_biomass(
     male_arr = len_age_biomass_list[0].to_numpy() * 1e-6
     female_arr = len_age_biomass_list[1].to_numpy() * 1e-6
 
-    # initialize matrices that will hold the unaged data to distribute to age bins
-    Uaged2aged_mat_M = np.zeros((male_arr.shape[0], male_arr.shape[1] - 1))
-    Uaged2aged_mat_F = np.zeros((male_arr.shape[0], male_arr.shape[1] - 1))
-
     # establish constant variables (done to match Matlab code)
     threshold = 1e-10
     eps = 2.22044604925031e-16
@@ -76,91 +75,14 @@ def _redistribute_unaged_kriged_biomass(
     # scale biomass_unaged to match Matlab code
     biomass_unaged = 1e-6 * biomass_unaged
 
-    for i in range(male_arr.shape[0]):
-
-        if (sum(male_arr[i, :-1]) < threshold) and (
-            sum(female_arr[i, :-1]) < threshold
-        ):
-            # neither male and nor female hake at ith length bin is found
-            # for aged hake (bio-sample station 2)
-            if male_arr[i, -1] < threshold:
-                # no unaged hake found at bio-sample station 1
-                Uaged2aged_mat_M[i, :] = 0.0
-                Uaged2aged_mat_F[i, :] = 0.0
-            else:
-
-                # unaged hake found at bio-sample station 1
-                sum_over_ageM = male_arr[:, :-1].sum(axis=1)
-                ind_M = np.argwhere(sum_over_ageM > eps).flatten() + 1
-                ind_sel_M = np.argmin(abs(ind_M - (i + 1))) + 1
-                ind_sel_M = ind_sel_M + min(ind_M) - 1
-
-                sum_over_ageF = female_arr[:, :-1].sum(axis=1)
-                ind_F = np.argwhere(sum_over_ageF > eps).flatten() + 1
-                ind_sel_F = np.argmin(abs(ind_F - (i + 1))) + 1
-                ind_sel_F = ind_sel_F + min(ind_F) - 1
-
-                if ind_sel_F < ind_sel_M:
-                    # closest length bin has no aged female, using the smaller
-                    # length bin aged female data
-                    while sum(female_arr[ind_sel_F - 1, :-1]) == 0:
-                        ind_sel_F = ind_sel_F - 1
-                    Uaged2aged_mat_M[i, :] = (
-                        male_arr[i, -1]
-                        * female_arr[ind_sel_F - 1, :-1]
-                        / sum(female_arr[ind_sel_F - 1, :-1])
-                    )
-                    Uaged2aged_mat_F[i, :] = (
-                        female_arr[i, -1]
-                        * female_arr[ind_sel_F - 1, :-1]
-                        / sum(female_arr[ind_sel_F - 1, :-1])
-                    )
-                else:
-                    # closest length bin has no aged male, using the smaller
-                    # length bin aged male data
-                    while sum(male_arr[ind_sel_M - 1, :-1]) == 0:
-                        ind_sel_M = ind_sel_M - 1
-                    Uaged2aged_mat_M[i, :] = (
-                        male_arr[i, -1]
-                        * male_arr[ind_sel_M - 1, :-1]
-                        / sum(male_arr[ind_sel_M - 1, :-1])
-                    )
-                    Uaged2aged_mat_F[i, :] = (
-                        female_arr[i, -1]
-                        * male_arr[ind_sel_M - 1, :-1]
-                        / sum(male_arr[ind_sel_M - 1, :-1])
-                    )
-        elif (sum(male_arr[i, :-1]) < threshold) and (male_arr[i, -1] > threshold):
-            # no male hake at ith length bin for aged hake (bio-sample station 2)
-            # but has samples for unaged hake (bio-sample station 1)
-            Uaged2aged_mat_M[i, :] = (
-                male_arr[i, -1] * female_arr[i, :-1] / sum(female_arr[i, :-1])
-            )
-            Uaged2aged_mat_F[i, :] = (
-                female_arr[i, -1] * female_arr[i, :-1] / sum(female_arr[i, :-1])
-            )
-        elif (sum(female_arr[i, :-1]) < threshold) and (female_arr[i, -1] > threshold):
-            # no female hake at ith length bin for aged hake (bio-sample station 2)
-            # but has samples for unaged hake (bio-sample station 1)
-            Uaged2aged_mat_M[i, :] = (
-                male_arr[i, -1] * male_arr[i, :-1] / sum(male_arr[i, :-1])
-            )
-            Uaged2aged_mat_F[i, :] = (
-                female_arr[i, -1] * male_arr[i, :-1] / sum(male_arr[i, :-1])
-            )
-        elif (
-            (sum(male_arr[i, :-1]) > threshold)
-            and (sum(female_arr[i, :-1]) > threshold)
-            and (biomass_unaged[i] > threshold)
-        ):
-            # both male and female hake have samples at ith length bin for aged hake
-            # (bio-sample station 2) and unaged hake (bio-sample station 1)
-            Uaged2aged_mat_M[i, :] = (
-                male_arr[i, -1] * male_arr[i, :-1] / sum(male_arr[i, :-1])
-            )
-            Uaged2aged_mat_F[i, :] = (
-                female_arr[i, -1] * female_arr[i, :-1] / sum(female_arr[i, :-1])
-            )
+    # (one-based) length bins that contain aged male and female data
+    ind_M = np.argwhere(male_arr[:, :-1].sum(axis=1) > eps).flatten() + 1
+    ind_F = np.argwhere(female_arr[:, :-1].sum(axis=1) > eps).flatten() + 1
+
+    # obtain the unaged data to distribute to the age bins for all length bins
+    Uaged2aged_mat_M, Uaged2aged_mat_F = nb_redistribute_unaged(
+        male_arr, female_arr, biomass_unaged, ind_M, ind_F, threshold
+    )
 
     # distributed the unaged data to the existing data at the age bins
     # scaling is performed to return to the original values
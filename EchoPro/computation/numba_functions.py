@@ -4,8 +4,23 @@ from typing import Tuple
 import numba as nb
 import numpy as np
 
-
-@nb.njit(nb.float64[:, :](nb.float64[:], nb.float64[:]), parallel=True)
+# the signatures of the functions below, which are compiled for both
+# float64 and float32 inputs, where the output has the dtype of the inputs
+_VEC_VEC_TO_MAT = [
+    nb.float64[:, :](nb.float64[:], nb.float64[:]),
+    nb.float32[:, :](nb.float32[:], nb.float32[:]),
+]
+_VEC_VEC_TO_VEC = [
+    nb.float64[:](nb.float64[:], nb.float64[:]),
+    nb.float32[:](nb.float32[:], nb.float32[:]),
+]
+_MAT_MAT_TO_MAT = [
+    nb.float64[:, :](nb.float64[:, :], nb.float64[:, :]),
+    nb.float32[:, :](nb.float32[:, :], nb.float32[:, :]),
+]
+
+
+@nb.njit(_VEC_VEC_TO_MAT, parallel=True)
 def nb_subtract_outer(a: nb.float64[:], b: nb.float64[:]) -> nb.float64[:, :]:
     """
     Performs an outer subtraction between the inputs
@@ -13,18 +28,18 @@ def nb_subtract_outer(a: nb.float64[:], b: nb.float64[:]) -> nb.float64[:, :]:
 
     Parameters
     ----------
-    a : nb.float64[:]
+    a : nb.float64[:] or nb.float32[:]
         The first array
-    b : nb.float64[:]
-        The second array
+    b : nb.float64[:] or nb.float32[:]
+        The second array, with the same dtype as ``a``
 
     Returns
     -------
-    res : nb.float64[:, :]
+    res : nb.float64[:, :] or nb.float32[:, :]
         An outer subtraction between ``a`` and ``b`` e.g
         ``res[i_0, ... i_M-1, j_0, ... j_M-1] = a[i] - b[j]``
     """
-    res = np.empty((a.shape[0], b.shape[0]), dtype=np.float64)
+    res = np.empty((a.shape[0], b.shape[0]), dtype=a.dtype)
     for i in nb.prange(a.shape[0]):
         for j in range(b.shape[0]):
             res[i, j] = a[i] - b[j]
@@ -32,7 +47,7 @@ def nb_subtract_outer(a: nb.float64[:], b: nb.float64[:]) -> nb.float64[:, :]:
     return res
 
 
-@nb.njit(nb.float64[:](nb.float64[:], nb.float64[:]), fastmath=True, parallel=True)
+@nb.njit(_VEC_VEC_TO_VEC, fastmath=True, parallel=True)
 def nb_dis_vec(a: nb.float64[:], b: nb.float64[:]) -> nb.float64[:]:
     """
     Calculates the distance between the elements
@@ -40,27 +55,25 @@ def nb_dis_vec(a: nb.float64[:], b: nb.float64[:]) -> nb.float64[:]:
 
     Parameters
     ----------
-    a : nb.float64[:]
+    a : nb.float64[:] or nb.float32[:]
         The first vector
-    b : nb.float64[:]
-        The second vector
+    b : nb.float64[:] or nb.float32[:]
+        The second vector, with the same dtype as ``a``
 
     Returns
     -------
-    res : nb.float64[:]
+    res : nb.float64[:] or nb.float32[:]
         A vector representing the distance
         between the elements of ``a`` and
         ``b`` e.g. ``res[i] = sqrt(a[i]^2 + b[i]^2)``
     """
-    res = np.empty(a.shape, dtype=np.float64)
+    res = np.empty(a.shape, dtype=a.dtype)
     for i in nb.prange(a.shape[0]):
         res[i] = math.sqrt(a[i] * a[i] + b[i] * b[i])
     return res
 
 
-@nb.njit(
-    nb.float64[:, :](nb.float64[:, :], nb.float64[:, :]), fastmath=True, parallel=True
-)
+@nb.njit(_MAT_MAT_TO_MAT, fastmath=True, parallel=True)
 def nb_dis_mat(a: nb.float64[:, :], b: nb.float64[:, :]) -> nb.float64[:, :]:
     """
     Calculates the distance between the elements
@@ -68,26 +81,26 @@ def nb_dis_mat(a: nb.float64[:, :], b: nb.float64[:, :]) -> nb.float64[:, :]:
 
     Parameters
     ----------
-    a : nb.float64[:, :]
+    a : nb.float64[:, :] or nb.float32[:, :]
         The first matrix
-    b : nb.float64[:, :]
-        The second matrix
+    b : nb.float64[:, :] or nb.float32[:, :]
+        The second matrix, with the same dtype as ``a``
 
     Returns
     -------
-    res : nb.float64[:, :]
+    res : nb.float64[:, :] or nb.float32[:, :]
         A matrix representing the distance between
         the elements of ``a`` and ``b`` e.g.
         ``res[i,j] = sqrt(a[i,j]^2 + b[i,j]^2)``
     """
-    res = np.empty(a.shape)
+    res = np.empty(a.shape, dtype=a.dtype)
     for i in nb.prange(a.shape[0]):
         for j in range(a.shape[1]):
             res[i, j] = math.sqrt(a[i, j] * a[i, j] + b[i, j] * b[i, j])
     return res
 
 
-@nb.njit(nb.float64[:](nb.float64[:], nb.float64[:]), fastmath=True, parallel=True)
+@nb.njit(_VEC_VEC_TO_VEC, fastmath=True, parallel=True)
 def nb_diff_sqrd(a: nb.float64[:], b: nb.float64[:]) -> nb.float64[:]:
     """
     Calculates the squared difference between
@@ -95,19 +108,19 @@ def nb_diff_sqrd(a: nb.float64[:], b: nb.float64[:]) -> nb.float64[:]:
 
     Parameters
     ----------
-    a : nb.float64[:]
+    a : nb.float64[:] or nb.float32[:]
         The first vector
-    b : nb.float64[:]
-        The second vector
+    b : nb.float64[:] or nb.float32[:]
+        The second vector, with the same dtype as ``a``
 
     Returns
     -------
-    res : nb.float64[:]
+    res : nb.float64[:] or nb.float32[:]
         A vector representing the squared
         difference between ``a`` and ``b``
         e.g. ``res[i] = (a[i] - b[i])^2``
     """
-    res = np.empty(a.shape, dtype=np.float64)
+    res = np.empty(a.shape, dtype=a.dtype)
     for i in nb.prange(a.shape[0]):
         res[i] = (a[i] - b[i]) ** 2
     return res
@@ -304,3 +317,178 @@ def compute_jolly_hampton(
         )
 
     return np.nanmean(cv_jh_vals)
+
+
+##############################################
+# The below functions are for length-age     #
+# variables                                  #
+##############################################
+
+
+@nb.njit
+def _nb_aged_sums_and_prev(
+    arr: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the sum over the aged bins of each length bin and, for
+    each length bin, the closest length bin at or below it with a
+    non-zero sum.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        2D array with rows corresponding to length bins and columns
+        corresponding to age bins, where the last column is unaged data
+
+    Returns
+    -------
+    aged_sum : np.ndarray
+        1D array of the sum over the aged bins of each length bin
+    prev_non_empty : np.ndarray
+        1D array of the closest length bin at or below each length
+        bin with a non-zero ``aged_sum`` (-1 if no such bin exists)
+    """
+
+    aged_sum = np.zeros(arr.shape[0], dtype=np.float64)
+    prev_non_empty = np.empty(arr.shape[0], dtype=np.int64)
+
+    last = -1
+    for i in range(arr.shape[0]):
+
+        # sum sequentially to match Python's builtin sum
+        for j in range(arr.shape[1] - 1):
+            aged_sum[i] += arr[i, j]
+
+        if aged_sum[i] != 0.0:
+            last = i
+        prev_non_empty[i] = last
+
+    return aged_sum, prev_non_empty
+
+
+@nb.njit
+def _nb_closest_ind(ind: np.ndarray, val: int) -> int:
+    """
+    Obtains the position of the first element of
+    ``ind`` that is closest to ``val``.
+    """
+
+    closest = 0
+    for k in range(1, ind.shape[0]):
+        if abs(ind[k] - val) < abs(ind[closest] - val):
+            closest = k
+
+    return closest
+
+
+@nb.njit(error_model="numpy")
+def nb_redistribute_unaged(
+    male_arr: np.ndarray,
+    female_arr: np.ndarray,
+    biomass_unaged: np.ndarray,
+    ind_M: np.ndarray,
+    ind_F: np.ndarray,
+    threshold: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the unaged data that should be distributed to
+    the age bins of each length bin, for males and females.
+
+    Parameters
+    ----------
+    male_arr : np.ndarray
+        2D array of the male data with rows corresponding to length bins
+        and columns corresponding to age bins, where the last column is
+        unaged data
+    female_arr : np.ndarray
+        2D array of the female data with the same form as ``male_arr``
+    biomass_unaged : np.ndarray
+        1D array of the unaged data for all genders at each length bin
+    ind_M : np.ndarray
+        1D array of the (one-based) length bins with aged male data
+    ind_F : np.ndarray
+        1D array of the (one-based) length bins with aged female data
+    threshold : float
+        The value below which data is considered to be absent
+
+    Returns
+    -------
+    Uaged2aged_mat_M : np.ndarray
+        2D array of the male unaged data to distribute to each age bin
+    Uaged2aged_mat_F : np.ndarray
+        2D array of the female unaged data to distribute to each age bin
+
+    Notes
+    -----
+    This reproduces the algorithm of the Matlab version of EchoPro,
+    with the nearest non-empty aged length bins precomputed once.
+    """
+
+    num_age = male_arr.shape[1] - 1
+
+    Uaged2aged_mat_M = np.zeros((male_arr.shape[0], num_age), dtype=np.float64)
+    Uaged2aged_mat_F = np.zeros((male_arr.shape[0], num_age), dtype=np.float64)
+
+    sum_M, prev_M = _nb_aged_sums_and_prev(male_arr)
+    sum_F, prev_F = _nb_aged_sums_and_prev(female_arr)
+
+    for i in range(male_arr.shape[0]):
+
+        unaged_M = male_arr[i, num_age]
+        unaged_F = female_arr[i, num_age]
+
+        if (sum_M[i] < threshold) and (sum_F[i] < threshold):
+            # neither male and nor female hake at ith length bin is found
+            # for aged hake (bio-sample station 2)
+            if unaged_M < threshold:
+                # no unaged hake found at bio-sample station 1
+                continue
+
+            # unaged hake found at bio-sample station 1, select the
+            # (one-based) length bins with aged data, as done in Matlab
+            ind_sel_M = _nb_closest_ind(ind_M, i + 1) + ind_M.min()
+            ind_sel_F = _nb_closest_ind(ind_F, i + 1) + ind_F.min()
+
+            if ind_sel_F < ind_sel_M:
+                # closest length bin has no aged female, using the smaller
+                # length bin aged female data
+                ref_arr = female_arr
+                ref_ind = prev_F[ind_sel_F - 1]
+                ref_sum = sum_F[ref_ind]
+            else:
+                # closest length bin has no aged male, using the smaller
+                # length bin aged male data
+                ref_arr = male_arr
+                ref_ind = prev_M[ind_sel_M - 1]
+                ref_sum = sum_M[ref_ind]
+
+            for j in range(num_age):
+                Uaged2aged_mat_M[i, j] = unaged_M * ref_arr[ref_ind, j] / ref_sum
+                Uaged2aged_mat_F[i, j] = unaged_F * ref_arr[ref_ind, j] / ref_sum
+
+        elif (sum_M[i] < threshold) and (unaged_M > threshold):
+            # no male hake at ith length bin for aged hake (bio-sample station 2)
+            # but has samples for unaged hake (bio-sample station 1)
+            for j in range(num_age):
+                Uaged2aged_mat_M[i, j] = unaged_M * female_arr[i, j] / sum_F[i]
+                Uaged2aged_mat_F[i, j] = unaged_F * female_arr[i, j] / sum_F[i]
+
+        elif (sum_F[i] < threshold) and (unaged_F > threshold):
+            # no female hake at ith length bin for aged hake (bio-sample station 2)
+            # but has samples for unaged hake (bio-sample station 1)
+            for j in range(num_age):
+                Uaged2aged_mat_M[i, j] = unaged_M * male_arr[i, j] / sum_M[i]
+                Uaged2aged_mat_F[i, j] = unaged_F * male_arr[i, j] / sum_M[i]
+
+        elif (
+            (sum_M[i] > threshold)
+            and (sum_F[i] > threshold)
+            and (biomass_unaged[i] > threshold)
+        ):
+            # both male and female hake have samples at ith length bin for aged hake
+            # (bio-sample station 2) and unaged hake (bio-sample station 1)
+            for j in range(num_age):
+                Uaged2aged_mat_M[i, j] = unaged_M * male_arr[i, j] / sum_M[i]
+                Uaged2aged_mat_F[i, j] = unaged_F * female_arr[i, j] / sum_F[i]
+
+    return Uaged2aged_mat_M, Uaged2aged_mat_F
@@ -8,6 +8,7 @@ import numpy as np
 from scipy import special
 from scipy.optimize import curve_fit
 
+from ..utils.precision import get_precision_dtype
 from .numba_functions import nb_diff_sqrd, nb_dis_vec, nb_subtract_outer
 
 # default bounds for fitting the semi-variogram model
@@ -49,6 +50,10 @@ class SemiVariogram:
         The spacing between lag centers
     nlag : int
         The total number of lag centers
+    precision : str
+        The precision of the distances and squared field differences
+        between all pairs of points, either ``"float64"`` or ``"float32"``.
+        The semi-variogram values are always accumulated in float64.
 
     Notes
     -----
@@ -60,7 +65,13 @@ class SemiVariogram:
     """
 
     def __init__(
-        self, x: np.ndarray, y: np.ndarray, field: np.ndarray, lag_res: float, nlag: int
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        field: np.ndarray,
+        lag_res: float,
+        nlag: int,
+        precision: str = "float64",
     ):
 
         # input data
@@ -70,6 +81,9 @@ class SemiVariogram:
         self.nlag = nlag
         self.lag_res = lag_res
 
+        # the dtype of the differences between all pairs of points
+        self.dtype = get_precision_dtype(precision)
+
         # bins provided to calculate_semi_variogram
         self._center_bins = lag_res * np.arange(nlag)
 
@@ -123,14 +137,18 @@ class SemiVariogram:
         i_up_ind, j_up_ind = np.triu_indices(len(self.x), k=1)
 
         # get the upper triangular mesh of differences for x/y
-        x_diff = nb_subtract_outer(self.x, self.x)[i_up_ind, j_up_ind]
-        y_diff = nb_subtract_outer(self.y, self.y)[i_up_ind, j_up_ind]
+        x = self.x.astype(self.dtype, copy=False)
+        y = self.y.astype(self.dtype, copy=False)
+        x_diff = nb_subtract_outer(x, x)[i_up_ind, j_up_ind]
+        y_diff = nb_subtract_outer(y, y)[i_up_ind, j_up_ind]
 
         # find the distance between points
         dis = nb_dis_vec(x_diff, y_diff)
 
         # construct head and tail field values
-        field_rep = np.tile(self.field, (len(self.field), 1))
+        field_rep = np.tile(
+            self.field.astype(self.dtype, copy=False), (len(self.field), 1)
+        )
         field_head = field_rep[j_up_ind, i_up_ind]
         field_tail = field_rep[i_up_ind, j_up_ind]
 
@@ -155,12 +173,12 @@ class SemiVariogram:
             )
 
             # calculate the semi-variogram value
-            gamma = 0.5 * np.mean(field_diff_sqrd[ind_in_lag])
+            gamma = 0.5 * np.mean(field_diff_sqrd[ind_in_lag], dtype=np.float64)
 
             # normalize gamma by the standard deviation of the head
             # multiplied by the standard deviation of the tail
-            std_head = np.std(field_head[ind_in_lag])
-            std_tail = np.std(field_tail[ind_in_lag])
+            std_head = np.std(field_head[ind_in_lag], dtype=np.float64)
+            std_tail = np.std(field_tail[ind_in_lag], dtype=np.float64)
             self.gamma_normalized[i] = gamma / (std_head * std_tail)
 
     def _create_widgets(self):
@@ -0,0 +1,156 @@
+"""
+Stores the results of ``ComputeTransectVariables`` on disk, so that
+repeated computations with the same inputs can be loaded instead.
+"""
+
+import os
+import pickle
+import shutil
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Union
+
+import numpy as np
+import xarray as xr
+
+from ..utils.hashing import get_hash
+from .transect_results import ComputeTransectVariables
+
+# survey variables that the transect results are computed from
+SURVEY_INPUT_VARIABLES = [
+    "length_df",
+    "specimen_df",
+    "strata_df",
+    "geo_strata_df",
+    "strata_sig_b",
+    "nasc_df",
+    "catch_df",
+    "haul_to_transect_mapping_df",
+]
+
+
+def get_transect_cache_path(
+    survey, selected_transects: Optional[List], cache_dir: Union[str, Path]
+) -> Path:
+    """
+    Obtains the path of the cached transect results corresponding
+    to the loaded survey data, survey parameters, and selected
+    transects.
+
+    Parameters
+    ----------
+    survey : Survey
+        A Survey object with loaded data
+    selected_transects : list or None
+        The subset of transects used in the calculations
+    cache_dir : str or Path
+        The directory that contains all cached transect results
+
+    Returns
+    -------
+    Path
+        The path of the cached transect results, which
+        does not exist if the results have not been cached
+    """
+
+    from .. import __version__
+
+    key = get_hash(
+        __version__,
+        survey.params,
+        [getattr(survey, name) for name in SURVEY_INPUT_VARIABLES],
+        selected_transects,
+    )
+
+    return Path(cache_dir) / f"transect_results_{key}"
+
+
+def save_transect_results(bio_calc: ComputeTransectVariables, cache_path: Path) -> None:
+    """
+    Writes the transect results to ``cache_path``. The Dataset
+    ``bio_calc.bin_ds`` is written to a NetCDF file and all other
+    variables of ``bio_calc`` are pickled.
+
+    Parameters
+    ----------
+    bio_calc : ComputeTransectVariables
+        The object containing the transect results
+    cache_path : Path
+        The path where the results should be written
+
+    Notes
+    -----
+    The results are first written to a temporary directory, which is
+    then renamed to ``cache_path``, so that other processes never load
+    partially written results.
+    """
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = Path(tempfile.mkdtemp(dir=cache_path.parent, prefix=".tmp_"))
+
+    try:
+        variables = {
+            name: val
+            for name, val in vars(bio_calc).items()
+            if name not in ["survey", "bin_ds"]
+        }
+
+        with open(tmp_path / "variables.pkl", "wb") as f:
+            pickle.dump(variables, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        bio_calc.bin_ds.to_netcdf(tmp_path / "bin_ds.nc")
+
+        os.rename(tmp_path, cache_path)
+    except OSError:
+        # the results were cached by another process
+        if not cache_path.is_dir():
+            raise
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+def load_transect_results(survey, cache_path: Path) -> ComputeTransectVariables:
+    """
+    Loads transect results written by ``save_transect_results``.
+
+    Parameters
+    ----------
+    survey : Survey
+        The Survey object the results correspond to
+    cache_path : Path
+        The path of the cached results
+
+    Returns
+    -------
+    bio_calc : ComputeTransectVariables
+        An object containing the cached transect results
+
+    Notes
+    -----
+    The cached variables are unpickled, thus only caches
+    created by trusted sources should be loaded.
+    """
+
+    bio_calc = ComputeTransectVariables(survey)
+
+    with open(cache_path / "variables.pkl", "rb") as f:
+        variables = pickle.load(f)
+
+    for name, val in variables.items():
+        setattr(bio_calc, name, val)
+
+    with xr.open_dataset(cache_path / "bin_ds.nc") as ds:
+        bin_ds = ds.load()
+
+    # NetCDF files may store integer coordinates with fewer bits
+    bin_ds = bin_ds.assign_coords(
+        {
+            name: coord.values.astype(np.int64)
+            for name, coord in bin_ds.coords.items()
+            if np.issubdtype(coord.dtype, np.integer)
+        }
+    )
+
+    bio_calc.bin_ds = bin_ds
+
+    return bio_calc
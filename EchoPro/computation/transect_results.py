@@ -3,8 +3,37 @@ from typing import List, Optional, Tuple, Union
 import geopandas as gpd
 import numpy as np
 import pandas as pd
+import xarray as xr
 
-from ..utils.binning import get_bin_ind
+from ..utils.binning import get_bin_codes, get_bin_ind
+from ..utils.profiler import profile_method
+from .biomass_age import RESULTS_SEXES, add_biomass_age_columns, compute_biomass_age
+from .kriging_results import get_kriging_results_gdf
+
+
+def _kriging_results_property(sex: str) -> property:
+    """
+    Constructs a property for the Kriging results GeoDataFrame of ``sex``,
+    which is constructed from ``kriging_results_ds`` when it is first
+    accessed, if the results are stored in a Dataset. The GeoDataFrames
+    of the other sexes are not constructed.
+    """
+
+    def getter(self) -> Optional[gpd.GeoDataFrame]:
+
+        if (self._kriging_results_gdfs.get(sex) is None) and (
+            self.kriging_results_ds is not None
+        ):
+            self._kriging_results_gdfs[sex] = get_kriging_results_gdf(
+                self.kriging_results_ds, sex
+            )
+
+        return self._kriging_results_gdfs.get(sex)
+
+    def setter(self, gdf: Optional[gpd.GeoDataFrame]) -> None:
+        self._kriging_results_gdfs[sex] = gdf
+
+    return property(getter, setter)
 
 
 class ComputeTransectVariables:
@@ -35,6 +64,7 @@ class ComputeTransectVariables:
         self.transect_results_gdf = None
         self.transect_results_male_gdf = None
         self.transect_results_female_gdf = None
+        self.kriging_results_ds = None
         self.kriging_results_gdf = None
         self.kriging_results_male_gdf = None
         self.kriging_results_female_gdf = None
@@ -65,7 +95,62 @@ class ComputeTransectVariables:
         self.strata_sig_b_df = None
         self.specimen_all_df = None
         self.bin_ds = None
+        self.mix_sa_ratio = None
+        self.nasc_stratum_codes = None
+
+    # the Kriging results of each sex, which may be constructed from the Dataset
+    kriging_results_gdf = _kriging_results_property("all")
+    kriging_results_male_gdf = _kriging_results_property("male")
+    kriging_results_female_gdf = _kriging_results_property("female")
+
+    @property
+    def kriging_results_ds(self) -> Optional[xr.Dataset]:
+        """
+        The Kriging results, stored with the layout of ``get_kriging_results_ds``.
+        """
+
+        return self._kriging_results_ds
+
+    @kriging_results_ds.setter
+    def kriging_results_ds(self, ds: Optional[xr.Dataset]) -> None:
+
+        # the GeoDataFrames constructed from the previous results are discarded
+        self._kriging_results_ds = ds
+        self._kriging_results_gdfs = dict()
+
+    @property
+    def kriging_biomass_age(self) -> Optional[xr.DataArray]:
+        """
+        The biomass of each age bin of the Kriging results over
+        ``(cell, sex, age_bin)``, if it has been computed.
+        """
+
+        if (self.kriging_results_ds is None) or (
+            "biomass_age" not in self.kriging_results_ds
+        ):
+            return None
+
+        return self.kriging_results_ds["biomass_age"]
+
+    def _expand_to_nasc(self, vals: Union[pd.Series, pd.DataFrame]) -> np.ndarray:
+        """
+        Expands values defined for each stratum so that they
+        correspond to each row of ``self.nasc_df``.
+
+        Parameters
+        ----------
+        vals: pd.Series or pd.DataFrame
+            Values indexed by stratum
+
+        Returns
+        -------
+        np.ndarray
+            The values of ``vals`` at the stratum of each NASC value
+        """
 
+        return self.survey.survey_index.strata.expand(vals, self.nasc_stratum_codes)
+
+    @profile_method
     def _get_strata_sig_b(self) -> None:
         """
         Computes the backscattering cross-section (sigma_b),
@@ -138,6 +223,7 @@ class ComputeTransectVariables:
                 self.missing_strata.append(stratum)
                 self.strata_sig_b[stratum] = np.nan
 
+    @profile_method
     def set_strata_for_missing_strata(self) -> None:
         """
         Constructs and sets the dictionary ``self.sel_tran_strata_choice``
@@ -175,6 +261,7 @@ class ComputeTransectVariables:
             # store stratum values for m_strat
             self.sel_tran_strata_choice[m_strat] = [new_stratum_l, new_stratum_g]
 
+    @profile_method
     def set_stratum_choice(self) -> None:
         """
         Constructs and set the dictionary ``self.stratum_choices``,
@@ -197,6 +284,7 @@ class ComputeTransectVariables:
             # assign stratum choices for stratum value
             self.stratum_choices[stratum] = stratum_choice
 
+    @profile_method
     def _fill_missing_strata_sig_b(self) -> None:
         """
         Fills in missing strata data for the DataFrame
@@ -230,6 +318,7 @@ class ComputeTransectVariables:
                     + self.strata_sig_b.loc[greater_than_m_strat]
                 ) / 2.0
 
+    @profile_method
     def _add_stratum_column(self) -> None:
         """
         Adds the ``stratum_num`` column to self.strata_df
@@ -242,19 +331,27 @@ class ComputeTransectVariables:
             ["haul_num", "stratum_num"]
         ].set_index("haul_num")
 
+        # create variable to improve readability
+        haul_index = self.survey.survey_index.hauls
+
         # add stratum_num column to specimen_df and set it as the index
-        self.specimen_df["stratum_num"] = strata_haul_df.loc[self.specimen_df.index]
+        self.specimen_df["stratum_num"] = haul_index.expand(
+            strata_haul_df["stratum_num"], haul_index.get_codes(self.specimen_df.index)
+        )
         self.specimen_df.set_index("stratum_num", inplace=True)
 
         if self.percentage_transects_selected is not None:
             # TODO: this is necessary to mimic the Matlab code (may be able to optimize this)
-            self.specimen_all_df["stratum_num"] = strata_haul_df.loc[
-                self.specimen_all_df.index
-            ]
+            self.specimen_all_df["stratum_num"] = haul_index.expand(
+                strata_haul_df["stratum_num"],
+                haul_index.get_codes(self.specimen_all_df.index),
+            )
             self.specimen_all_df.set_index("stratum_num", inplace=True)
 
         # add stratum_num column to length_df and set it as the index
-        self.length_df["stratum_num"] = strata_haul_df.loc[self.length_df.index]
+        self.length_df["stratum_num"] = haul_index.expand(
+            strata_haul_df["stratum_num"], haul_index.get_codes(self.length_df.index)
+        )
         self.length_df.set_index("stratum_num", inplace=True)
 
     def _generate_length_val_conversion(
@@ -561,6 +658,7 @@ class ComputeTransectVariables:
 
         return bio_param_df
 
+    @profile_method
     def _get_biomass_parameters(self) -> None:
         """
         Obtains the parameters associated with each stratum,
@@ -725,89 +823,53 @@ class ComputeTransectVariables:
         # length and weight for the first age bin
         return age_len_prop, age_wgt_prop
 
-    def _get_all_age_weight_proportions(
-        self, df: Union[pd.DataFrame, pd.Series], age_bin_ind: int
-    ) -> float:
+    def _get_all_age_weight_proportions(self, wgt_sum: np.ndarray) -> np.ndarray:
         """
-        Computes the proportion of animals in a provided age bin for
+        Computes the proportion of animals in each age bin for
         the weight of animals.
 
         Parameters
         ----------
-        df : pd.DataFrame or pd.Series
-            species_df with NaNs dropped for a particular stratum
-        age_bin_ind: int
-            The age bin index to calculate information for
+        wgt_sum: np.ndarray
+            2D array with rows corresponding to strata and columns
+            corresponding to age bins, holding the total weight of
+            the animals in each stratum and age bin
 
         Returns
         -------
-        age_wgt_prop
-            The weight proportion for a particular age
-
-        Notes
-        -----
-        The input ``df`` is often a DataFrame, however, when a subset of
-        data is selected it can become a Series.
+        age_wgt_prop: np.ndarray
+            2D array with the same shape as ``wgt_sum`` specifying
+            the weight proportion of each stratum and age bin
         """
 
-        # account for the case when df is a Series
-        if isinstance(df, pd.Series):
-            # get numpy arrays of length, age, and weight
-            input_arr_len = np.array([df.length])
-            input_arr_age = np.array([df.age])
-            input_arr_wgt = np.array([df.weight])
-
-        else:
-            # get numpy arrays of length, age, and weight
-            input_arr_len = df.length.values
-            input_arr_age = df.age.values
-            input_arr_wgt = df.weight.values
-
-        # bin the ages
-        age_bins_ind = get_bin_ind(input_arr_age, self.bio_hake_age_bin)
+        # the weight of animals in each age bin
+        numerator_wgt = wgt_sum.copy()
 
-        # bin those lengths that correspond to the lengths in the given age bin
-        len_bin_ind = get_bin_ind(
-            input_arr_len[age_bins_ind[age_bin_ind]], self.bio_hake_len_bin
-        )
+        # get the total weight of each stratum
+        denominator_wgt = wgt_sum.sum(axis=1)
 
         if self.survey.params["exclude_age1"] is True:
 
-            # return 0.0, since no data should be included here
-            if age_bin_ind == 0:
-                return 0.0
-
-            # bin those lengths that correspond to the lengths in the first age bin
-            len_bin_ind_0 = get_bin_ind(
-                input_arr_len[age_bins_ind[0]], self.bio_hake_len_bin
-            )
-
-            # get the weight of the first age bin
-            wgt_age_0 = np.array(
-                [np.sum(input_arr_wgt[age_bins_ind[0][i]]) for i in len_bin_ind_0]
-            ).sum()
+            # no data should be included in the first age bin
+            numerator_wgt[:, 0] = 0.0
 
             # get total weight minus the first age bin weight
-            denominator_wgt = input_arr_wgt.sum() - wgt_age_0
-        else:
-
-            # get total weight
-            denominator_wgt = input_arr_wgt.sum()
+            denominator_wgt = denominator_wgt - wgt_sum[:, 0]
 
-        # the weight of animals in a given age bin
-        numerator_wgt = np.array(
-            [np.sum(input_arr_wgt[age_bins_ind[age_bin_ind][i]]) for i in len_bin_ind]
-        ).sum()
+        denominator_wgt = denominator_wgt[:, np.newaxis]
 
-        # the weight proportion of animals for a given age
-        if denominator_wgt != 0.0:
-            age_wgt_prop = numerator_wgt / denominator_wgt
-        else:
-            age_wgt_prop = numerator_wgt
+        # the weight proportion of animals for each age, when the
+        # total weight is zero the weight itself is used
+        age_wgt_prop = np.divide(
+            numerator_wgt,
+            denominator_wgt,
+            out=numerator_wgt.copy(),
+            where=denominator_wgt != 0.0,
+        )
 
-        # weight for the given age bin
         return age_wgt_prop
 
+    @profile_method
     def _get_weight_num_fraction_adult(self) -> None:
         """
         Obtains the multipliers for each stratum to be applied to the total
@@ -838,10 +900,17 @@ class ComputeTransectVariables:
             self.weight_fraction_adult_df.loc[stratum].val = abs(1.0 - age_wgt_prop)
             self.num_fraction_adult_df.loc[stratum].val = abs(1.0 - age_len_prop)
 
+    @profile_method
     def _get_weight_fraction_all_ages(self) -> None:
         """
         Obtains the multipliers for each stratum to be applied to the total
         areal biomass density and abundance. The values correspond to all age bins.
+
+        Notes
+        -----
+        The weight of the specimen data is accumulated into a single
+        (stratum, sex, age bin) array, from which the weight fractions
+        for males, females, and all genders are derived.
         """
 
         # TODO: This is necessary to match the Matlab output
@@ -849,54 +918,62 @@ class ComputeTransectVariables:
         #  however, this changes the results slightly.
         spec_drop = self.specimen_df.dropna(how="any")
 
-        # obtain the male and female entries of spec_drop
-        spec_drop_M = spec_drop[spec_drop["sex"] == 1]
-        spec_drop_F = spec_drop[spec_drop["sex"] == 2]
-
         # the number of age bins
         bin_length = len(self.bio_hake_age_bin)
 
+        # obtain the strata in spec_drop and the stratum index of each specimen
+        spec_strata, strata_codes = np.unique(
+            spec_drop.index.values, return_inverse=True
+        )
+
+        # sex index of each specimen: 0 is male, 1 is female, and 2 is unsexed
+        sex_vals = spec_drop["sex"].values
+        sex_codes = np.full(len(sex_vals), 2)
+        sex_codes[sex_vals == 1] = 0
+        sex_codes[sex_vals == 2] = 1
+
+        # age bin index of each specimen
+        age_codes = get_bin_codes(spec_drop["age"].values, self.bio_hake_age_bin)
+
+        # the total weight within each stratum, sex, and age bin
+        wgt_sum = np.zeros((len(spec_strata), 3, bin_length))
+        np.add.at(
+            wgt_sum, (strata_codes, sex_codes, age_codes), spec_drop["weight"].values
+        )
+
+        # matrix selecting the strata that should be used for each stratum
+        stratum_choice_mat = np.array(
+            [np.isin(spec_strata, self.stratum_choices[i]) for i in self.all_strata],
+            dtype=np.float64,
+        )
+
+        # total weight within each stratum and age bin for males and females
+        wgt_sum_M = stratum_choice_mat @ wgt_sum[:, 0, :]
+        wgt_sum_F = stratum_choice_mat @ wgt_sum[:, 1, :]
+        wgt_sum_all = stratum_choice_mat @ wgt_sum.sum(axis=1)
+
         # each stratum's multiplier once areal biomass density has been calculated
+        bin_columns = ["age_bin_" + str(i + 1) for i in range(bin_length)]
         self.weight_fraction_all_ages_df = pd.DataFrame(
-            columns=["age_bin_" + str(i + 1) for i in range(bin_length)],
+            self._get_all_age_weight_proportions(wgt_sum_all),
+            columns=bin_columns,
             index=self.all_strata,
             dtype=np.float64,
         )
         self.weight_fraction_all_ages_male_df = pd.DataFrame(
-            columns=["age_bin_" + str(i + 1) for i in range(bin_length)],
+            self._get_all_age_weight_proportions(wgt_sum_M),
+            columns=bin_columns,
             index=self.all_strata,
             dtype=np.float64,
         )
         self.weight_fraction_all_ages_female_df = pd.DataFrame(
-            columns=["age_bin_" + str(i + 1) for i in range(bin_length)],
+            self._get_all_age_weight_proportions(wgt_sum_F),
+            columns=bin_columns,
             index=self.all_strata,
             dtype=np.float64,
         )
 
-        for stratum in self.all_strata:
-
-            # select specimen data
-            spec_in = spec_drop.loc[self.stratum_choices[stratum]]
-            spec_in_M = spec_drop_M.loc[self.stratum_choices[stratum]]
-            spec_in_F = spec_drop_F.loc[self.stratum_choices[stratum]]
-
-            # obtain the weight fraction for all age bins and a given stratum
-            for j in range(bin_length):
-                age_wgt_prop = self._get_all_age_weight_proportions(spec_in, j)
-                self.weight_fraction_all_ages_df.loc[stratum][
-                    "age_bin_" + str(j + 1)
-                ] = age_wgt_prop
-
-                age_wgt_prop_M = self._get_all_age_weight_proportions(spec_in_M, j)
-                self.weight_fraction_all_ages_male_df.loc[stratum][
-                    "age_bin_" + str(j + 1)
-                ] = age_wgt_prop_M
-
-                age_wgt_prop_F = self._get_all_age_weight_proportions(spec_in_F, j)
-                self.weight_fraction_all_ages_female_df.loc[stratum][
-                    "age_bin_" + str(j + 1)
-                ] = age_wgt_prop_F
-
+    @profile_method
     def set_class_variables(self, selected_transects: Optional[List] = None) -> None:
         """
         Set class variables corresponding to the Dataframes from ``survey``,
@@ -1007,7 +1084,7 @@ class ComputeTransectVariables:
         # calculate the areal numerical density
         self.transect_results_gdf["numerical_density"] = np.round(
             (self.mix_sa_ratio * self.nasc_df.NASC)
-            / self.strata_sig_b.loc[self.nasc_df.stratum_num].values
+            / self._expand_to_nasc(self.strata_sig_b)
         )
 
         # compute the areal numerical density for males and females
@@ -1021,9 +1098,10 @@ class ComputeTransectVariables:
         )
 
         # compute areal numerical density for adults
-        self.transect_results_gdf["numerical_density_adult"] = (
-            self.transect_results_gdf["numerical_density"]
-            * self.num_fraction_adult_df.loc[self.nasc_df.stratum_num].values.flatten()
+        self.transect_results_gdf[
+            "numerical_density_adult"
+        ] = self.transect_results_gdf["numerical_density"] * self._expand_to_nasc(
+            self.num_fraction_adult_df["val"]
         )
 
     def _set_biomass_density(self, bc_expanded_df: pd.DataFrame) -> None:
@@ -1065,12 +1143,9 @@ class ComputeTransectVariables:
         )
 
         # compute the total biomass density for adults
-        self.transect_results_gdf["biomass_density_adult"] = (
-            self.transect_results_gdf["biomass_density"]
-            * self.weight_fraction_adult_df.loc[
-                self.nasc_df.stratum_num
-            ].values.flatten()
-        )
+        self.transect_results_gdf["biomass_density_adult"] = self.transect_results_gdf[
+            "biomass_density"
+        ] * self._expand_to_nasc(self.weight_fraction_adult_df["val"])
 
     def _set_abundance(self, bc_expanded_df: pd.DataFrame) -> None:
         """
@@ -1093,7 +1168,7 @@ class ComputeTransectVariables:
             self.mix_sa_ratio
             * self.nasc_df.NASC
             * self.transect_results_gdf["interval_area_nmi2"]
-        ) / self.strata_sig_b.loc[self.nasc_df.stratum_num].values
+        ) / self._expand_to_nasc(self.strata_sig_b)
 
         # Account for removed transects
         # TODO: this is done in the Matlab code (might be worth investigating)
@@ -1112,9 +1187,9 @@ class ComputeTransectVariables:
         )
 
         # create variable to improve readability
-        fraction_adult_stratum_df = self.num_fraction_adult_df.loc[
-            self.nasc_df.stratum_num
-        ].values.flatten()
+        fraction_adult_stratum_df = self._expand_to_nasc(
+            self.num_fraction_adult_df["val"]
+        )
 
         # obtain the abundance for adults
         self.transect_results_male_gdf["abundance_adult"] = (
@@ -1169,9 +1244,9 @@ class ComputeTransectVariables:
         )
 
         # create variable to improve readability
-        fraction_adult_stratum_df = self.weight_fraction_adult_df.loc[
-            self.nasc_df.stratum_num
-        ].values.flatten()
+        fraction_adult_stratum_df = self._expand_to_nasc(
+            self.weight_fraction_adult_df["val"]
+        )
 
         # obtain the biomass for adults
         self.transect_results_female_gdf["biomass_adult"] = (
@@ -1184,38 +1259,43 @@ class ComputeTransectVariables:
             self.transect_results_gdf["biomass"] * fraction_adult_stratum_df
         )
 
-    @staticmethod
-    def _compute_biomass_all_ages(
-        weight_fraction_all_ages_df: pd.DataFrame,
-        results_gdf: gpd.GeoDataFrame,
-    ) -> None:
+    def _compute_biomass_all_ages(self) -> None:
         """
-        Compute the biomass for each age bin based off the provided input.
-        Additionally, add computed variables to the input ``results_gdf``.
-
-        Parameters
-        ----------
-        weight_fraction_all_ages_df: pd.DataFrame
-            A DataFrame containing the weight fraction at each age
-            bin for all strata (corresponds to ``biomass_column``)
-        results_gdf: gpd.GeoDataFrame
-            A GeoDataFrame containing the columns ``biomass_adult, stratum_num``
-            and where the biomass at each age bin should be stored
+        Computes the biomass at each age bin for all sexes as a single
+        array and adds it to the transect results GeoDataFrames as the
+        columns ``biomass_age_bin_*``. The array is not kept, so that the
+        biomass is only stored in the columns.
         """
 
-        # obtain stratum column from input gdf
-        stratum_vals = results_gdf["stratum_num"]
-
-        for bin_str in weight_fraction_all_ages_df:
-            # expand the weight fraction for all ages
-            expanded_age_bin = (
-                weight_fraction_all_ages_df[bin_str].loc[stratum_vals].values
-            )
+        # create variable to improve readability
+        strata_index = self.survey.survey_index.strata
+
+        biomass_age = compute_biomass_age(
+            strata_index,
+            strata_index.get_codes(self.transect_results_gdf["stratum_num"]),
+            [
+                self.weight_fraction_all_ages_df,
+                self.weight_fraction_all_ages_male_df,
+                self.weight_fraction_all_ages_female_df,
+            ],
+            [
+                self.transect_results_gdf["biomass_adult"],
+                self.transect_results_male_gdf["biomass_adult"],
+                self.transect_results_female_gdf["biomass_adult"],
+            ],
+            dim="point",
+            precision=self.survey.params["precision"],
+        )
 
-            results_gdf["biomass_" + bin_str] = (
-                expanded_age_bin * results_gdf["biomass_adult"]
+        for sex, suffix in RESULTS_SEXES.items():
+            name = f"transect_results{suffix}_gdf"
+            setattr(
+                self,
+                name,
+                add_biomass_age_columns(getattr(self, name), biomass_age, sex),
             )
 
+    @profile_method
     def set_adult_NASC(self) -> None:
         """
         Computes NASC values corresponding to the adult animal population
@@ -1252,9 +1332,7 @@ class ComputeTransectVariables:
             nasc_fraction_adult_df.loc[i] = abs(1.0 - age1_nasc_proportion)
 
         # obtain the adult NASC proportion coefficient for each stratum value
-        fraction_adult_stratum_df = nasc_fraction_adult_df.loc[
-            self.nasc_df.stratum_num
-        ].values.flatten()
+        fraction_adult_stratum_df = self._expand_to_nasc(nasc_fraction_adult_df["val"])
 
         # obtain the NASC for adults
         NASC_adult = self.nasc_df["NASC"] * fraction_adult_stratum_df
@@ -1262,6 +1340,7 @@ class ComputeTransectVariables:
         # assign values to results gdf
         self.transect_results_gdf["NASC_adult"] = NASC_adult
 
+    @profile_method
     def _construct_results_gdf(self) -> None:
         """
         Constructs self.transect_results_gdf, which contains the
@@ -1279,18 +1358,29 @@ class ComputeTransectVariables:
         self.transect_results_male_gdf = self.transect_results_gdf.copy(deep=True)
         self.transect_results_female_gdf = self.transect_results_gdf.copy(deep=True)
 
+        # obtain the survey codes of the stratum of each NASC value
+        self.nasc_stratum_codes = self.survey.survey_index.strata.get_codes(
+            self.nasc_df["stratum_num"]
+        )
+
         # calculate proportion coefficient for mixed species
         # TODO: note we use all strata_df data every time to match Matlab output
         wgt_vals = self.strata_df.reset_index().set_index("haul_num")["fraction_hake"]
-        wgt_vals_ind = wgt_vals.index
-        self.mix_sa_ratio = self.nasc_df.apply(
-            lambda x: wgt_vals[x.haul_num] if x.haul_num in wgt_vals_ind else 0.0,
-            axis=1,
+
+        # hauls that are not in wgt_vals are given a coefficient of zero
+        haul_index = self.survey.survey_index.hauls
+        self.mix_sa_ratio = pd.Series(
+            haul_index.expand(
+                wgt_vals, haul_index.get_codes(self.nasc_df["haul_num"]), fill_value=0.0
+            ),
+            index=self.nasc_df.index,
+            name="hake_mix_coefficient",
         )
-        self.mix_sa_ratio.name = "hake_mix_coefficient"
 
         # expand the bio parameters dataframe so that it corresponds to nasc_df
-        bc_expanded_df = self.bio_param_df.loc[self.nasc_df.stratum_num]
+        bc_expanded_df = pd.DataFrame(
+            self._expand_to_nasc(self.bio_param_df), columns=self.bio_param_df.columns
+        )
 
         # calculate and assign numerical density values
         self._set_numerical_density(bc_expanded_df)
@@ -1310,24 +1400,10 @@ class ComputeTransectVariables:
         # calculate and assign biomass values
         self._set_biomass(bc_expanded_df)
 
-        # calculate and add male biomass for all ages to Transect results
-        self._compute_biomass_all_ages(
-            self.weight_fraction_all_ages_male_df,
-            self.transect_results_male_gdf,
-        )
-
-        # calculate and add female biomass for all ages to Transect results
-        self._compute_biomass_all_ages(
-            self.weight_fraction_all_ages_female_df,
-            self.transect_results_female_gdf,
-        )
-
-        # calculate and add biomass for all ages to Transect results
-        self._compute_biomass_all_ages(
-            self.weight_fraction_all_ages_df,
-            self.transect_results_gdf,
-        )
+        # calculate and add biomass for all ages and sexes to Transect results
+        self._compute_biomass_all_ages()
 
+    @profile_method
     def get_transect_results_gdf(
         self, selected_transects: Optional[List] = None
     ) -> None:
@@ -1,6 +1,14 @@
 from .biological_data import LoadBioData
 from .kriging_mesh import KrigingMesh
+from .mesh_store import load_mesh_store, save_mesh_store
 from .nasc_data import load_nasc_df
 from .stratification_data import LoadStrataData
 
-__all__ = ["LoadBioData", "LoadStrataData", "load_nasc_df", "KrigingMesh"]
+__all__ = [
+    "LoadBioData",
+    "LoadStrataData",
+    "load_nasc_df",
+    "KrigingMesh",
+    "load_mesh_store",
+    "save_mesh_store",
+]
@@ -1,14 +1,31 @@
 from pathlib import Path
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 import geopandas as gpd
 import numpy as np
 import pandas as pd
 from scipy import interpolate
-from shapely.geometry import Polygon
+from scipy.spatial import ConvexHull, QhullError, cKDTree
+from shapely.geometry import MultiPoint, Point, Polygon, box
 from shapely.ops import unary_union
+from shapely.prepared import prep
 
 from ..utils.input_checks import check_column_names, check_existence_of_file
+from .mesh_store import is_mesh_store, load_mesh_store
+
+
+class _LazyPoints:
+    """
+    Constructs the Point at an index of coordinate arrays when it is accessed.
+    """
+
+    def __init__(self, x: np.ndarray, y: np.ndarray):
+
+        self.x = x
+        self.y = y
+
+    def __getitem__(self, i: int) -> Point:
+        return Point(self.x[i], self.y[i])
 
 
 class KrigingMesh:
@@ -21,14 +38,32 @@ class KrigingMesh:
     ----------
     survey : Survey
         An initialized ``Survey`` object.
+    mesh_gdf : gpd.GeoDataFrame or pd.DataFrame or None
+        The full mesh. If None, the mesh is loaded from the
+        file specified by the parameter ``'mesh_filename'``.
+    smoothed_contour_gdf : gpd.GeoDataFrame or None
+        The smoothed contour. If None, the contour is loaded from
+        the file specified by the parameter ``'smoothed_contour_filename'``.
 
     Notes
     -----
     Any change to ``self.survey`` will also change
     the input survey object.
+
+    The provided ``mesh_gdf`` and ``smoothed_contour_gdf`` are not
+    copied, since they are not modified by this class.
+
+    The mesh is stored as the DataFrame ``self.mesh_df`` and the points of
+    ``self.mesh_gdf`` are only constructed when ``self.mesh_gdf`` is first
+    accessed e.g. when plotting or constructing the Kriging results.
     """
 
-    def __init__(self, survey=None):
+    def __init__(
+        self,
+        survey=None,
+        mesh_gdf: Optional[Union[gpd.GeoDataFrame, pd.DataFrame]] = None,
+        smoothed_contour_gdf: Optional[gpd.GeoDataFrame] = None,
+    ):
 
         self.survey = survey
 
@@ -48,8 +83,30 @@ class KrigingMesh:
         self.transect_d_y = None
         self.transformed_mesh_df = None
 
-        self._load_mesh()
-        self._load_smoothed_contour()
+        # cached interpolator of the smoothed contour and the
+        # contour it was constructed from
+        self._contour_interpolator = None
+        self._interpolated_contour_gdf = None
+
+        # cached aligned mesh, stored as the mesh, contour, and lon_ref it
+        # was aligned from, its aligned longitude, and its latitude
+        self._aligned_mesh = None
+
+        # the aligned longitude and distance parameters of ``transformed_mesh_df``
+        self._transformed_mesh_params = None
+
+        # the mesh with its points, constructed when first accessed
+        self._mesh_gdf = None
+
+        if mesh_gdf is None:
+            self._load_mesh()
+        else:
+            self.mesh_gdf = mesh_gdf
+
+        if smoothed_contour_gdf is None:
+            self._load_smoothed_contour()
+        else:
+            self.smoothed_contour_gdf = smoothed_contour_gdf
 
     def _check_mesh_df(self, mesh_df: pd.DataFrame, df_path: Path) -> None:
         """
@@ -91,13 +148,38 @@ class KrigingMesh:
             df=contour_df, expected_names=self.contour_cols, path_for_df=df_path
         )
 
+    @property
+    def mesh_gdf(self) -> gpd.GeoDataFrame:
+        """
+        The full mesh with a geometry column of the mesh points, which
+        is constructed from ``self.mesh_df`` when first accessed.
+        """
+
+        if self._mesh_gdf is None:
+            self._mesh_gdf = gpd.GeoDataFrame(
+                self.mesh_df,
+                geometry=gpd.points_from_xy(
+                    self.mesh_df["centroid_longitude"],
+                    self.mesh_df["centroid_latitude"],
+                ),
+            )
+
+        return self._mesh_gdf
+
+    @mesh_gdf.setter
+    def mesh_gdf(self, mesh_df: Union[gpd.GeoDataFrame, pd.DataFrame]) -> None:
+
+        self.mesh_df = mesh_df
+        self._mesh_gdf = mesh_df if isinstance(mesh_df, gpd.GeoDataFrame) else None
+
     def _load_mesh(self) -> None:
         """
         Loads the full mesh of the region being considered.
         Action is completed by reading in an Excel file provided
-        by the user defined parameter ``'mesh_filename'``.
-        Finally, constructs the GeoPandas Dataframe representing
-        the full mesh and assigns it as the class variable ``mesh_gdf``.
+        by the user defined parameter ``'mesh_filename'``, or by
+        memory-mapping the mesh store (see ``save_mesh_store``)
+        if ``'mesh_filename'`` is a mesh store directory.
+        Finally, assigns the mesh as the class variable ``mesh_df``.
         """
 
         # check existence of the file
@@ -106,6 +188,14 @@ class KrigingMesh:
         )
         check_existence_of_file(file_path)
 
+        if is_mesh_store(file_path):
+            df = load_mesh_store(file_path)
+            self._check_mesh_df(df, file_path)
+
+            # the mesh store only contains the required columns
+            self.mesh_gdf = df
+            return
+
         df = pd.read_excel(file_path, sheet_name=self.survey.params["mesh_sheetname"])
         self._check_mesh_df(df, file_path)
 
@@ -123,16 +213,8 @@ class KrigingMesh:
             }
         )
 
-        # construct geopandas DataFrame to simplify downstream processes
-        gdf = gpd.GeoDataFrame(
-            df,
-            geometry=gpd.points_from_xy(
-                df["centroid_longitude"], df["centroid_latitude"]
-            ),
-        )
-
-        # assign class variable
-        self.mesh_gdf = gdf
+        # assign class variable, where the mesh points are constructed when needed
+        self.mesh_gdf = df
 
     def _load_smoothed_contour(self) -> None:
         """
@@ -202,6 +284,29 @@ class KrigingMesh:
             geometry=gpd.points_from_xy(df_tran_mean.longitude, df_tran_mean.latitude),
         )
 
+    @staticmethod
+    def _get_convex_hull_coords(coords: np.ndarray) -> np.ndarray:
+        """
+        Obtains the vertices of the convex hull of a set of points.
+
+        Parameters
+        ----------
+        coords : np.ndarray
+            The (longitude, latitude) of each point, with shape ``(n, 2)``
+
+        Returns
+        -------
+        np.ndarray
+            The vertices of the convex hull, with shape ``(m, 2)``
+        """
+
+        try:
+            return coords[ConvexHull(coords).vertices]
+        except (QhullError, ValueError):
+            # the points are collinear or there are less than three
+            # points, thus all points are kept
+            return coords
+
     def get_polygon_of_transects(
         self, gdf: gpd.GeoDataFrame, n_close: int, nm_to_buffer: float = 1.25
     ) -> Polygon:
@@ -242,19 +347,34 @@ class KrigingMesh:
 
         gdf_tran_mean = self._get_coordinate_mean(gdf)
 
-        # for each transect construct the smallest convex
-        # Polygon containing all the points in the transect
-        transect_polygons = []
-        for transect in gdf_tran_mean.index:
-
-            # obtain n_close closest transects
-            closest_trans = gdf_tran_mean.geometry.distance(
-                gdf_tran_mean.loc[transect, "geometry"]
-            ).nsmallest(n_close)
+        # obtain the n_close closest transects to each transect
+        # using the Euclidean distance between their mean points
+        tree = cKDTree(gdf_tran_mean[["longitude", "latitude"]].to_numpy())
+        _, closest_trans = tree.query(
+            gdf_tran_mean[["longitude", "latitude"]].to_numpy(),
+            k=min(n_close, len(gdf_tran_mean)),
+        )
+        closest_trans = closest_trans.reshape(len(gdf_tran_mean), -1)
+
+        # the convex hull of several transects is the convex hull of the
+        # vertices of the convex hull of each transect, thus each
+        # transect is reduced to the vertices of its convex hull
+        transects = gdf.index.get_level_values(0).to_numpy()
+        order = np.argsort(transects, kind="stable")
+        _, transect_starts = np.unique(transects[order], return_index=True)
+        hull_coords = [
+            self._get_convex_hull_coords(coords)
+            for coords in np.split(
+                gdf[["longitude", "latitude"]].to_numpy()[order], transect_starts[1:]
+            )
+        ]
 
-            # create polygon encasing closest_trans
-            full_pol = Polygon(list(gdf.loc[closest_trans.index, "geometry"]))
-            transect_polygons.append(full_pol.convex_hull)
+        # for each transect construct the smallest convex Polygon
+        # containing all the points in its n_close closest transects
+        transect_polygons = [
+            MultiPoint(np.concatenate([hull_coords[i] for i in closest])).convex_hull
+            for closest in closest_trans
+        ]
 
         # obtain Polygon surrounding all transects
         pol = unary_union(transect_polygons)
@@ -265,7 +385,108 @@ class KrigingMesh:
         # buffer Polygon by a number of nm
         return pol.buffer(buf_val)
 
-    def reduce_grid_points(self, transect_polygon: Polygon) -> gpd.GeoDataFrame:
+    def get_within_mask(
+        self, transect_polygon: Polygon, num_grid_cells: Optional[int] = 16
+    ) -> np.ndarray:
+        """
+        Determines which full mesh points are within the transect polygon.
+
+        Parameters
+        ----------
+        transect_polygon : Polygon
+            A Polygon that contains all transect data.
+        num_grid_cells : int or None
+            The number of cells along each side of the grid that the
+            bounding box of ``transect_polygon`` is split into. If None,
+            the grid is not used and each point within the bounding box
+            is tested against the polygon.
+
+        Returns
+        -------
+        in_poly : np.ndarray
+            A bool mask of the points in ``self.mesh_gdf``, which equals
+            ``self.mesh_gdf["geometry"].within(transect_polygon)``
+
+        Notes
+        -----
+        The points outside the bounding box of the polygon are discarded
+        first. The remaining points are grouped by the grid cell that
+        contains them. All points of a cell that is within the interior
+        of the polygon, or that does not intersect the polygon, share the
+        same result, thus only the points of cells that intersect the
+        boundary of the polygon are tested individually. All tests are done
+        against a prepared polygon, which indexes the edges of the polygon.
+        """
+
+        # the mesh points were constructed from these columns, which
+        # are faster to access than the coordinates of each point
+        x = self.mesh_df["centroid_longitude"].to_numpy(dtype=np.float64)
+        y = self.mesh_df["centroid_latitude"].to_numpy(dtype=np.float64)
+
+        # the points are only constructed for those points that are tested
+        if self._mesh_gdf is None:
+            points = _LazyPoints(x, y)
+        else:
+            points = np.asarray(self._mesh_gdf["geometry"])
+
+        in_poly = np.zeros(len(x), dtype=bool)
+
+        if transect_polygon.is_empty:
+            return in_poly
+
+        # points on the bounding box are on or outside of the polygon
+        min_x, min_y, max_x, max_y = transect_polygon.bounds
+        candidates = np.flatnonzero(
+            (x > min_x) & (x < max_x) & (y > min_y) & (y < max_y)
+        )
+
+        prepared_polygon = prep(transect_polygon)
+
+        if not num_grid_cells:
+            in_poly[candidates] = [
+                prepared_polygon.contains(points[i]) for i in candidates
+            ]
+            return in_poly
+
+        # assign each candidate point to a grid cell
+        d_x = (max_x - min_x) / num_grid_cells
+        d_y = (max_y - min_y) / num_grid_cells
+        ind_x = np.minimum(
+            ((x[candidates] - min_x) // d_x).astype(int), num_grid_cells - 1
+        )
+        ind_y = np.minimum(
+            ((y[candidates] - min_y) // d_y).astype(int), num_grid_cells - 1
+        )
+        cells = ind_x * num_grid_cells + ind_y
+
+        # group the candidate points by their cell
+        order = np.argsort(cells, kind="stable")
+        cell_ids, cell_starts = np.unique(cells[order], return_index=True)
+
+        for cell, point_inds in zip(
+            cell_ids, np.split(candidates[order], cell_starts[1:])
+        ):
+
+            i, j = divmod(cell, num_grid_cells)
+            cell_box = box(
+                min_x + i * d_x,
+                min_y + j * d_y,
+                min_x + (i + 1) * d_x,
+                min_y + (j + 1) * d_y,
+            )
+
+            if prepared_polygon.contains_properly(cell_box):
+                in_poly[point_inds] = True
+            elif prepared_polygon.intersects(cell_box):
+                in_poly[point_inds] = [
+                    prepared_polygon.contains(points[k]) for k in point_inds
+                ]
+
+        return in_poly
+
+    def reduce_grid_points(
+        self, transect_polygon: Polygon, num_grid_cells: Optional[int] = 16
+    ) -> gpd.GeoDataFrame:
         """
         Reduces the full mesh points provided to the ``KrigingMesh``
         class by selecting those points that are within the
@@ -275,6 +496,9 @@ class KrigingMesh:
         ----------
         transect_polygon : Polygon
             A Polygon that contains all transect data.
+        num_grid_cells : int or None
+            The number of cells along each side of the grid used
+            to select the points (see ``get_within_mask``)
 
         Returns
         -------
@@ -283,11 +507,225 @@ class KrigingMesh:
         """
 
         # get bool mask of points that are within the polygon
-        in_poly = self.mesh_gdf["geometry"].within(transect_polygon)
+        in_poly = self.get_within_mask(transect_polygon, num_grid_cells)
 
         # select gdf rows based on bool mask
         return self.mesh_gdf.loc[in_poly].copy()
 
+    def _get_contour_interpolator(self) -> interpolate.interp1d:
+        """
+        Obtains the linear interpolation of the longitude of the smoothed
+        contour over its latitude, which is only constructed again
+        when ``self.smoothed_contour_gdf`` is replaced.
+
+        Returns
+        -------
+        interpolate.interp1d
+            The interpolation of the smoothed contour
+        """
+
+        if self._interpolated_contour_gdf is not self.smoothed_contour_gdf:
+
+            # construct an interpolation between points
+            self._contour_interpolator = interpolate.interp1d(
+                self.smoothed_contour_gdf["latitude"],
+                self.smoothed_contour_gdf["longitude"],
+                kind="linear",
+                bounds_error=False,
+            )
+            self._interpolated_contour_gdf = self.smoothed_contour_gdf
+
+        return self._contour_interpolator
+
+    def _get_aligned_mesh(
+        self, lon_ref: float = -124.78338
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Obtains the coordinates of ``self.mesh_df`` with the longitude
+        aligned (see ``align_longitude``), which are only aligned again when
+        ``self.mesh_df``, ``self.smoothed_contour_gdf``, or ``lon_ref`` change.
+
+        Parameters
+        ----------
+        lon_ref : float
+            An arbitrary scalar, or a reference longitude
+            (e.g., the mean longitude of the 200m isobath)
+
+        Returns
+        -------
+        lon : np.ndarray
+            The aligned longitude of each mesh point
+        lat : np.ndarray
+            The latitude of each mesh point
+        """
+
+        if (
+            (self._aligned_mesh is None)
+            or (self._aligned_mesh[0] is not self.mesh_df)
+            or (self._aligned_mesh[1] is not self.smoothed_contour_gdf)
+            or (self._aligned_mesh[2] != lon_ref)
+        ):
+
+            # the mesh points were constructed from these columns
+            lat = self.mesh_df["centroid_latitude"].to_numpy(dtype=np.float64)
+            lon = self.get_aligned_longitude(
+                self.mesh_df["centroid_longitude"].to_numpy(dtype=np.float64),
+                lat,
+                lon_ref,
+            )
+
+            self._aligned_mesh = (
+                self.mesh_df,
+                self.smoothed_contour_gdf,
+                lon_ref,
+                lon,
+                lat,
+            )
+
+        return self._aligned_mesh[3:]
+
+    def get_aligned_longitude(
+        self, lon: np.ndarray, lat: np.ndarray, lon_ref: float = -124.78338
+    ) -> np.ndarray:
+        """
+        Aligns the longitude of points along the smoothed contour
+        (see ``align_longitude``).
+
+        Parameters
+        ----------
+        lon : np.ndarray
+            The longitude of each point
+        lat : np.ndarray
+            The latitude of each point
+        lon_ref : float
+            An arbitrary scalar, or a reference longitude
+            (e.g., the mean longitude of the 200m isobath)
+
+        Returns
+        -------
+        np.ndarray
+            The aligned longitude of each point, which is NaN for
+            those points outside the latitude range of the contour
+        """
+
+        return lon - self._get_contour_interpolator()(lat) + lon_ref
+
+    @staticmethod
+    def get_distance_coords(
+        lon: np.ndarray,
+        lat: np.ndarray,
+        d_x: float,
+        d_y: float,
+        x_offset: float = -124.78338,
+        y_offset: float = 45.0,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Transforms coordinates from degrees to distance
+        (see ``apply_distance_transformation``).
+
+        Parameters
+        ----------
+        lon : np.ndarray
+            The longitude of each point
+        lat : np.ndarray
+            The latitude of each point
+        d_x : float
+            the distance between the maximum longitude
+            value and the minimum longitude value.
+        d_y : float
+            the distance between the maximum latitude
+            value and the minimum latitude value
+        x_offset : float
+            An arbitrary scalar, or a reference longitude
+            (e.g., the mean longitude of the 200m isobath)
+        y_offset : float
+            An arbitrary scalar, or a reference latitude
+            (e.g., the mean latitude of the 200m isobath)
+
+        Returns
+        -------
+        x : np.ndarray
+            The x coordinate of the distance coordinate system
+        y : np.ndarray
+            The y coordinate of the distance coordinate system
+        """
+
+        # constant that converts degrees to radians
+        DEG2RAD = np.pi / 180.0
+
+        # transform the coordinates so they are in terms of distance
+        return np.cos(DEG2RAD * lat) * (lon - x_offset) / d_x, (lat - y_offset) / d_y
+
+    def transform_coords(
+        self,
+        lon: np.ndarray,
+        lat: np.ndarray,
+        d_x: Optional[float] = None,
+        d_y: Optional[float] = None,
+        lon_ref: float = -124.78338,
+        x_offset: float = -124.78338,
+        y_offset: float = 45.0,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float, float]:
+        """
+        Aligns the longitude of points along the smoothed contour and then
+        transforms their coordinates from degrees to distance, without
+        constructing any geometries.
+
+        Parameters
+        ----------
+        lon : np.ndarray
+            The longitude of each point
+        lat : np.ndarray
+            The latitude of each point
+        d_x : float or None
+            the distance between the maximum longitude value and the minimum
+            longitude value. If None, it is computed from the aligned longitude.
+        d_y : float or None
+            the distance between the maximum latitude value and the minimum
+            latitude value. If None, it is computed from ``lat``.
+        lon_ref : float
+            An arbitrary scalar, or a reference longitude
+            (e.g., the mean longitude of the 200m isobath)
+            used in aligning the longitude
+        x_offset : float
+            An arbitrary scalar, or a reference longitude
+            (e.g., the mean longitude of the 200m isobath)
+            used in transforming from degrees to distance
+        y_offset : float
+            An arbitrary scalar, or a reference latitude
+            (e.g., the mean latitude of the 200m isobath)
+            used in transforming from degrees to distance
+
+        Returns
+        -------
+        lon_aligned : np.ndarray
+            The aligned longitude of each point
+        x : np.ndarray
+            The x coordinate of the distance coordinate system
+        y : np.ndarray
+            The y coordinate of the distance coordinate system
+        d_x : float
+            The provided or computed ``d_x``
+        d_y : float
+            The provided or computed ``d_y``
+
+        Notes
+        -----
+        Points outside the latitude range of the smoothed
+        contour are ignored when computing ``d_x``.
+        """
+
+        lon_aligned = self.get_aligned_longitude(lon, lat, lon_ref)
+
+        if d_x is None:
+            d_x = np.nanmax(lon_aligned) - np.nanmin(lon_aligned)
+        if d_y is None:
+            d_y = np.nanmax(lat) - np.nanmin(lat)
+
+        x, y = self.get_distance_coords(lon_aligned, lat, d_x, d_y, x_offset, y_offset)
+
+        return lon_aligned, x, y, d_x, d_y
+
     def align_longitude(
         self, gdf: gpd.GeoDataFrame, lon_ref: float = -124.78338
     ) -> gpd.GeoDataFrame:
@@ -320,26 +758,23 @@ class KrigingMesh:
         -----
         Extreme caution should be used here. This transformation
         was specifically designed for a NWFSC application!
-        """
 
-        # construct an interpolation between points
-        f = interpolate.interp1d(
-            self.smoothed_contour_gdf["latitude"],
-            self.smoothed_contour_gdf["longitude"],
-            kind="linear",
-            bounds_error=False,
-        )
+        This function wraps ``get_aligned_longitude``, which
+        should be used when the geometry is not needed.
+        """
 
         # TODO: do we need to drop NaNs after interpolating?
         #  Investigate this further.
 
+        lat = gdf.geometry.y.to_numpy()
+
         # apply longitude transformation and store values
         transformed_gdf = gdf.copy()
-        transformed_gdf["longitude_transformed"] = (
-            gdf.geometry.x - f(gdf.geometry.y) + lon_ref
+        transformed_gdf["longitude_transformed"] = self.get_aligned_longitude(
+            gdf.geometry.x.to_numpy(), lat, lon_ref
         )
         transformed_gdf["geometry"] = gpd.points_from_xy(
-            transformed_gdf["longitude_transformed"], gdf.geometry.y
+            transformed_gdf["longitude_transformed"], lat
         )
 
         return transformed_gdf
@@ -387,20 +822,19 @@ class KrigingMesh:
         -----
         Extreme caution should be used here. This transformation
         was specifically designed for a NWFSC application!
-        """
 
-        # constant that converts degrees to radians
-        DEG2RAD = np.pi / 180.0
-
-        # initial coordinates without distance transformation
-        x = gdf.geometry.x
-        y = gdf.geometry.y
-
-        # transform the coordinates so they are in terms of distance
-        x = np.cos(DEG2RAD * y) * (x - x_offset) / d_x
-        y = (y - y_offset) / d_y
+        This function wraps ``get_distance_coords``, which
+        should be used when the coordinates are available.
+        """
 
-        return x.values.flatten(), y.values.flatten()
+        return KrigingMesh.get_distance_coords(
+            gdf.geometry.x.to_numpy(),
+            gdf.geometry.y.to_numpy(),
+            d_x,
+            d_y,
+            x_offset,
+            y_offset,
+        )
 
     def _transform_transect_data(
         self,
@@ -440,24 +874,28 @@ class KrigingMesh:
         value and the minimum latitude value (after aligning the longitude)
         """
 
-        if isinstance(self.survey.bio_calc.transect_results_gdf, gpd.GeoDataFrame):
-            # apply transformations to transect points
-            transect_df = self.align_longitude(
-                self.survey.bio_calc.transect_results_gdf, lon_ref
-            )
-
-            # compute distances for each transect
-            d_x = transect_df.geometry.x.max() - transect_df.geometry.x.min()
-            d_y = transect_df.geometry.y.max() - transect_df.geometry.y.min()
-
-            x_transect, y_transect = self.apply_distance_transformation(
-                transect_df, d_x, d_y, x_offset, y_offset
+        transect_gdf = self.survey.bio_calc.transect_results_gdf
+
+        if isinstance(transect_gdf, gpd.GeoDataFrame):
+            # apply transformations to transect points, where the
+            # transect points were constructed from these columns
+            lon_aligned, x_transect, y_transect, d_x, d_y = self.transform_coords(
+                transect_gdf["longitude"].to_numpy(dtype=np.float64),
+                transect_gdf["latitude"].to_numpy(dtype=np.float64),
+                lon_ref=lon_ref,
+                x_offset=x_offset,
+                y_offset=y_offset,
             )
 
             # store transformed points
-            transect_df["x_transect"] = x_transect
-            transect_df["y_transect"] = y_transect
-            self.transformed_transect_df = transect_df
+            self.transformed_transect_df = pd.DataFrame(
+                {
+                    "longitude_transformed": lon_aligned,
+                    "x_transect": x_transect,
+                    "y_transect": y_transect,
+                },
+                index=transect_gdf.index,
+            )
 
             # store distance information
             self.transect_d_x = d_x
@@ -489,9 +927,9 @@ class KrigingMesh:
             Possible options:
 
             - ``'transect'`` specifies that one should
-              copy and transform ``survey.bio_calc.transect_results_gdf``
-            - ``'mesh'`` specifies that one should copy '
-              and transform `self.mesh_gdf``
+              transform ``survey.bio_calc.transect_results_gdf``
+            - ``'mesh'`` specifies that one should
+              transform ``self.mesh_gdf``
 
         lon_ref : float
             An arbitrary scalar, or a reference longitude
@@ -515,8 +953,9 @@ class KrigingMesh:
         for each ``coord_type``:
 
         - If ``coord_type='transect'``
-            - ``transformed_transect_df`` DataFrame representing the
-              transformed transect data
+            - ``transformed_transect_df`` DataFrame with the index of the
+              transect data and the columns ``longitude_transformed``,
+              ``x_transect``, and ``y_transect``
             - ``transect_d_x`` the distance between the maximum longitude
               value and the minimum longitude value (after aligning the
               longitude) for transect data
@@ -525,12 +964,17 @@ class KrigingMesh:
               longitude) for the transect data
 
         - If ``coord_type='mesh'``
-            - ``transformed_mesh_df`` DataFrame representing the
-              transformed mesh data
+            - ``transformed_mesh_df`` DataFrame with the index of the mesh
+              and the columns ``longitude_transformed``, ``x_mesh``, and ``y_mesh``
             - Additionally, if ``coord_type='transect'`` has not been
               run, this function will create all class variables associated
               with this input.
 
+        The mesh coordinates with the longitude aligned are cached, thus when
+        the mesh is transformed again, only the distance transformation is
+        applied, and only if the transect distances or offsets changed. The
+        cache is cleared when ``self.mesh_gdf`` or ``self.smoothed_contour_gdf``
+        are replaced, but not when they are modified in place.
         """
 
         if coord_type == "transect":
@@ -542,15 +986,34 @@ class KrigingMesh:
             if not self.transect_d_x:
                 self._transform_transect_data(lon_ref, x_offset, y_offset)
 
-            # apply transformations to mesh points
-            mesh_df = self.align_longitude(self.mesh_gdf)
-            x_mesh, y_mesh = self.apply_distance_transformation(
-                mesh_df, self.transect_d_x, self.transect_d_y, x_offset, y_offset
-            )
-
-            # store transformed mesh for downstream processes
-            mesh_df["x_mesh"] = x_mesh
-            mesh_df["y_mesh"] = y_mesh
-            self.transformed_mesh_df = mesh_df
+            # the aligned mesh does not depend on the transect data, thus it
+            # is reused e.g. by each iteration of the bootstrapping analysis
+            lon_aligned, lat = self._get_aligned_mesh()
+
+            distance_params = (self.transect_d_x, self.transect_d_y, x_offset, y_offset)
+
+            # only apply the distance transformation if its parameters changed
+            if (
+                (self.transformed_mesh_df is None)
+                or (self._transformed_mesh_params is None)
+                or (self._transformed_mesh_params[0] is not lon_aligned)
+                or (self._transformed_mesh_params[1:] != distance_params)
+            ):
+
+                x_mesh, y_mesh = self.get_distance_coords(
+                    lon_aligned, lat, *distance_params
+                )
+
+                # store transformed mesh for downstream processes
+                self.transformed_mesh_df = pd.DataFrame(
+                    {
+                        "longitude_transformed": lon_aligned,
+                        "x_mesh": x_mesh,
+                        "y_mesh": y_mesh,
+                    },
+                    index=self.mesh_df.index,
+                )
+
+                self._transformed_mesh_params = (lon_aligned,) + distance_params
         else:
             raise ValueError("Unrecognized coordinate type.")
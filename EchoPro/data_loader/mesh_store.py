@@ -0,0 +1,129 @@
+"""
+Stores the Kriging mesh on disk as a directory containing a single
+NumPy array, which can be memory-mapped instead of parsing the mesh
+Excel file each time it is loaded.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+# the columns of the mesh that are stored
+MESH_STORE_COLUMNS = [
+    "centroid_latitude",
+    "centroid_longitude",
+    "fraction_cell_in_polygon",
+]
+
+# the files of a mesh store
+MESH_ARRAY_FILE = "mesh.npy"
+MESH_METADATA_FILE = "metadata.json"
+
+# the version of the mesh store format, which is increased when the format changes
+MESH_STORE_VERSION = 1
+
+
+def is_mesh_store(path: Union[str, Path]) -> bool:
+    """
+    Determines if a path is a mesh store written by ``save_mesh_store``.
+
+    Parameters
+    ----------
+    path : str or Path
+        The path to check
+
+    Returns
+    -------
+    bool
+        True if ``path`` is a directory containing a mesh store
+    """
+
+    return (Path(path) / MESH_METADATA_FILE).is_file()
+
+
+def save_mesh_store(mesh_df: pd.DataFrame, store_path: Union[str, Path]) -> None:
+    """
+    Writes the columns ``MESH_STORE_COLUMNS`` of a mesh to a mesh store.
+
+    Parameters
+    ----------
+    mesh_df : pd.DataFrame
+        The mesh, which must contain the columns ``MESH_STORE_COLUMNS``
+    store_path : str or Path
+        The directory where the mesh is written, which must not exist
+
+    Notes
+    -----
+    The columns are written as the columns of a single float64 array in
+    Fortran order, so that each column is contiguous in the file. The
+    mesh is first written to a temporary directory, which is then renamed
+    to ``store_path``, so that partially written stores are never loaded.
+    """
+
+    store_path = Path(store_path)
+
+    missing_columns = set(MESH_STORE_COLUMNS) - set(mesh_df.columns)
+    if missing_columns:
+        raise ValueError(
+            f"The mesh does not contain the columns {sorted(missing_columns)}!"
+        )
+
+    if store_path.exists():
+        raise ValueError(f"The mesh store path '{store_path}' already exists!")
+
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = Path(tempfile.mkdtemp(dir=store_path.parent, prefix=".tmp_"))
+
+    try:
+        np.save(
+            tmp_path / MESH_ARRAY_FILE,
+            np.asfortranarray(mesh_df[MESH_STORE_COLUMNS].to_numpy(dtype=np.float64)),
+        )
+
+        with open(tmp_path / MESH_METADATA_FILE, "w") as f:
+            json.dump({"version": MESH_STORE_VERSION, "columns": MESH_STORE_COLUMNS}, f)
+
+        os.rename(tmp_path, store_path)
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+def load_mesh_store(store_path: Union[str, Path], mmap: bool = True) -> pd.DataFrame:
+    """
+    Loads a mesh written by ``save_mesh_store``.
+
+    Parameters
+    ----------
+    store_path : str or Path
+        The directory containing the mesh store
+    mmap : bool
+        If True, the mesh is memory-mapped in read-only mode, thus only
+        the parts of the mesh that are accessed are read from disk
+
+    Returns
+    -------
+    pd.DataFrame
+        The mesh, with the columns ``MESH_STORE_COLUMNS`` and a RangeIndex
+    """
+
+    store_path = Path(store_path)
+
+    with open(store_path / MESH_METADATA_FILE) as f:
+        metadata = json.load(f)
+
+    if metadata.get("version") != MESH_STORE_VERSION:
+        raise ValueError(
+            f"The mesh store '{store_path}' has version {metadata.get('version')}, "
+            f"but version {MESH_STORE_VERSION} is required!"
+        )
+
+    mesh_arr = np.load(store_path / MESH_ARRAY_FILE, mmap_mode="r" if mmap else None)
+
+    # a 2D array is stored by pandas as a single block, thus it is not copied
+    return pd.DataFrame(mesh_arr, columns=metadata["columns"], copy=False)
@@ -1,11 +1,22 @@
 from pathlib import Path
-from typing import Set
+from typing import Optional, Set
 
 import numpy as np
 import pandas as pd
 
 from ..utils.input_checks import check_column_names, check_existence_of_file
 
+# auxiliary NASC columns, and their types, that are not necessary
+# for core routines, but are retained for reports, if they exist, where
+# integer columns are nullable, so that missing values do not prevent loading
+# TODO: these columns names have not been reviewed, should they be changed?
+NASC_AUX_VAR_TYPES = {
+    "Region ID": "Int64",
+    "Bottom depth": np.float64,
+    "Layer mean depth": np.float64,
+    "Layer height": np.float64,
+}
+
 
 def _check_nasc_df(nasc_df: pd.DataFrame, df_path: Path, nasc_cols: Set[str]) -> None:
     """
@@ -27,7 +38,9 @@ def _check_nasc_df(nasc_df: pd.DataFrame, df_path: Path, nasc_cols: Set[str]) ->
     check_column_names(df=nasc_df, expected_names=nasc_cols, path_for_df=df_path)
 
 
-def _process_nasc_data(survey, nasc_var_types: dict) -> pd.DataFrame:
+def _process_nasc_data(
+    survey, nasc_var_types: dict, optional_var_types: Optional[dict] = None
+) -> pd.DataFrame:
     """
     Loads in NASC data from the appropriate Excel file using the
     specified columns. Additionally, sets that data type of the
@@ -40,6 +53,9 @@ def _process_nasc_data(survey, nasc_var_types: dict) -> pd.DataFrame:
     nasc_var_types: dict
         A dictionary with string keys that are the NASC column names to
         grab and values are the types of those columns
+    optional_var_types: dict or None
+        A dictionary of the same form as ``nasc_var_types`` specifying
+        columns that should be grabbed only if they exist in the file
 
     Returns
     -------
@@ -73,6 +89,13 @@ def _process_nasc_data(survey, nasc_var_types: dict) -> pd.DataFrame:
 
     _check_nasc_df(df, file_path, set(nasc_var_types.keys()))
 
+    # add those optional columns that exist
+    if optional_var_types is not None:
+        nasc_var_types = dict(nasc_var_types)
+        for name, var_type in optional_var_types.items():
+            if name in df:
+                nasc_var_types[name] = var_type
+
     # obtaining those columns that are required
     df = df[nasc_var_types.keys()]
 
@@ -101,6 +124,12 @@ def load_nasc_df(survey) -> pd.DataFrame:
     Returns
     -------
     Pandas Dataframe of NASC table.
+
+    Notes
+    -----
+    The auxiliary columns in ``NASC_AUX_VAR_TYPES`` are included in
+    the table, if they exist, so that reports do not need to load the
+    NASC file again.
     """
 
     # specify column names to grab and their corresponding type
@@ -116,7 +145,7 @@ def load_nasc_df(survey) -> pd.DataFrame:
         "haul_num": int,
     }
 
-    df = _process_nasc_data(survey, nasc_var_types)
+    df = _process_nasc_data(survey, nasc_var_types, NASC_AUX_VAR_TYPES)
 
     # set dataframe index
     df.set_index("transect_num", inplace=True)
@@ -0,0 +1,435 @@
+import pathlib
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Union
+
+from .computation import krig_param_type
+from .data_loader import KrigingMesh
+from .reports import REPORT_DEPENDENCIES, Reports
+from .utils.hashing import get_data_files_hash, get_hash
+from .utils.profiler import get_profiler
+
+# all stages of the pipeline and the stages each depends on, where the
+# dependencies of "reports" are determined by the requested reports
+STAGE_DEPENDENCIES = {
+    "load": [],
+    "mesh": [],
+    "transect_results": ["load"],
+    "transformation": ["mesh", "transect_results"],
+    "kriging_results": ["transformation"],
+    "transect_length_age": ["transect_results"],
+    "kriging_length_age": ["kriging_results"],
+    "reports": ["load"],
+}
+
+# stages that can only be ran if Kriging parameters are provided
+KRIGING_STAGES = ["mesh", "transformation", "kriging_results", "kriging_length_age"]
+
+
+class Pipeline:
+    """
+    Runs the stages of a survey analysis, from loading the survey data
+    to writing reports, in the order determined by their dependencies.
+    Stages that do not depend on each other are ran concurrently and
+    stages whose inputs have not changed since they were last ran
+    are not recomputed.
+
+    Parameters
+    ----------
+    survey : Survey
+        An initialized Survey object
+    kriging_params : dict or None
+        Kriging specific parameters (see ``Survey.get_kriging``). If None,
+        the Kriging based stages cannot be ran.
+    selected_transects : list or None
+        The subset of transects used in the calculations
+    transformation_params : dict or None
+        Keyword arguments provided to ``KrigingMesh.apply_coordinate_transformation``
+    report_path : str or pathlib.Path or None
+        The output path where all reports should be saved. If None,
+        the ``"reports"`` stage cannot be ran.
+    reports : list of str or None
+        The names of the reports to create (see ``Reports.create_and_write_reports``)
+    report_format : str or list of str
+        The format(s) the reports should be written in
+    max_workers : int
+        The maximum number of stages that are ran concurrently
+    cache_dir : str or pathlib.Path or None
+        If provided, the directory where transect results are cached
+        (see ``Survey.compute_transect_results``)
+    shared_mesh : KrigingMesh or None
+        If provided, the ``"mesh"`` stage constructs its mesh from the full
+        mesh and smoothed contour of ``shared_mesh``, instead of loading
+        them from the mesh files of ``survey``
+
+    Notes
+    -----
+    Stages are ran by threads and store their results in ``survey`` (and in
+    ``self.krig_mesh`` and ``self.kriging``), thus ``survey`` should not be
+    modified by other routines while the pipeline runs.
+
+    The inputs of each stage are hashed before it is ran. These consist of
+    the survey parameters and the contents of all data files (for the
+    ``"load"`` and ``"mesh"`` stages), the attributes of this object that
+    the stage uses, and the hashes of all stages it depends on. A stage is
+    only ran if its hash differs from the hash of its last successful run,
+    thus changing e.g. ``kriging_params`` and calling ``run`` again only
+    recomputes the Kriging based stages and the reports.
+    """
+
+    def __init__(
+        self,
+        survey,
+        kriging_params: Optional[krig_param_type] = None,
+        selected_transects: Optional[List] = None,
+        transformation_params: Optional[dict] = None,
+        report_path: Optional[Union[str, pathlib.Path]] = None,
+        reports: Optional[List[str]] = None,
+        report_format: Union[str, List[str]] = "excel",
+        max_workers: int = 2,
+        cache_dir: Optional[Union[str, pathlib.Path]] = None,
+        shared_mesh: Optional[KrigingMesh] = None,
+    ):
+
+        self.survey = survey
+        self.kriging_params = kriging_params
+        self.selected_transects = selected_transects
+        self.transformation_params = transformation_params
+        self.report_path = report_path
+        self.reports = reports
+        self.report_format = report_format
+        self.max_workers = max_workers
+        self.cache_dir = cache_dir
+        self.shared_mesh = shared_mesh
+
+        # objects constructed by the stages
+        self.krig_mesh = None
+        self.kriging = None
+
+        # the hash of the last successful run of each stage
+        self._stage_hashes = {}
+
+        # the time, in seconds, taken by each stage ran in the last call to run
+        self.stage_times = {}
+
+    def _get_dependencies(self, stage: str) -> List[str]:
+        """
+        Obtains the stages that ``stage`` depends on.
+
+        Parameters
+        ----------
+        stage: str
+            The name of the stage
+
+        Returns
+        -------
+        list of str
+            The names of the stages ``stage`` depends on
+        """
+
+        if stage == "reports":
+            report_names = (
+                list(REPORT_DEPENDENCIES.keys())
+                if self.reports is None
+                else self.reports
+            )
+            return STAGE_DEPENDENCIES[stage] + Reports._get_required_results(
+                report_names
+            )
+
+        return STAGE_DEPENDENCIES[stage]
+
+    def _get_stage_inputs(self, stage: str) -> list:
+        """
+        Obtains the inputs of ``stage`` that are used to construct its hash,
+        excluding the stages it depends on.
+
+        Parameters
+        ----------
+        stage: str
+            The name of the stage
+
+        Returns
+        -------
+        list
+            The inputs of the stage
+        """
+
+        if stage in ["load", "mesh"]:
+            return [self.survey.params, get_data_files_hash(self.survey.params)]
+        elif stage == "transect_results":
+            return [self.selected_transects]
+        elif stage == "transformation":
+            return [self.transformation_params]
+        elif stage == "kriging_results":
+            return [self.kriging_params]
+        elif stage == "reports":
+            return [str(self.report_path), self.reports, self.report_format]
+
+        return []
+
+    def _check_stage(self, stage: str) -> None:
+        """
+        Ensures that ``stage`` exists and that the parameters it needs were provided.
+
+        Parameters
+        ----------
+        stage: str
+            The name of the stage
+        """
+
+        if stage not in STAGE_DEPENDENCIES:
+            raise ValueError(
+                f"The stage '{stage}' does not exist, stages must be one of "
+                f"{list(STAGE_DEPENDENCIES.keys())}!"
+            )
+
+        if (stage in KRIGING_STAGES) and (self.kriging_params is None):
+            raise ValueError(
+                f"kriging_params must be provided to run the stage '{stage}'!"
+            )
+
+        if (stage == "reports") and (self.report_path is None):
+            raise ValueError("report_path must be provided to run the stage 'reports'!")
+
+    def _get_stages(self, targets: List[str]) -> List[str]:
+        """
+        Obtains all stages needed to run ``targets``.
+
+        Parameters
+        ----------
+        targets: list of str
+            The names of the requested stages
+
+        Returns
+        -------
+        stages: list of str
+            The requested stages and all stages they depend on,
+            where each stage is placed after its dependencies
+        """
+
+        stages = []
+
+        def add_stage(stage: str) -> None:
+            if stage not in stages:
+                self._check_stage(stage)
+                for dependency in self._get_dependencies(stage):
+                    add_stage(dependency)
+                stages.append(stage)
+
+        for target in targets:
+            add_stage(target)
+
+        return stages
+
+    def _get_default_targets(self) -> List[str]:
+        """
+        Obtains all stages that can be ran with the provided parameters.
+
+        Returns
+        -------
+        list of str
+            The names of the stages
+        """
+
+        targets = ["load", "transect_results", "transect_length_age"]
+
+        if self.kriging_params is not None:
+            targets += ["kriging_results", "kriging_length_age"]
+
+        if self.report_path is not None:
+            targets.append("reports")
+
+        return targets
+
+    def _run_stage(self, stage: str) -> None:
+        """
+        Runs a single stage, assuming all stages it depends on have been ran.
+
+        Parameters
+        ----------
+        stage: str
+            The name of the stage
+        """
+
+        if stage == "load":
+            self.survey.load_survey_data()
+
+        elif stage == "mesh":
+            if self.shared_mesh is None:
+                self.krig_mesh = self.survey.get_kriging_mesh()
+            else:
+                self.krig_mesh = self.survey.get_kriging_mesh(
+                    self.shared_mesh.mesh_df, self.shared_mesh.smoothed_contour_gdf
+                )
+
+        elif stage == "transect_results":
+            self.survey.compute_transect_results(
+                self.selected_transects, cache_dir=self.cache_dir
+            )
+
+        elif stage == "transformation":
+            transformation_params = self.transformation_params or {}
+            self.krig_mesh.apply_coordinate_transformation(
+                coord_type="transect", **transformation_params
+            )
+            self.krig_mesh.apply_coordinate_transformation(
+                coord_type="mesh", **transformation_params
+            )
+
+        elif stage == "kriging_results":
+            self.kriging = self.survey.get_kriging(self.kriging_params)
+            self.kriging.run_biomass_kriging(self.krig_mesh)
+            self.kriging.compute_kriging_variables()
+
+        elif stage == "transect_length_age":
+            self.survey.compute_length_age_variables(data="transect")
+
+        elif stage == "kriging_length_age":
+            self.survey.compute_length_age_variables(data="kriging")
+
+        else:
+            self.survey.create_and_write_reports(
+                self.report_path, format=self.report_format, reports=self.reports
+            )
+
+    def _invalidate_downstream(self, stages: List[str]) -> None:
+        """
+        Removes the hash of ``stages`` and of all stages that depend on
+        them, since their results are replaced when ``stages`` are ran.
+
+        Parameters
+        ----------
+        stages: list of str
+            The names of the stages that will be ran
+        """
+
+        invalid = set(stages)
+
+        # "reports" may depend on any stage
+        invalid.add("reports")
+
+        changed = True
+        while changed:
+            changed = False
+            for stage, dependencies in STAGE_DEPENDENCIES.items():
+                if (stage not in invalid) and invalid.intersection(dependencies):
+                    invalid.add(stage)
+                    changed = True
+
+        for stage in invalid:
+            self._stage_hashes.pop(stage, None)
+
+    def get_stage_hashes(self, targets: Optional[List[str]] = None) -> Dict[str, str]:
+        """
+        Constructs the hash of all stages needed to run ``targets``.
+
+        Parameters
+        ----------
+        targets: list of str or None
+            The names of the requested stages. If None, all stages
+            that can be ran with the provided parameters are used.
+
+        Returns
+        -------
+        stage_hashes: dict
+            The hash of each stage, in the order the stages would be ran
+        """
+
+        if targets is None:
+            targets = self._get_default_targets()
+
+        stage_hashes = {}
+        for stage in self._get_stages(targets):
+            stage_hashes[stage] = get_hash(
+                stage,
+                self._get_stage_inputs(stage),
+                [
+                    stage_hashes[dependency]
+                    for dependency in self._get_dependencies(stage)
+                ],
+            )
+
+        return stage_hashes
+
+    def run(self, targets: Optional[List[str]] = None) -> List[str]:
+        """
+        Runs the requested stages and all stages they depend on, skipping
+        those stages whose inputs have not changed since their last run.
+
+        Parameters
+        ----------
+        targets: list of str or None
+            The names of the requested stages, which must be keys of
+            ``STAGE_DEPENDENCIES``. If None, all stages that can be ran
+            with the provided parameters are ran.
+
+        Returns
+        -------
+        stages_ran: list of str
+            The names of the stages that were ran, in the order they finished
+        """
+
+        stage_hashes = self.get_stage_hashes(targets)
+
+        # determine the stages that need to be ran
+        remaining = [
+            stage
+            for stage, stage_hash in stage_hashes.items()
+            if self._stage_hashes.get(stage) != stage_hash
+        ]
+        self._invalidate_downstream(remaining)
+
+        finished = [stage for stage in stage_hashes if stage not in remaining]
+        stages_ran = []
+        self.stage_times = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+
+            running = {}
+            while remaining or running:
+
+                # submit all stages whose dependencies have finished
+                for stage in [
+                    stage
+                    for stage in remaining
+                    if all(dep in finished for dep in self._get_dependencies(stage))
+                ]:
+                    remaining.remove(stage)
+                    running[executor.submit(self._time_stage, stage)] = stage
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    stage = running.pop(future)
+
+                    # raise any errors that occurred in the stage
+                    self.stage_times[stage] = future.result()
+
+                    self._stage_hashes[stage] = stage_hashes[stage]
+                    finished.append(stage)
+                    stages_ran.append(stage)
+
+        return stages_ran
+
+    def _time_stage(self, stage: str) -> float:
+        """
+        Runs a single stage and times it.
+
+        Parameters
+        ----------
+        stage: str
+            The name of the stage
+
+        Returns
+        -------
+        float
+            The time, in seconds, taken by the stage
+        """
+
+        start_time = time.perf_counter()
+
+        with get_profiler(self.survey).section(stage):
+            self._run_stage(stage)
+
+        return time.perf_counter() - start_time
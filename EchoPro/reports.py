@@ -1,13 +1,312 @@
+import json
+import multiprocessing
+import os
 import pathlib
-from typing import List, Tuple, Union
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple, Union
 
 import geopandas as gpd
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
 
 from .computation import ComputeTransectVariables
-from .data_loader.nasc_data import _process_nasc_data
-from .utils.binning import get_bin_ind
+from .data_loader.nasc_data import NASC_AUX_VAR_TYPES
+from .utils.binning import get_bin_codes
+from .utils.profiler import get_profiler
+
+# the number of rows converted to Python objects at once when writing Excel sheets
+EXCEL_CHUNK_ROWS = 10000
+
+
+def _get_excel_rows(ws, df: pd.DataFrame, include_index: bool) -> Iterator[list]:
+    """
+    Obtains the rows of an Excel sheet that contains ``df``, using
+    the same layout as ``pd.DataFrame.to_excel``. The rows are converted
+    to Python objects in chunks of ``EXCEL_CHUNK_ROWS`` rows.
+
+    Parameters
+    ----------
+    ws: openpyxl.worksheet._write_only.WriteOnlyWorksheet
+        The sheet the rows will be appended to
+    df: pd.DataFrame
+        The DataFrame to write to the sheet
+    include_index: bool
+        If True, the index will be included in the sheet, else it won't be
+
+    Returns
+    -------
+    Iterator[list]
+        The header row followed by a row for each row in ``df``
+    """
+
+    header_font = Font(bold=True)
+
+    def header_cell(val):
+        cell = WriteOnlyCell(ws, value=val)
+        cell.font = header_font
+        return cell
+
+    # header containing the index name and column names
+    header = [header_cell(col) for col in df.columns]
+    if include_index:
+        header = [header_cell(df.index.name)] + header
+    yield header
+
+    for start in range(0, len(df), EXCEL_CHUNK_ROWS):
+        df_chunk = df.iloc[start : start + EXCEL_CHUNK_ROWS]
+
+        # obtain the values of each column of the chunk, with missing and
+        # infinite values written in the same way as pd.DataFrame.to_excel
+        columns = []
+        for _, col in df_chunk.items():
+            vals = col.to_numpy(dtype=object)
+            vals[col.isna().to_numpy()] = None
+            if pd.api.types.is_float_dtype(col.dtype):
+                vals[np.isposinf(col.values)] = "inf"
+                vals[np.isneginf(col.values)] = "-inf"
+            columns.append(vals)
+
+        if include_index:
+            for ind, row in zip(df_chunk.index, zip(*columns)):
+                yield [header_cell(ind)] + list(row)
+        else:
+            for row in zip(*columns):
+                yield list(row)
+
+
+def _write_excel_file(
+    excel_path: pathlib.Path,
+    df_list: List[pd.DataFrame],
+    sheet_name_list: List[str],
+    include_index: bool = True,
+) -> None:
+    """
+    Writes a list of DataFrames to an Excel file, where each DataFrame
+    is streamed in chunks of rows into a write-only workbook, so that the
+    memory used by the writer does not grow with the number of rows.
+
+    Parameters
+    ----------
+    excel_path: pathlib.Path
+        The path to the Excel file where data should be written
+    df_list: list of pd.DataFrame
+        A list of DataFrames to write to the Excel file
+    sheet_name_list: list of str
+        A list of sheet names corresponding to ``df_list``
+    include_index: bool, default=True
+        If True, the index will be included in the Excel sheet, else it won't be
+    """
+
+    wb = Workbook(write_only=True)
+
+    for df, sheet_name in zip(df_list, sheet_name_list):
+        ws = wb.create_sheet(title=sheet_name)
+
+        for row in _get_excel_rows(ws, df, include_index):
+            ws.append(row)
+
+    wb.save(excel_path)
+
+
+# file extension of each columnar report format
+COLUMNAR_EXTENSIONS = {"parquet": "parquet", "arrow": "arrow"}
+
+# all formats that reports can be written in
+REPORT_FORMATS = ["excel"] + list(COLUMNAR_EXTENSIONS.keys())
+
+
+def _get_columnar_table(df: pd.DataFrame, include_index: bool) -> pa.Table:
+    """
+    Constructs an Arrow Table that contains ``df``, where the
+    index is stored as the first column, if requested.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        The DataFrame to convert
+    include_index: bool
+        If True, the index will be included as a column, else it won't be
+
+    Returns
+    -------
+    pa.Table
+        A Table with string column names and a single type for each column
+
+    Notes
+    -----
+    Object columns that contain a mixture of types (e.g. the length bins
+    and the ``length_haul_total`` row of the length-haul count reports)
+    are stored as strings.
+    """
+
+    if include_index:
+        df = df.reset_index()
+
+    df = df.rename(columns=str)
+
+    # Arrow columns can only have one type
+    for name, col in df.items():
+        if (col.dtype == object) and (pd.api.types.infer_dtype(col) != "string"):
+            df[name] = col.astype(str)
+
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def _write_columnar_files(
+    excel_path: pathlib.Path,
+    df_list: List[pd.DataFrame],
+    sheet_name_list: List[str],
+    include_index: bool,
+    report_format: str,
+) -> List[dict]:
+    """
+    Writes each DataFrame of a report to a separate Parquet or Arrow IPC
+    file. The files are placed in a directory with the same name as the
+    Excel file of the report, without the suffix.
+
+    Parameters
+    ----------
+    excel_path: pathlib.Path
+        The path to the Excel file of the report
+    df_list: list of pd.DataFrame
+        A list of DataFrames to write
+    sheet_name_list: list of str
+        A list of sheet names corresponding to ``df_list``, which
+        are used to name each file
+    include_index: bool
+        If True, the index will be included as a column, else it won't be
+    report_format: {"parquet", "arrow"}
+        The format of the files
+
+    Returns
+    -------
+    list of dict
+        The manifest entry of each file written
+    """
+
+    report_path = excel_path.with_suffix("")
+    report_path.mkdir(parents=True, exist_ok=True)
+
+    entries = []
+    for df, sheet_name in zip(df_list, sheet_name_list):
+        table = _get_columnar_table(df, include_index)
+
+        table_name = sheet_name.lower().replace(" ", "_")
+        file_path = report_path / f"{table_name}.{COLUMNAR_EXTENSIONS[report_format]}"
+
+        if report_format == "parquet":
+            pq.write_table(table, file_path)
+        else:
+            feather.write_feather(table, file_path, compression="uncompressed")
+
+        entries.append(
+            {
+                "report": report_path.name,
+                "table": table_name,
+                "sheet_name": sheet_name,
+                "format": report_format,
+                "path": f"{report_path.name}/{file_path.name}",
+                "num_rows": table.num_rows,
+                "columns": [
+                    {"name": field.name, "type": str(field.type)}
+                    for field in table.schema
+                ],
+            }
+        )
+
+    return entries
+
+
+def _write_report_files(
+    excel_path: pathlib.Path,
+    df_list: List[pd.DataFrame],
+    sheet_name_list: List[str],
+    include_index: bool,
+    formats: List[str],
+) -> List[dict]:
+    """
+    Writes a report in all requested formats.
+
+    Parameters
+    ----------
+    excel_path: pathlib.Path
+        The path to the Excel file of the report
+    df_list: list of pd.DataFrame
+        A list of DataFrames to write
+    sheet_name_list: list of str
+        A list of sheet names corresponding to ``df_list``
+    include_index: bool
+        If True, the index will be included in the output, else it won't be
+    formats: list of str
+        The formats the report should be written in, which
+        must be contained in ``REPORT_FORMATS``
+
+    Returns
+    -------
+    list of dict
+        The manifest entry of each columnar file written
+    """
+
+    entries = []
+    for report_format in formats:
+        if report_format == "excel":
+            _write_excel_file(excel_path, df_list, sheet_name_list, include_index)
+        else:
+            entries += _write_columnar_files(
+                excel_path, df_list, sheet_name_list, include_index, report_format
+            )
+
+    return entries
+
+
+def _write_report_files_in_worker(*args) -> Tuple[List[dict], float]:
+    """
+    Writes a report in a worker process using ``_write_report_files``.
+
+    Returns
+    -------
+    entries: list of dict
+        The manifest entry of each columnar file written
+    duration: float
+        The time, in seconds, taken to write the report
+    """
+
+    start_time = time.perf_counter()
+    entries = _write_report_files(*args)
+
+    return entries, time.perf_counter() - start_time
+
+
+# survey results that reports can depend on, and
+# the results that must exist before each can be computed
+RESULT_DEPENDENCIES = {
+    "transect_results": [],
+    "kriging_results": ["transect_results"],
+    "transect_length_age": ["transect_results"],
+    "kriging_length_age": ["kriging_results"],
+}
+
+# all reports that can be created, and the survey results each depends on
+REPORT_DEPENDENCIES = {
+    "transect_based_aged_output": ["transect_results"],
+    "kriging_based_aged_output": ["kriging_results"],
+    "transect_based_core_output": ["transect_results"],
+    "kriging_based_core_output": ["kriging_results"],
+    "kriging_input": ["transect_results"],
+    "length_counts_haul": [],
+    "transect_based_len_age_abundance": ["transect_length_age"],
+    "kriging_based_len_age_abundance": ["kriging_length_age"],
+    "transect_based_len_age_biomass": ["transect_length_age"],
+    "kriging_based_len_age_biomass": ["kriging_length_age"],
+}
 
 
 class Reports:
@@ -27,27 +326,41 @@ class Reports:
         self.survey = survey
         self.eps = 2.22044604925031e-16
 
-    def _get_bin_count(
-        self, df: pd.DataFrame, haul: int, len_cnt_exists: bool
+        # the state of the report writer set up by ``_report_file_writer``
+        self._formats = ["excel"]
+        self._executor = None
+        self._max_pending = 1
+        self._pending_report_files = []
+        self._manifest_entries = []
+        self._worker_durations = []
+
+    def _get_len_haul_counts(
+        self,
+        df: pd.DataFrame,
+        all_hauls: np.ndarray,
+        length_count: Optional[np.ndarray],
     ) -> np.ndarray:
         """
-        Obtains the number of animals in each length bin for the
-        given length data in ``df`` and provided ``haul``.
+        Obtains the number of animals in each length bin and haul for all
+        genders, males, and females, using a single ``np.bincount`` on a
+        combined (gender, length bin, haul) key.
 
         Parameters
         ----------
         df: pd.DataFrame
             A DataFrame corresponding to either the length or specimen data, which
-            has the haul as its index
-        haul: int
-            The haul number
-        len_cnt_exists: bool
-            If True, ``df`` contains ``length_count``, otherwise it does not
+            has the haul as its index and contains the ``length`` and ``sex`` columns
+        all_hauls: np.ndarray
+            All sorted haul numbers, which must contain the hauls in ``df``
+        length_count: np.ndarray or None
+            The number of animals corresponding to each row of ``df``. If None,
+            each row corresponds to one animal.
 
         Returns
         -------
         bin_cnt: np.ndarray
-            The number of animals in each bin
+            An int64 array of shape (3, number of length bins, number of hauls),
+            where the first dimension corresponds to all genders, males, and females
 
         Notes
         -----
@@ -55,110 +368,39 @@ class Reports:
         ``self.survey.params["bio_hake_len_bin"]``.
         """
 
-        # obtain length data
-        length_data = df.loc[haul]["length"]
-
-        if len_cnt_exists:
-            # obtain length count data
-            length_count_data = df.loc[haul]["length_count"]
-
-        # get numpy arrays of data accounting for single values
-        if not isinstance(length_data, pd.Series):
-            length_data = np.array([length_data])
-            if len_cnt_exists:
-                length_count_data = np.array([length_count_data])
-
-        else:
-            length_data = length_data.values.flatten()
-            if len_cnt_exists:
-                length_count_data = length_count_data.values.flatten()
-
-        # get bin indices of length data
-        len_bin_ind = get_bin_ind(length_data, self.survey.params["bio_hake_len_bin"])
-
-        # get total number of lengths in a bin
-        if len_cnt_exists:
-            bin_cnt = np.array([length_count_data[i].sum() for i in len_bin_ind])
-        else:
-            bin_cnt = np.array([i.shape[0] for i in len_bin_ind])
-
-        return bin_cnt
-
-    def _bin_len_by_haul_df(
-        self,
-        all_hauls: np.ndarray,
-        df_len: pd.DataFrame,
-        len_uniq_haul: np.ndarray,
-        df_spec: pd.DataFrame,
-        spec_uniq_haul: np.ndarray,
-    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        """
-        For each haul in ``haul_nums`` bin the length data
-        contained the provided DataFrames.
-
-        Parameters
-        ----------
-        all_hauls: np.ndarray
-            All haul numbers that should be included (will be columns
-            of returned DataFrames)
-        df_len: pd.DataFrame
-            A DataFrame corresponding to the length data (must contain
-            ``length`` and ``length_counts`` columns)
-        len_uniq_haul: np.ndarray
-            All unique haul numbers in ``df_len``
-        df_spec: pd.DataFrame
-            A DataFrame corresponding to the specimen data (must contain
-            the ``length`` column)
-        spec_uniq_haul: np.ndarray
-            All unique haul numbers in ``df_spec``
-
-        Returns
-        -------
-        len_bin_haul_df: pd.DataFrame
-            A DataFrame containing the number of animals in each length bin
-            and haul for the length data
-        spec_bin_haul_df: pd.DataFrame
-            A DataFrame containing the number of animals in each length bin
-            and haul for the specimen data
-        """
+        num_len_bins = len(self.survey.params["bio_hake_len_bin"])
+        num_cells = num_len_bins * len(all_hauls)
 
-        # DataFrame containing the length bin data for each haul
-        len_bin_haul_df = pd.DataFrame(
-            data=0,
-            columns=list(all_hauls),
-            index=self.survey.params["bio_hake_len_bin"],
-            dtype=np.int64,
+        # get the length bin and haul codes of the data, excluding missing lengths
+        len_bin_codes = get_bin_codes(
+            df["length"].values, self.survey.params["bio_hake_len_bin"]
         )
-
-        # DataFrame containing the specimen bin data for each haul
-        spec_bin_haul_df = pd.DataFrame(
-            data=0,
-            columns=list(all_hauls),
-            index=self.survey.params["bio_hake_len_bin"],
-            dtype=np.int64,
+        has_len = len_bin_codes >= 0
+        cell_codes = len_bin_codes[has_len] * len(all_hauls) + np.searchsorted(
+            all_hauls, df.index.values[has_len]
+        )
+        sex = df["sex"].values[has_len]
+
+        # all data is counted for all genders and males and females
+        # are additionally counted in their own block of the key
+        keys = [cell_codes]
+        weights = None if length_count is None else [length_count[has_len]]
+        for block, sex_val in [(1, 1), (2, 2)]:
+            is_sex = sex == sex_val
+            keys.append(cell_codes[is_sex] + block * num_cells)
+            if length_count is not None:
+                weights.append(weights[0][is_sex])
+
+        bin_cnt = np.bincount(
+            np.concatenate(keys),
+            weights=None if weights is None else np.concatenate(weights),
+            minlength=3 * num_cells,
         )
 
-        # name index
-        len_bin_haul_df.index.name = "length_bin"
-        spec_bin_haul_df.index.name = "length_bin"
-
-        for haul in all_hauls:
-
-            if haul in len_uniq_haul:
-                # get the number of animals in each length bin
-                len_bin_cnt = self._get_bin_count(df_len, haul, len_cnt_exists=True)
-
-                # store data
-                len_bin_haul_df[haul] = len_bin_cnt
-
-            if haul in spec_uniq_haul:
-                # get the number of animals in each length bin
-                len_bin_cnt = self._get_bin_count(df_spec, haul, len_cnt_exists=False)
-
-                # store data
-                spec_bin_haul_df[haul] = len_bin_cnt
+        # weighted counts are floats, but the number of animals is an integer
+        bin_cnt = bin_cnt.astype(np.int64)
 
-        return len_bin_haul_df, spec_bin_haul_df
+        return bin_cnt.reshape((3, num_len_bins, len(all_hauls)))
 
     def _bin_len_by_haul_all_dfs(
         self,
@@ -210,44 +452,30 @@ class Reports:
         # get all haul numbers
         all_hauls = np.union1d(len_uniq_haul, spec_uniq_haul)
 
-        # get binned lengths at each haul for all data
-        len_haul_all_df, spec_haul_all_df = self._bin_len_by_haul_df(
-            all_hauls, len_df, len_uniq_haul, spec_df, spec_uniq_haul
-        )
-
-        # get DataFrame values corresponding to males
-        len_df_male = len_df[len_df["sex"] == 1]
-        spec_df_male = spec_df[spec_df["sex"] == 1]
-
-        # get binned lengths at each haul for data corresponding to males
-        len_haul_all_df_male, spec_haul_all_df_male = self._bin_len_by_haul_df(
-            all_hauls,
-            len_df_male,
-            len_df_male.index.unique().values,
-            spec_df_male,
-            spec_df_male.index.unique().values,
+        # get binned lengths at each haul for all genders, males, and females
+        len_bin_cnt = self._get_len_haul_counts(
+            len_df, all_hauls, len_df["length_count"].values
         )
+        spec_bin_cnt = self._get_len_haul_counts(spec_df, all_hauls, None)
+
+        # constructs a DataFrame containing the length bin data for each haul
+        def get_len_haul_df(bin_cnt: np.ndarray) -> pd.DataFrame:
+            df = pd.DataFrame(
+                data=bin_cnt,
+                columns=list(all_hauls),
+                index=self.survey.params["bio_hake_len_bin"],
+            )
+            df.index.name = "length_bin"
 
-        # get DataFrame values corresponding to males
-        len_df_female = len_df[len_df["sex"] == 2]
-        spec_df_female = spec_df[spec_df["sex"] == 2]
-
-        # get binned lengths at each haul for data corresponding to females
-        len_haul_all_df_female, spec_haul_all_df_female = self._bin_len_by_haul_df(
-            all_hauls,
-            len_df_female,
-            len_df_female.index.unique().values,
-            spec_df_female,
-            spec_df_female.index.unique().values,
-        )
+            return df
 
         return (
-            len_haul_all_df,
-            spec_haul_all_df,
-            len_haul_all_df_male,
-            spec_haul_all_df_male,
-            len_haul_all_df_female,
-            spec_haul_all_df_female,
+            get_len_haul_df(len_bin_cnt[0]),
+            get_len_haul_df(spec_bin_cnt[0]),
+            get_len_haul_df(len_bin_cnt[1]),
+            get_len_haul_df(spec_bin_cnt[1]),
+            get_len_haul_df(len_bin_cnt[2]),
+            get_len_haul_df(spec_bin_cnt[2]),
         )
 
     @staticmethod
@@ -277,36 +505,148 @@ class Reports:
             df["length_bin_total"] = bin_total
             df.loc["length_haul_total"] = haul_total
 
-    @staticmethod
-    def _write_dfs_to_excel(
+    @contextmanager
+    def _report_file_writer(
+        self, formats: List[str], max_workers: Optional[int]
+    ) -> Iterator[None]:
+        """
+        Sets up the writing of the reports added by ``_add_report_file``
+        within this context.
+
+        Parameters
+        ----------
+        formats: list of str
+            The formats the reports should be written in
+        max_workers: int or None
+            The maximum number of processes used to write the files. If 1,
+            the files are written by the current process. If None, the
+            number of processors on the machine is used.
+
+        Notes
+        -----
+        Worker processes are started with the ``spawn`` method, which is
+        available on all platforms and, unlike ``fork``, is safe to use
+        with the Numba parallel kernels used by EchoPro.
+        """
+
+        self._formats = formats
+        self._manifest_entries = []
+        self._pending_report_files = []
+        self._worker_durations = []
+
+        try:
+            if max_workers == 1:
+                yield
+            else:
+                self._max_pending = max_workers or os.cpu_count() or 1
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                ) as self._executor:
+                    yield
+        finally:
+            self._executor = None
+            self._pending_report_files = []
+
+    def _add_report_file(
+        self,
         df_list: List[pd.DataFrame],
         sheet_name_list: List[str],
         excel_path: pathlib.Path,
         include_index: bool = True,
     ) -> None:
         """
-        Writes a list of DataFrames to an Excel file using a
-        provided output path and associated sheet name.
+        Writes a list of DataFrames, with their associated sheet names, to
+        a report in each of the formats given to ``_report_file_writer``.
 
         Parameters
         ----------
         df_list: list of pd.DataFrame
-            A list of DataFrames to write to the Excel file
+            A list of DataFrames to write to the report
         sheet_name_list: list of str
             A list of sheet names corresponding to ``df_list``
         excel_path: pathlib.Path
-            The path to the Excel file where data should be written
+            The path to the Excel file where data should be written. The
+            columnar files of the report are named after this path.
         include_index: bool, default=True
-            If True, the index will be included in the Excel sheet, else it won't be
+            If True, the index will be included in the report, else it won't be
+
+        Notes
+        -----
+        The report is written as soon as its DataFrames are constructed, so
+        that they are not kept until all reports are constructed. If worker
+        processes are used, the report is submitted to them and at most one
+        report per worker is held at a time, where this waits for the oldest
+        report to be written once that limit is reached.
         """
 
-        # write DataFrames to Excel sheet
-        with pd.ExcelWriter(excel_path) as writer:
+        report_file = (
+            excel_path,
+            df_list,
+            sheet_name_list,
+            include_index,
+            self._formats,
+        )
+
+        if self._executor is None:
+            with get_profiler(self.survey).section(f"write_{excel_path.stem}"):
+                self._manifest_entries += _write_report_files(*report_file)
+        else:
+            if len(self._pending_report_files) >= self._max_pending:
+                self._collect_report_file()
 
-            for i in range(len(df_list)):
-                df_list[i].to_excel(
-                    writer, sheet_name=sheet_name_list[i], index=include_index
+            self._pending_report_files.append(
+                (
+                    excel_path.stem,
+                    self._executor.submit(_write_report_files_in_worker, *report_file),
                 )
+            )
+
+    def _collect_report_file(self) -> None:
+        """
+        Waits for the oldest report submitted to the worker processes to be
+        written, raising any error that occurred when writing it.
+        """
+
+        report_name, future = self._pending_report_files.pop(0)
+        entries, duration = future.result()
+
+        self._manifest_entries += entries
+        self._worker_durations.append((report_name, duration))
+
+    def _finish_report_files(self, output_path: pathlib.Path) -> None:
+        """
+        Waits for all reports added by ``_add_report_file`` to be written. If
+        a columnar format is requested, a manifest describing all columnar
+        files is written to ``output_path / "manifest.json"``.
+
+        Parameters
+        ----------
+        output_path: pathlib.Path
+            The output path where all files are saved
+
+        Notes
+        -----
+        The time taken by a worker process to write each report is recorded
+        by the survey profiler within the section opened by the caller.
+        """
+
+        while self._pending_report_files:
+            self._collect_report_file()
+
+        profiler = get_profiler(self.survey)
+        for report_name, duration in self._worker_durations:
+            profiler.add_record(f"write_{report_name}", duration)
+
+        # describe the tables of all columnar files
+        if any(report_format in COLUMNAR_EXTENSIONS for report_format in self._formats):
+            manifest = {
+                "survey_year": self.survey.params["survey_year"],
+                "tables": self._manifest_entries,
+            }
+
+            with open(output_path / "manifest.json", "w") as f:
+                json.dump(manifest, f, indent=2)
 
     def _write_biomass_ages_report(
         self,
@@ -361,15 +701,12 @@ class Reports:
             results_female[wanted_columns],
         ]
         sheet_names = ["all genders", "male", "female"]
-        self._write_dfs_to_excel(df_list, sheet_names, output_excel_path_all)
+        self._add_report_file(df_list, sheet_names, output_excel_path_all)
 
         # write only output corresponding to non-zero biomass values
-        df_list = [
-            results[results["biomass_adult"] != 0.0][wanted_columns],
-            results_male[results["biomass_adult"] != 0.0][wanted_columns],
-            results_female[results["biomass_adult"] != 0.0][wanted_columns],
-        ]
-        self._write_dfs_to_excel(df_list, sheet_names, output_excel_path_non_zero)
+        non_zero = (results["biomass_adult"] != 0.0).values
+        df_list = [df[non_zero] for df in df_list]
+        self._add_report_file(df_list, sheet_names, output_excel_path_non_zero)
 
     def _transect_based_core_variables_report(
         self,
@@ -390,19 +727,18 @@ class Reports:
             biomass should be saved
         """
 
-        # specify column names to grab and their corresponding type
-        # TODO: these columns names have not been reviewed, should they be changed?
-        nasc_var_types = {
-            "Region ID": int,
-            "Bottom depth": np.float64,
-            "Layer mean depth": np.float64,
-            "Layer height": np.float64,
-        }
-
         # obtain NASC data that was not necessary for core routines
-        extra_nasc_df = _process_nasc_data(self.survey, nasc_var_types).set_index(
-            self.survey.bio_calc.nasc_df.index
+        missing_columns = set(NASC_AUX_VAR_TYPES) - set(
+            self.survey.bio_calc.nasc_df.columns
         )
+        if missing_columns:
+            raise RuntimeError(
+                "The NASC data does not contain the following columns, which are "
+                f"needed for the Transect based core variables report: {missing_columns}"
+            )
+        extra_nasc_df = self.survey.bio_calc.nasc_df[
+            list(NASC_AUX_VAR_TYPES.keys())
+        ].astype({"Region ID": "Int64"})
 
         # set variables to improve readability
         transect_results = self.survey.bio_calc.transect_results_gdf
@@ -510,13 +846,13 @@ class Reports:
         ]
 
         # write all results to Excel file
-        df_list = [final_df[ordered_columns]]
+        final_df = final_df[ordered_columns]
         sheet_names = ["Sheet1"]
-        self._write_dfs_to_excel(df_list, sheet_names, output_excel_path_all)
+        self._add_report_file([final_df], sheet_names, output_excel_path_all)
 
         # write only output corresponding to non-zero NASC values
-        df_list = [final_df[final_df["biomass_adult"] > self.eps][ordered_columns]]
-        self._write_dfs_to_excel(df_list, sheet_names, output_excel_path_non_zero)
+        df_list = [final_df[final_df["biomass_adult"] > self.eps]]
+        self._add_report_file(df_list, sheet_names, output_excel_path_non_zero)
 
     def _len_haul_count_reports(
         self,
@@ -563,7 +899,7 @@ class Reports:
         # write the reports corresponding to the specimen data to Excel file
         df_list = [spec_haul_all_df, spec_haul_all_df_male, spec_haul_all_df_female]
         sheet_names = ["all genders", "male", "female"]
-        self._write_dfs_to_excel(df_list, sheet_names, output_excel_path_specimen)
+        self._add_report_file(df_list, sheet_names, output_excel_path_specimen)
 
         # combine results for length and specimen data
         total_haul_all_df = len_haul_all_df + spec_haul_all_df
@@ -572,7 +908,7 @@ class Reports:
 
         # write the reports corresponding to the specimen and length data to Excel file
         df_list = [total_haul_all_df, total_haul_male_df, total_haul_female_df]
-        self._write_dfs_to_excel(df_list, sheet_names, output_excel_path_total)
+        self._add_report_file(df_list, sheet_names, output_excel_path_total)
 
     def _len_age_abundance_report(
         self, output_excel_path: pathlib.Path, kriging_based: bool
@@ -610,7 +946,7 @@ class Reports:
         sheet_names = ["all genders", "male", "female"]
 
         # write the reports corresponding to the specimen data to Excel file
-        self._write_dfs_to_excel(df_list, sheet_names, output_excel_path)
+        self._add_report_file(df_list, sheet_names, output_excel_path)
 
     def _len_age_biomass_report(
         self, output_excel_path: pathlib.Path, kriging_based: bool
@@ -648,7 +984,7 @@ class Reports:
         sheet_names = ["all genders", "male", "female"]
 
         # write the reports corresponding to the specimen data to Excel file
-        self._write_dfs_to_excel(df_list, sheet_names, output_excel_path)
+        self._add_report_file(df_list, sheet_names, output_excel_path)
 
     def _kriging_based_core_variables_report(
         self,
@@ -722,15 +1058,15 @@ class Reports:
         ]
 
         # write all results to Excel file
-        df_list = [final_df[ordered_columns]]
+        final_df = final_df[ordered_columns]
         sheet_names = ["Sheet1"]
-        self._write_dfs_to_excel(
-            df_list, sheet_names, output_excel_path_all, include_index=False
+        self._add_report_file(
+            [final_df], sheet_names, output_excel_path_all, include_index=False
         )
 
         # write only output corresponding to non-zero NASC values
-        df_list = [final_df[final_df["biomass_adult"] > self.eps][ordered_columns]]
-        self._write_dfs_to_excel(
+        df_list = [final_df[final_df["biomass_adult"] > self.eps]]
+        self._add_report_file(
             df_list, sheet_names, output_excel_path_non_zero, include_index=False
         )
 
@@ -758,23 +1094,120 @@ class Reports:
         # write all results to Excel file
         df_list = [final_df]
         sheet_names = ["Sheet1"]
-        self._write_dfs_to_excel(
+        self._add_report_file(
             df_list, sheet_names, output_excel_path, include_index=False
         )
 
+    @staticmethod
+    def _get_required_results(report_names: List[str]) -> List[str]:
+        """
+        Obtains all survey results needed to create the provided reports.
+
+        Parameters
+        ----------
+        report_names: list of str
+            The names of the reports, which must be keys of ``REPORT_DEPENDENCIES``
+
+        Returns
+        -------
+        required_results: list of str
+            The needed survey results, where each result
+            is placed after all results it depends on
+        """
+
+        required_results = []
+
+        def add_result(result: str) -> None:
+            if result not in required_results:
+                for dependency in RESULT_DEPENDENCIES[result]:
+                    add_result(dependency)
+                required_results.append(result)
+
+        for name in report_names:
+            for result in REPORT_DEPENDENCIES[name]:
+                add_result(result)
+
+        return required_results
+
+    def _result_exists(self, result: str) -> bool:
+        """
+        Determines if a survey result has been computed.
+
+        Parameters
+        ----------
+        result: str
+            The survey result, which must be a key of ``RESULT_DEPENDENCIES``
+
+        Returns
+        -------
+        bool
+            True, if the result exists, else False
+        """
+
+        bio_calc = self.survey.bio_calc
+
+        if not isinstance(bio_calc, ComputeTransectVariables):
+            return False
+
+        if result == "transect_results":
+            return isinstance(bio_calc.transect_results_gdf, gpd.GeoDataFrame)
+        elif result == "kriging_results":
+            # additional kriging variables must also have been created
+            return isinstance(bio_calc.kriging_results_gdf, gpd.GeoDataFrame) and (
+                "sig_b" in bio_calc.kriging_results_gdf
+            )
+        elif result == "transect_length_age":
+            return isinstance(bio_calc.transect_bin_abundance_df, pd.DataFrame)
+        else:
+            return isinstance(bio_calc.kriging_bin_abundance_df, pd.DataFrame)
+
+    def _compute_result(self, result: str) -> None:
+        """
+        Computes a survey result, using the default parameters of the
+        routine that computes it. All results that ``result`` depends on
+        must exist.
+
+        Parameters
+        ----------
+        result: str
+            The survey result, which must be a key of ``RESULT_DEPENDENCIES``
+
+        Raises
+        ------
+        RuntimeError
+            If the result is Kriging based, since the Kriging
+            parameters and mesh must be provided by the user
+        """
+
+        if result == "transect_results":
+            self.survey.compute_transect_results()
+        elif result == "kriging_results":
+            if isinstance(self.survey.bio_calc.kriging_results_gdf, gpd.GeoDataFrame):
+                raise RuntimeError(
+                    "Kriging.compute_kriging_variables must be ran first!"
+                )
+            raise RuntimeError("Kriging.run_biomass_kriging must be ran first!")
+        elif result == "transect_length_age":
+            self.survey.compute_length_age_variables(data="transect")
+        else:
+            self.survey.compute_length_age_variables(data="kriging")
+
     def _preliminary_report_checks(
-        self, output_path: Union[str, pathlib.Path]
+        self, output_path: Union[str, pathlib.Path], report_names: List[str]
     ) -> pathlib.Path:
         """
         This function performs various checks for the function
         ``create_and_write_reports``, such as ensuring the input
-        is of the correct type, paths exist, and that all variables
-        needed to create reports exist.
+        is of the correct type and paths exist. Additionally, it
+        computes those survey results needed by the requested
+        reports that have not been computed.
 
         Parameters
         ----------
         output_path: str or pathlib.Path
-            The output path where all Excel files should be saved
+            The output path where all files should be saved
+        report_names: list of str
+            The names of the reports that will be created
 
         Returns
         -------
@@ -797,116 +1230,187 @@ class Reports:
         # check if path exists, if it doesn't create it
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # ensure that the bio_calc object and all Transect based data exist
-        if not isinstance(self.survey.bio_calc, ComputeTransectVariables):
-            raise RuntimeError("Survey.compute_transect_results must be ran first!")
-
-        # make sure that Kriging results have been produced
-        if not isinstance(self.survey.bio_calc.kriging_results_gdf, gpd.GeoDataFrame):
-            raise RuntimeError("Kriging.run_biomass_kriging must be ran first!")
-
-        # make sure that additional kriging variables have been created
-        if "sig_b" not in self.survey.bio_calc.kriging_results_gdf:
-            raise RuntimeError("Kriging.compute_kriging_variables must be ran first!")
-
-        if (
-            not isinstance(self.survey.bio_calc.transect_bin_abundance_df, pd.DataFrame)
-        ) or (
-            not isinstance(self.survey.bio_calc.kriging_bin_abundance_df, pd.DataFrame)
-        ):
-            raise RuntimeError(
-                "Survey.compute_length_age_variables for Kriging "
-                "and Transect based data must be ran first!"
-            )
+        # compute only those results that are needed and do not exist
+        for result in self._get_required_results(report_names):
+            if not self._result_exists(result):
+                self._compute_result(result)
 
         return output_path
 
-    def create_and_write_reports(self, output_path: Union[str, pathlib.Path]) -> None:
+    def create_and_write_reports(
+        self,
+        output_path: Union[str, pathlib.Path],
+        max_workers: Optional[int] = 1,
+        format: Union[str, List[str]] = "excel",
+        reports: Optional[List[str]] = None,
+    ) -> None:
         """
         Constructs Kriging mesh and Transect report DataFrames and writes
-        them to Excel files.
+        them to Excel, Parquet, and/or Arrow IPC files.
 
         Parameters
         ----------
         output_path: str or pathlib.Path
-            The output path where all Excel files should be saved
-        """
-
-        # TODO: should we include an option that allows you to generate a specific report?
-
-        # ensure all variables are correctly defined
-        output_path = self._preliminary_report_checks(output_path)
-
-        # Matlab file names: EchoPro_un-kriged_aged_output-2019_0.xlsx
-        # and EchoPro_un-kriged_aged_output-2019_1.xlsx
-        self._write_biomass_ages_report(
-            output_excel_path_all=output_path / "transect_based_aged_output_all.xlsx",
-            output_excel_path_non_zero=output_path
-            / "transect_based_aged_output_non_zero.xlsx",
-            results=self.survey.bio_calc.transect_results_gdf,
-            results_male=self.survey.bio_calc.transect_results_male_gdf,
-            results_female=self.survey.bio_calc.transect_results_female_gdf,
-            krig_result=False,
-        )
-
-        # Matlab file names: EchoPro_kriged_aged_output-2019_0.xlsx
-        # and EchoPro_kriged_aged_output-2019_1.xlsx
-        self._write_biomass_ages_report(
-            output_excel_path_all=output_path / "kriging_based_aged_output_all.xlsx",
-            output_excel_path_non_zero=output_path
-            / "kriging_based_aged_output_non_zero.xlsx",
-            results=self.survey.bio_calc.kriging_results_gdf,
-            results_male=self.survey.bio_calc.kriging_results_male_gdf,
-            results_female=self.survey.bio_calc.kriging_results_female_gdf,
-            krig_result=True,
-        )
-
-        # Matlab file names: EchoPro_un-kriged_output-26-Jan-2023_0.xlsx
-        # and EchoPro_un-kriged_output-26-Jan-2023_1.xlsx
-        self._transect_based_core_variables_report(
-            output_excel_path_all=output_path / "transect_based_core_output_all.xlsx",
-            output_excel_path_non_zero=output_path
-            / "transect_based_core_output_non_zero.xlsx",
-        )
+            The output path where all files should be saved
+        max_workers: int or None, default=1
+            The maximum number of processes used to write the files. If 1,
+            the files are written by the current process. If None, the
+            number of processors on the machine is used. Worker processes are
+            started with the ``spawn`` method, thus scripts that use more
+            than one worker must guard their entry point with
+            ``if __name__ == "__main__":``.
+        format: {"excel", "parquet", "arrow"} or list of them, default="excel"
+            The format(s) the reports should be written in. All formats are
+            written from the same report DataFrames.
+        reports: list of str or None
+            The names of the reports to create, which must be keys of
+            ``REPORT_DEPENDENCIES``. If None, all reports are created.
 
-        # Matlab file names: EchoPro_kriged_output-26-Jan-2023_0.xlsx
-        # and EchoPro_kriged_output-26-Jan-2023_1.xlsx
-        self._kriging_based_core_variables_report(
-            output_excel_path_all=output_path / "kriging_based_core_output_all.xlsx",
-            output_excel_path_non_zero=output_path
-            / "kriging_based_core_output_non_zero.xlsx",
-        )
-
-        # Matlab file name: kriging_input.xlsx
-        self._kriging_input_report(output_excel_path=output_path / "kriging_input.xlsx")
-
-        # Matlab file names: aged_len_haul_counts_table.xlsx
-        # and total_len_haul_counts_table.xlsx
-        self._len_haul_count_reports(
-            output_excel_path_specimen=output_path / "specimen_length_counts_haul.xlsx",
-            output_excel_path_total=output_path / "total_length_counts_haul.xlsx",
-        )
-
-        # Matlab file name: un-kriged_len_age_abundance_table.xlsx
-        self._len_age_abundance_report(
-            output_excel_path=output_path / "transect_based_len_age_abundance.xlsx",
-            kriging_based=False,
-        )
+        Notes
+        -----
+        Only those survey results needed by the requested reports are
+        required (see ``REPORT_DEPENDENCIES`` and ``RESULT_DEPENDENCIES``).
+        Transect based results and length-age variables that have not been
+        computed are computed with their default parameters, whereas Kriging
+        based results must be computed beforehand.
+
+        Each report is written as soon as its DataFrames are constructed,
+        so that the DataFrames of all reports are never held at once.
+
+        For the ``"parquet"`` and ``"arrow"`` formats, each sheet of a report
+        is written to ``output_path / <report name> / <sheet name>.<format>``,
+        where the report name is the name of the corresponding Excel file
+        without its suffix and the index is stored as the first column. The
+        path, number of rows, and column types of all such files are described
+        in ``output_path / "manifest.json"``.
+        """
 
-        # Matlab file name:kriged_len_age_abundance_table.xlsx
-        self._len_age_abundance_report(
-            output_excel_path=output_path / "kriging_based_len_age_abundance.xlsx",
-            kriging_based=True,
-        )
+        formats = [format] if isinstance(format, str) else list(format)
+        if (not formats) or any(fmt not in REPORT_FORMATS for fmt in formats):
+            raise ValueError(f"format must be one or more of {REPORT_FORMATS}!")
 
-        # Matlab file name: un-kriged_len_age_biomass_table.xlsx
-        self._len_age_biomass_report(
-            output_excel_path=output_path / "transect_based_len_age_biomass.xlsx",
-            kriging_based=False,
-        )
+        if reports is None:
+            reports = list(REPORT_DEPENDENCIES.keys())
+        elif any(name not in REPORT_DEPENDENCIES for name in reports):
+            raise ValueError(
+                f"reports must only contain values in {list(REPORT_DEPENDENCIES.keys())}!"
+            )
 
-        # Matlab file name: kriged_len_age_biomass_table.xlsx
-        self._len_age_biomass_report(
-            output_excel_path=output_path / "kriging_based_len_age_biomass.xlsx",
-            kriging_based=True,
-        )
+        # ensure all variables are correctly defined
+        output_path = self._preliminary_report_checks(output_path, reports)
+
+        # records the time taken to construct and write each report
+        profiler = get_profiler(self.survey)
+
+        # each report is written as soon as it is constructed
+        with self._report_file_writer(formats, max_workers):
+
+            # Matlab file names: EchoPro_un-kriged_aged_output-2019_0.xlsx
+            # and EchoPro_un-kriged_aged_output-2019_1.xlsx
+            if "transect_based_aged_output" in reports:
+                with profiler.section("transect_based_aged_output"):
+                    self._write_biomass_ages_report(
+                        output_excel_path_all=output_path
+                        / "transect_based_aged_output_all.xlsx",
+                        output_excel_path_non_zero=output_path
+                        / "transect_based_aged_output_non_zero.xlsx",
+                        results=self.survey.bio_calc.transect_results_gdf,
+                        results_male=self.survey.bio_calc.transect_results_male_gdf,
+                        results_female=self.survey.bio_calc.transect_results_female_gdf,
+                        krig_result=False,
+                    )
+
+            # Matlab file names: EchoPro_kriged_aged_output-2019_0.xlsx
+            # and EchoPro_kriged_aged_output-2019_1.xlsx
+            if "kriging_based_aged_output" in reports:
+                with profiler.section("kriging_based_aged_output"):
+                    self._write_biomass_ages_report(
+                        output_excel_path_all=output_path
+                        / "kriging_based_aged_output_all.xlsx",
+                        output_excel_path_non_zero=output_path
+                        / "kriging_based_aged_output_non_zero.xlsx",
+                        results=self.survey.bio_calc.kriging_results_gdf,
+                        results_male=self.survey.bio_calc.kriging_results_male_gdf,
+                        results_female=self.survey.bio_calc.kriging_results_female_gdf,
+                        krig_result=True,
+                    )
+
+            # Matlab file names: EchoPro_un-kriged_output-26-Jan-2023_0.xlsx
+            # and EchoPro_un-kriged_output-26-Jan-2023_1.xlsx
+            if "transect_based_core_output" in reports:
+                with profiler.section("transect_based_core_output"):
+                    self._transect_based_core_variables_report(
+                        output_excel_path_all=output_path
+                        / "transect_based_core_output_all.xlsx",
+                        output_excel_path_non_zero=output_path
+                        / "transect_based_core_output_non_zero.xlsx",
+                    )
+
+            # Matlab file names: EchoPro_kriged_output-26-Jan-2023_0.xlsx
+            # and EchoPro_kriged_output-26-Jan-2023_1.xlsx
+            if "kriging_based_core_output" in reports:
+                with profiler.section("kriging_based_core_output"):
+                    self._kriging_based_core_variables_report(
+                        output_excel_path_all=output_path
+                        / "kriging_based_core_output_all.xlsx",
+                        output_excel_path_non_zero=output_path
+                        / "kriging_based_core_output_non_zero.xlsx",
+                    )
+
+            # Matlab file name: kriging_input.xlsx
+            if "kriging_input" in reports:
+                with profiler.section("kriging_input"):
+                    self._kriging_input_report(
+                        output_excel_path=output_path / "kriging_input.xlsx"
+                    )
+
+            # Matlab file names: aged_len_haul_counts_table.xlsx
+            # and total_len_haul_counts_table.xlsx
+            if "length_counts_haul" in reports:
+                with profiler.section("length_counts_haul"):
+                    self._len_haul_count_reports(
+                        output_excel_path_specimen=output_path
+                        / "specimen_length_counts_haul.xlsx",
+                        output_excel_path_total=output_path
+                        / "total_length_counts_haul.xlsx",
+                    )
+
+            # Matlab file name: un-kriged_len_age_abundance_table.xlsx
+            if "transect_based_len_age_abundance" in reports:
+                with profiler.section("transect_based_len_age_abundance"):
+                    self._len_age_abundance_report(
+                        output_excel_path=output_path
+                        / "transect_based_len_age_abundance.xlsx",
+                        kriging_based=False,
+                    )
+
+            # Matlab file name:kriged_len_age_abundance_table.xlsx
+            if "kriging_based_len_age_abundance" in reports:
+                with profiler.section("kriging_based_len_age_abundance"):
+                    self._len_age_abundance_report(
+                        output_excel_path=output_path
+                        / "kriging_based_len_age_abundance.xlsx",
+                        kriging_based=True,
+                    )
+
+            # Matlab file name: un-kriged_len_age_biomass_table.xlsx
+            if "transect_based_len_age_biomass" in reports:
+                with profiler.section("transect_based_len_age_biomass"):
+                    self._len_age_biomass_report(
+                        output_excel_path=output_path
+                        / "transect_based_len_age_biomass.xlsx",
+                        kriging_based=False,
+                    )
+
+            # Matlab file name: kriged_len_age_biomass_table.xlsx
+            if "kriging_based_len_age_biomass" in reports:
+                with profiler.section("kriging_based_len_age_biomass"):
+                    self._len_age_biomass_report(
+                        output_excel_path=output_path
+                        / "kriging_based_len_age_biomass.xlsx",
+                        kriging_based=True,
+                    )
+
+            # wait for the reports being written by worker processes
+            with profiler.section("write_report_files"):
+                self._finish_report_files(output_path)
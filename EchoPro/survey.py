@@ -4,6 +4,7 @@ from warnings import warn
 
 import geopandas as gpd
 import numpy as np
+import pandas as pd
 import xarray as xr
 import yaml
 
@@ -22,9 +23,17 @@ from .computation import (
     vario_param_type,
     vario_type_dict,
 )
+from .computation.transect_cache import (
+    get_transect_cache_path,
+    load_transect_results,
+    save_transect_results,
+)
 from .data_loader import KrigingMesh, LoadBioData, LoadStrataData, load_nasc_df
 from .reports import Reports
+from .utils.coded_index import SurveyIndex
 from .utils.input_checks import check_existence_of_file
+from .utils.precision import get_precision_dtype
+from .utils.profiler import Profiler, profile_method
 
 
 class Survey:
@@ -49,6 +58,24 @@ class Survey:
 
     exclude_age1 : bool
         States whether age 1 hake should be included in analysis.
+    precision : str
+        The precision of the largest intermediate and stored arrays, either
+        ``"float64"`` or ``"float32"``. With ``"float32"``, the distances used
+        by the semi-variogram and Kriging, and the biomass of each age bin,
+        are stored in float32, which halves their memory. The Kriging
+        systems and all sums are still computed in float64.
+
+    Notes
+    -----
+    With ``precision="float32"``, the Kriged biomass density, its variance,
+    and the biomass of each age bin differ from those obtained with
+    ``"float64"`` by less than ``1e-6`` relative to their largest value, and
+    the total Kriged biomass and the Jolly-Hampton CV differ by less than
+    ``1e-7`` relative to their value. These bounds are checked by
+    ``EchoPro/tests/kriging/test_precision.py``. The float32 distances are
+    only used to search for the data near each mesh point, thus a transect
+    point whose distance to a mesh point is within about ``1e-7`` of the
+    search radius may be selected differently.
     """
 
     def __init__(
@@ -57,6 +84,7 @@ class Survey:
         survey_year_file_path: Union[str, Path],
         source: int = 3,
         exclude_age1: bool = True,
+        precision: str = "float64",
     ):
 
         # convert configuration paths to Path objects, if necessary
@@ -77,6 +105,10 @@ class Survey:
         self.params = self._collect_parameters(init_params, survey_year_params)
         self.params["exclude_age1"] = exclude_age1
 
+        # check and assign the precision of the largest arrays
+        get_precision_dtype(precision)
+        self.params["precision"] = precision
+
         # convert all string paths to Path objects in params
         self._convert_str_to_path_obj()
 
@@ -87,8 +119,12 @@ class Survey:
         self.length_df = None
         self.specimen_df = None
         self.nasc_df = None
+        self.survey_index = None
         self.bio_calc = None
 
+        # records the time and memory used by the routines of the survey
+        self.profiler = Profiler()
+
     @staticmethod
     def _check_init_file(init_file_path: Path) -> None:
         """
@@ -260,6 +296,22 @@ class Survey:
             if "filename" in param_name:
                 self.params[param_name] = Path(param_val)
 
+    @property
+    def profile(self) -> pd.DataFrame:
+        """
+        A report of the time taken by, and the peak memory used by, each
+        routine ran for this survey (see ``Profiler.get_report``).
+
+        Notes
+        -----
+        Memory is only tracked when ``self.profiler.track_memory`` is True.
+        Recorded routines are removed by ``self.profiler.reset()`` and can be
+        exported using ``self.profiler.to_json`` or ``self.profiler.to_chrome_trace``.
+        """
+
+        return self.profiler.get_report()
+
+    @profile_method
     def load_survey_data(self, file_type: str = "all") -> None:
         """
         Loads the biological, NASC, and stratification
@@ -294,6 +346,9 @@ class Survey:
 
         - ``file_type='nasc'``
             - ``self.nasc_df``
+
+        For all file types, ``self.survey_index`` is (re)constructed
+        from the loaded data.
         """
 
         if file_type not in ["all", "biological", "strata", "nasc"]:
@@ -303,17 +358,27 @@ class Survey:
 
         # load specimen and length data
         if file_type in ("biological", "all"):
-            LoadBioData(self)
+            with self.profiler.section("load_biological_data"):
+                LoadBioData(self)
 
         # load all associated stratification data
         if file_type in ("strata", "all"):
-            LoadStrataData(self)
+            with self.profiler.section("load_strata_data"):
+                LoadStrataData(self)
 
         if file_type in ("nasc", "all"):
-            self.nasc_df = load_nasc_df(self)
+            with self.profiler.section("load_nasc_data"):
+                self.nasc_df = load_nasc_df(self)
+
+        # assign integer codes to the strata, hauls, and transects
+        with self.profiler.section("survey_index"):
+            self.survey_index = SurveyIndex(self)
 
+    @profile_method
     def compute_transect_results(
-        self, selected_transects: Optional[List] = None
+        self,
+        selected_transects: Optional[List] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
     ) -> None:
         """
         Constructs ``self.bio_calc.transect_results_gdf``,
@@ -326,18 +391,42 @@ class Survey:
         ----------
         selected_transects : list or None
             The subset of transects used in the calculations
+        cache_dir : str or pathlib.Path or None
+            If provided, the directory where transect results are cached.
+            Results previously computed with the same loaded data, parameters,
+            and ``selected_transects`` are loaded from this directory, otherwise
+            the computed results are written to it.
+
+        Notes
+        -----
+        Cached results are keyed by a hash of all inputs, thus a new cache
+        entry is created whenever the data or parameters change. Entries are
+        never removed from ``cache_dir`` by EchoPro.
         """
 
+        if cache_dir is not None:
+            cache_path = get_transect_cache_path(self, selected_transects, cache_dir)
+
+            if cache_path.is_dir():
+                with self.profiler.section("load_transect_results"):
+                    self.bio_calc = load_transect_results(self, cache_path)
+                return
+
         self.bio_calc = None
         self.bio_calc = ComputeTransectVariables(self)
         self.bio_calc.get_transect_results_gdf(selected_transects)
 
         # create Dataset containing useful distributions and variables over length and age
-        self.bio_calc.bin_ds = generate_bin_ds(self)
+        with self.profiler.section("generate_bin_ds"):
+            self.bio_calc.bin_ds = generate_bin_ds(self)
 
         # add NASC_adult to transect_results_gdf (needs to occur after generate_bin_ds)
         self.bio_calc.set_adult_NASC()
 
+        if cache_dir is not None:
+            with self.profiler.section("save_transect_results"):
+                save_transect_results(self.bio_calc, cache_path)
+
     def run_cv_analysis(
         self,
         lat_inpfc: Tuple[float] = (np.NINF, 36, 40.5, 43.000, 45.7667, 48.5, 55.0000),
@@ -390,14 +479,27 @@ class Survey:
                     "The biomass density must be calculated before performing CV analysis on data!"
                 )
 
-        return run_jolly_hampton(self, nr, lat_inpfc, seed, kriged_data)
+        with self.profiler.section("run_jolly_hampton"):
+            return run_jolly_hampton(self, nr, lat_inpfc, seed, kriged_data)
 
-    def get_kriging_mesh(self) -> KrigingMesh:
+    def get_kriging_mesh(
+        self,
+        mesh_gdf: Optional[Union[gpd.GeoDataFrame, pd.DataFrame]] = None,
+        smoothed_contour_gdf: Optional[gpd.GeoDataFrame] = None,
+    ) -> KrigingMesh:
         """
         Initializes a ``KrigingMesh`` object using
         parameters obtained from the configuration
         files.
 
+        Parameters
+        ----------
+        mesh_gdf : gpd.GeoDataFrame or pd.DataFrame or None
+            If provided, the full mesh used instead of loading the mesh file
+        smoothed_contour_gdf : gpd.GeoDataFrame or None
+            If provided, the smoothed contour used instead of loading the
+            smoothed contour file
+
         Returns
         -------
         KrigingMesh
@@ -415,7 +517,7 @@ class Survey:
           the smoothed contour (e.g. 200m isobath)
         """
 
-        return KrigingMesh(self)
+        return KrigingMesh(self, mesh_gdf, smoothed_contour_gdf)
 
     def get_semi_variogram(
         self,
@@ -517,6 +619,7 @@ class Survey:
             ].values.flatten(),
             params["lag_res"],
             params["nlag"],
+            precision=self.params["precision"],
         )
 
         return semi_vario
@@ -573,6 +676,7 @@ class Survey:
             params["ratio"],
             params["s_v_params"],
             params["s_v_model"],
+            precision=self.params["precision"],
         )
 
         return krig
@@ -594,23 +698,47 @@ class Survey:
 
         return boot
 
-    def create_and_write_reports(self, output_path: Union[str, Path]) -> None:
+    @profile_method
+    def create_and_write_reports(
+        self,
+        output_path: Union[str, Path],
+        max_workers: Optional[int] = 1,
+        format: Union[str, List[str]] = "excel",
+        reports: Optional[List[str]] = None,
+    ) -> None:
         """
         Constructs Kriging mesh and Transect report DataFrames and writes
-        them to Excel files.
+        them to Excel, Parquet, and/or Arrow IPC files.
 
         Parameters
         ----------
         output_path: str or pathlib.Path
-            The output path where all Excel files should be saved
+            The output path where all files should be saved
+        max_workers: int or None, default=1
+            The maximum number of processes used to write the files. If 1,
+            the files are written by the current process. If None, the
+            number of processors on the machine is used. Worker processes are
+            started with the ``spawn`` method, thus scripts that use more
+            than one worker must guard their entry point with
+            ``if __name__ == "__main__":``.
+        format: {"excel", "parquet", "arrow"} or list of them, default="excel"
+            The format(s) the reports should be written in. For the columnar
+            formats, a manifest describing all tables is written to
+            ``output_path / "manifest.json"``.
+        reports: list of str or None
+            The names of the reports to create, which must be keys of
+            ``EchoPro.reports.REPORT_DEPENDENCIES``. If None, all reports are
+            created. Transect based results and length-age variables needed
+            by the reports are computed, if they do not exist.
         """
 
         # create Reports object
         report = Reports(self)
 
         # create and write reports to output_path
-        report.create_and_write_reports(output_path)
+        report.create_and_write_reports(output_path, max_workers, format, reports)
 
+    @profile_method
     def compute_length_age_variables(self, data: str = "transect") -> None:
         """
         Computes abundance and biomass over each length and age bin,
@@ -0,0 +1,376 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+from .computation import krig_param_type
+from .data_loader import KrigingMesh
+from .pipeline import Pipeline
+from .survey import Survey
+
+# the suffix of the length-age DataFrames in ``bio_calc`` for each gender
+GENDER_SUFFIXES = {"all": "", "male": "_male", "female": "_female"}
+
+# the shared meshes of a worker process, assigned by ``_init_worker``
+_shared_meshes = {}
+
+
+def _get_mesh_key(survey: Survey) -> Tuple[str, str, str, str]:
+    """
+    Obtains the files and sheets that the mesh of ``survey`` is loaded from.
+
+    Parameters
+    ----------
+    survey : Survey
+        An initialized Survey object
+
+    Returns
+    -------
+    tuple of str
+        The mesh file, the mesh sheet, the smoothed contour
+        file, and the smoothed contour sheet
+    """
+
+    return (
+        str(Path(survey.params["data_root_dir"]) / survey.params["mesh_filename"]),
+        str(survey.params["mesh_sheetname"]),
+        str(
+            Path(survey.params["data_root_dir"])
+            / survey.params["smoothed_contour_filename"]
+        ),
+        str(survey.params["smoothed_contour_sheetname"]),
+    )
+
+
+def get_length_age_results(survey: Survey, data: str) -> xr.Dataset:
+    """
+    Collects the abundance and biomass at each length and age
+    bin of a survey into a Dataset.
+
+    Parameters
+    ----------
+    survey : Survey
+        A Survey object with computed length-age variables
+    data : str
+        The results collected, either ``'transect'`` or ``'kriging'``
+
+    Returns
+    -------
+    ds : xr.Dataset
+        A Dataset with variables ``<data>_len_age_abundance`` and
+        ``<data>_len_age_biomass`` over the dimensions ``(gender, len_bin, age_bin)``
+        and the unaged variables ``<data>_len_unaged_abundance`` and
+        ``<data>_len_unaged_biomass`` over the dimensions ``(gender, len_bin)``,
+        which are NaN for those genders without unaged results
+    """
+
+    len_bin = survey.params["bio_hake_len_bin"]
+    age_bin = survey.params["bio_hake_age_bin"]
+
+    age_columns = [f"age_bin_{age}" for age in age_bin]
+    len_rows = [f"len_bin_{length}" for length in len_bin]
+
+    ds = xr.Dataset(
+        coords={
+            "gender": list(GENDER_SUFFIXES.keys()),
+            "len_bin": len_bin,
+            "age_bin": age_bin,
+        }
+    )
+
+    for var in ["abundance", "biomass"]:
+
+        aged = []
+        unaged = []
+        for suffix in GENDER_SUFFIXES.values():
+            df = getattr(survey.bio_calc, f"{data}_bin_{var}{suffix}_df").loc[len_rows]
+
+            aged.append(df[age_columns].to_numpy(dtype=np.float64))
+            unaged.append(
+                df["un-aged"].to_numpy(dtype=np.float64)
+                if "un-aged" in df.columns
+                else np.full(len(len_bin), np.nan)
+            )
+
+        ds[f"{data}_len_age_{var}"] = (("gender", "len_bin", "age_bin"), np.stack(aged))
+        ds[f"{data}_len_unaged_{var}"] = (("gender", "len_bin"), np.stack(unaged))
+
+    return ds
+
+
+def get_survey_results(survey: Survey, kriging: bool) -> xr.Dataset:
+    """
+    Collects the results of a processed survey into a Dataset.
+
+    Parameters
+    ----------
+    survey : Survey
+        A Survey object with computed transect results, and Kriging
+        results if ``kriging`` is True, and their length-age variables
+    kriging : bool
+        If True, the Kriging results are collected
+
+    Returns
+    -------
+    ds : xr.Dataset
+        A Dataset with the survey totals and the variables
+        constructed by ``get_length_age_results``
+    """
+
+    transect_gdf = survey.bio_calc.transect_results_gdf
+
+    datasets = [get_length_age_results(survey, "transect")]
+
+    totals = {
+        "transect_abundance": transect_gdf["abundance"].sum(),
+        "transect_abundance_adult": transect_gdf["abundance_adult"].sum(),
+        "transect_biomass": transect_gdf["biomass"].sum(),
+        "transect_biomass_adult": transect_gdf["biomass_adult"].sum(),
+    }
+
+    if kriging:
+        kriging_gdf = survey.bio_calc.kriging_results_gdf
+
+        datasets.append(get_length_age_results(survey, "kriging"))
+
+        totals["kriging_abundance_adult"] = kriging_gdf["abundance_adult"].sum()
+        totals["kriging_biomass_adult"] = kriging_gdf["biomass_adult"].sum()
+
+    return xr.merge(datasets + [xr.Dataset(totals)])
+
+
+def _process_survey(
+    survey: Survey,
+    kriging_params: Optional[krig_param_type],
+    transformation_params: Optional[dict],
+    cache_dir: Optional[Union[str, Path]],
+    shared_mesh: Optional[KrigingMesh],
+) -> xr.Dataset:
+    """
+    Runs the transect and Kriging stages of a survey and collects its results.
+
+    Parameters
+    ----------
+    survey : Survey
+        An initialized Survey object
+    kriging_params : dict or None
+        Kriging specific parameters. If None, Kriging is not ran.
+    transformation_params : dict or None
+        Keyword arguments provided to ``KrigingMesh.apply_coordinate_transformation``
+    cache_dir : str or Path or None
+        If provided, the directory where transect results are cached
+    shared_mesh : KrigingMesh or None
+        The mesh used by the survey, if Kriging is ran
+
+    Returns
+    -------
+    xr.Dataset
+        The results of the survey (see ``get_survey_results``)
+    """
+
+    pipeline = Pipeline(
+        survey,
+        kriging_params=kriging_params,
+        transformation_params=transformation_params,
+        max_workers=1,
+        cache_dir=cache_dir,
+        shared_mesh=shared_mesh,
+    )
+    pipeline.run()
+
+    return get_survey_results(survey, kriging=kriging_params is not None)
+
+
+def _init_worker(shared_meshes: Dict[tuple, KrigingMesh]) -> None:
+    """
+    Stores the meshes shared by all surveys in a worker process, so that
+    they are sent to each worker once, rather than once per survey.
+
+    Parameters
+    ----------
+    shared_meshes : dict
+        The meshes keyed by the files they were loaded from
+    """
+
+    _shared_meshes.update(shared_meshes)
+
+
+def _process_survey_in_worker(
+    survey: Survey,
+    kriging_params: Optional[krig_param_type],
+    transformation_params: Optional[dict],
+    cache_dir: Optional[Union[str, Path]],
+) -> xr.Dataset:
+    """
+    Runs ``_process_survey`` in a worker process initialized by ``_init_worker``.
+    """
+
+    shared_mesh = _shared_meshes.get(_get_mesh_key(survey)) if kriging_params else None
+
+    return _process_survey(
+        survey, kriging_params, transformation_params, cache_dir, shared_mesh
+    )
+
+
+class SurveyCollection:
+    """
+    Processes several survey years that share an initialization
+    configuration file and stacks their results.
+
+    Parameters
+    ----------
+    init_file_path : str or pathlib.Path
+        A string specifying the path to the initialization YAML file
+    survey_year_file_paths : list of str or pathlib.Path
+        The paths to the survey year YAML files, where
+        each file must specify a distinct ``survey_year``
+    source : int
+        The region of data to use (see ``Survey``)
+    exclude_age1 : bool
+        States whether age 1 hake should be included in analysis.
+    precision : str
+        The precision of the largest arrays of each survey (see ``Survey``)
+
+    Notes
+    -----
+    Since all surveys share the initialization configuration file, they
+    share the length and age bins, thus their results can be stacked.
+    """
+
+    def __init__(
+        self,
+        init_file_path: Union[str, Path],
+        survey_year_file_paths: List[Union[str, Path]],
+        source: int = 3,
+        exclude_age1: bool = True,
+        precision: str = "float64",
+    ):
+
+        if not survey_year_file_paths:
+            raise ValueError(
+                "At least one survey year configuration file must be provided!"
+            )
+
+        # the surveys keyed by their survey year
+        self.surveys = {}
+        for file_path in survey_year_file_paths:
+            survey = Survey(init_file_path, file_path, source, exclude_age1, precision)
+
+            survey_year = survey.params["survey_year"]
+            if survey_year in self.surveys:
+                raise ValueError(
+                    f"The survey year {survey_year} is specified by more "
+                    "than one survey year configuration file!"
+                )
+
+            self.surveys[survey_year] = survey
+
+    @property
+    def survey_years(self) -> List:
+        """
+        The survey year of each survey, in the order the files were provided.
+        """
+        return list(self.surveys.keys())
+
+    def _load_shared_meshes(self) -> Dict[tuple, KrigingMesh]:
+        """
+        Loads each distinct mesh used by the surveys once.
+
+        Returns
+        -------
+        shared_meshes : dict
+            The meshes keyed by the files they were loaded from
+        """
+
+        shared_meshes = {}
+        for survey in self.surveys.values():
+            mesh_key = _get_mesh_key(survey)
+            if mesh_key not in shared_meshes:
+                krig_mesh = survey.get_kriging_mesh()
+
+                # only the mesh and contour are shared
+                krig_mesh.survey = None
+                shared_meshes[mesh_key] = krig_mesh
+
+        return shared_meshes
+
+    def run(
+        self,
+        kriging_params: Optional[krig_param_type] = None,
+        transformation_params: Optional[dict] = None,
+        max_workers: Optional[int] = 1,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ) -> xr.Dataset:
+        """
+        Loads and processes all surveys and stacks their results.
+
+        Parameters
+        ----------
+        kriging_params : dict or None
+            Kriging specific parameters used by all surveys (see
+            ``Survey.get_kriging``). If None, Kriging is not ran.
+        transformation_params : dict or None
+            Keyword arguments provided to ``KrigingMesh.apply_coordinate_transformation``
+        max_workers : int or None, default=1
+            The maximum number of processes used to process the surveys. If 1,
+            the surveys are processed by the current process. If None, the
+            number of processors on the machine is used. Worker processes are
+            started with the ``spawn`` method, thus scripts that use more
+            than one worker must guard their entry point with
+            ``if __name__ == "__main__":``.
+        cache_dir : str or pathlib.Path or None
+            If provided, the directory where transect results are cached
+            (see ``Survey.compute_transect_results``)
+
+        Returns
+        -------
+        xr.Dataset
+            The results of each survey (see ``get_survey_results``)
+            stacked along the dimension ``survey_year``
+
+        Notes
+        -----
+        Each distinct mesh is loaded once by the current process and sent
+        to the workers. The surveys in ``self.surveys`` are not modified,
+        when more than one worker is used.
+        """
+
+        shared_meshes = {} if kriging_params is None else self._load_shared_meshes()
+
+        if max_workers == 1:
+            results = [
+                _process_survey(
+                    survey,
+                    kriging_params,
+                    transformation_params,
+                    cache_dir,
+                    shared_meshes.get(_get_mesh_key(survey)),
+                )
+                for survey in self.surveys.values()
+            ]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(shared_meshes,),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _process_survey_in_worker,
+                        survey,
+                        kriging_params,
+                        transformation_params,
+                        cache_dir,
+                    )
+                    for survey in self.surveys.values()
+                ]
+
+                # raise any errors that occurred when processing the surveys
+                results = [future.result() for future in futures]
+
+        return xr.concat(results, dim=pd.Index(self.survey_years, name="survey_year"))
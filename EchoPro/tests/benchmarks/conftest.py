@@ -0,0 +1,130 @@
+"""``pytest`` configuration of the benchmarks."""
+
+import os
+from typing import Tuple
+
+import pytest
+
+from EchoPro import Survey
+from EchoPro.computation import SemiVariogram
+from EchoPro.utils.synthetic_data import SYNTHETIC_SCALES, generate_synthetic_survey
+
+# the environment variable that selects the scale of the synthetic survey
+SCALE_VARIABLE = "ECHOPRO_BENCHMARK_SCALE"
+
+
+@pytest.fixture(scope="session")
+def synthetic_scale() -> str:
+    """
+    Defines the scale of the synthetic survey used by
+    the benchmarks, which is ``"medium"`` by default.
+
+    Returns
+    -------
+    str
+        A key of ``SYNTHETIC_SCALES``
+    """
+
+    scale = os.environ.get(SCALE_VARIABLE, "medium")
+
+    if scale not in SYNTHETIC_SCALES:
+        raise ValueError(
+            f"{SCALE_VARIABLE} must be one of {list(SYNTHETIC_SCALES.keys())}!"
+        )
+
+    return scale
+
+
+@pytest.fixture(scope="session")
+def synthetic_config_files(tmp_path_factory, synthetic_scale) -> Tuple:
+    """
+    Writes a synthetic survey that is shared by all benchmarks.
+
+    Returns
+    -------
+    tuple of pathlib.Path
+        The initialization and survey year configuration files
+    """
+
+    return generate_synthetic_survey(
+        tmp_path_factory.mktemp("synthetic_survey"),
+        **SYNTHETIC_SCALES[synthetic_scale],
+    )
+
+
+@pytest.fixture(scope="session")
+def kriging_params() -> dict:
+    """
+    Defines the Kriging parameters used by the benchmarks.
+
+    Returns
+    -------
+    dict
+        The Kriging parameters
+    """
+
+    return dict(
+        k_max=10,
+        k_min=3,
+        R=0.0226287,
+        ratio=0.001,
+        s_v_params={
+            "nugget": 0.0,
+            "sill": 0.95279,
+            "ls": 0.0075429,
+            "exp_pow": 1.5,
+            "ls_hole_eff": 0.0,
+        },
+        s_v_model=SemiVariogram.generalized_exp_bessel,
+    )
+
+
+@pytest.fixture
+def survey(synthetic_config_files) -> Survey:
+    """
+    Constructs a Survey, with loaded data, from the synthetic survey.
+
+    Returns
+    -------
+    Survey
+        A Survey object with loaded data
+    """
+
+    survey = Survey(*synthetic_config_files)
+    survey.load_survey_data()
+
+    return survey
+
+
+@pytest.fixture
+def transect_survey(survey) -> Survey:
+    """
+    Computes the transect results of the synthetic survey.
+
+    Returns
+    -------
+    Survey
+        A Survey object with computed transect results
+    """
+
+    survey.compute_transect_results()
+
+    return survey
+
+
+@pytest.fixture
+def krig_mesh(transect_survey):
+    """
+    Constructs the transformed Kriging mesh of the synthetic survey.
+
+    Returns
+    -------
+    KrigingMesh
+        A Kriging mesh with transformed transect and mesh coordinates
+    """
+
+    krig_mesh = transect_survey.get_kriging_mesh()
+    krig_mesh.apply_coordinate_transformation(coord_type="transect")
+    krig_mesh.apply_coordinate_transformation(coord_type="mesh")
+
+    return krig_mesh
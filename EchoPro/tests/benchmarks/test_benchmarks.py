@@ -0,0 +1,132 @@
+"""
+Benchmarks of the main routines of a survey, ran on a synthetic survey.
+
+The benchmarks are ran with e.g. ``pytest EchoPro/tests/benchmarks --benchmark-only``
+and the scale of the synthetic survey is selected by the environment variable
+``ECHOPRO_BENCHMARK_SCALE`` (see ``EchoPro.utils.synthetic_data.SYNTHETIC_SCALES``).
+Benchmarks that compare memory use store their peak memory in ``extra_info``.
+"""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from EchoPro import Survey
+from EchoPro.utils.coded_index import CodedIndex
+from EchoPro.utils.synthetic_data import SYNTHETIC_SCALES
+
+pytest.importorskip("pytest_benchmark")
+
+# the number of labels expanded per mesh cell of the synthetic survey
+EXPAND_LABELS_PER_CELL = 100
+
+
+def test_load_survey_data(benchmark, synthetic_config_files):
+
+    survey = Survey(*synthetic_config_files)
+
+    benchmark.pedantic(survey.load_survey_data, rounds=3)
+
+    assert survey.nasc_df is not None
+
+
+def test_compute_transect_results(benchmark, survey):
+
+    benchmark.pedantic(survey.compute_transect_results, rounds=3, warmup_rounds=1)
+
+    assert survey.bio_calc.transect_results_gdf["biomass_adult"].sum() > 0
+
+
+def test_semi_variogram(benchmark, transect_survey, krig_mesh):
+
+    semi_vario = transect_survey.get_semi_variogram(
+        krig_mesh, params=dict(nlag=30, lag_res=0.002)
+    )
+
+    benchmark.pedantic(semi_vario.calculate_semi_variogram, rounds=3, warmup_rounds=1)
+
+    assert semi_vario.gamma_normalized.shape == (30,)
+
+
+def test_kriging(benchmark, transect_survey, krig_mesh, kriging_params):
+
+    kriging = transect_survey.get_kriging(kriging_params)
+
+    def run_kriging():
+        kriging.run_biomass_kriging(krig_mesh)
+        kriging.compute_kriging_variables()
+
+    benchmark.pedantic(run_kriging, rounds=3, warmup_rounds=1)
+
+    assert transect_survey.bio_calc.kriging_results_gdf["biomass_adult"].sum() > 0
+
+
+def test_jolly_hampton(benchmark, transect_survey):
+
+    cv = benchmark.pedantic(
+        transect_survey.run_cv_analysis, kwargs=dict(seed=1), rounds=1
+    )
+
+    assert cv > 0
+
+
+def test_bootstrapping(benchmark, transect_survey):
+
+    boot = transect_survey.get_bootstrapping()
+
+    results = benchmark.pedantic(
+        boot.run_bootstrapping,
+        kwargs=dict(removal_percentage=10.0, num_iterations=2, seed=1),
+        rounds=1,
+    )
+
+    assert len(results) == 2
+
+
+def test_reports(benchmark, transect_survey, krig_mesh, kriging_params, tmp_path):
+
+    kriging = transect_survey.get_kriging(kriging_params)
+    kriging.run_biomass_kriging(krig_mesh)
+    kriging.compute_kriging_variables()
+    transect_survey.compute_length_age_variables(data="all")
+
+    benchmark.pedantic(
+        transect_survey.create_and_write_reports, args=(tmp_path,), rounds=1
+    )
+
+    assert (tmp_path / "kriging_input.xlsx").is_file()
+
+
+@pytest.mark.parametrize("method", ["loc", "expand"])
+def test_expand_stratum_values(benchmark, transect_survey, synthetic_scale, method):
+
+    # the weight fraction of each stratum and age bin, expanded to many labels
+    vals = transect_survey.bio_calc.weight_fraction_all_ages_df
+    num_labels = (
+        SYNTHETIC_SCALES[synthetic_scale]["num_mesh_cells"] * EXPAND_LABELS_PER_CELL
+    )
+    labels = np.random.default_rng(0).choice(vals.index.values, num_labels)
+
+    strata = CodedIndex(vals.index)
+    codes = strata.get_codes(labels)
+
+    if method == "loc":
+
+        def expand():
+            return vals.loc[labels].values
+
+    else:
+
+        def expand():
+            return strata.expand(vals, codes)
+
+    expanded = benchmark.pedantic(expand, rounds=3, warmup_rounds=1)
+
+    # record the peak memory allocated by a single expansion
+    tracemalloc.start()
+    expand()
+    benchmark.extra_info["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    np.testing.assert_array_equal(expanded, vals.loc[labels].values)
@@ -0,0 +1,70 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from EchoPro.utils import scaling
+
+# the baseline measured by ``python -m EchoPro.utils.scaling --baseline <file> --update``
+BASELINE_FILE = Path(__file__).parent / "scaling_baseline.json"
+
+# the scaling of the hot paths depends on the load of the machine, thus it is only
+# measured when the first environment variable below is set, where the hot paths
+# that take minutes to measure are only measured when the second is set
+SCALING_VARIABLE = "ECHOPRO_SCALING"
+SLOW_VARIABLE = "ECHOPRO_SCALING_SLOW"
+SLOW_HOT_PATHS = ["generate_bin_ds", "create_and_write_reports"]
+
+
+def test_fit_exponent():
+
+    factors = [1, 2, 4, 8]
+
+    linear_exponent = scaling.fit_exponent(factors, [2.0 * f for f in factors])
+    quadratic_exponent = scaling.fit_exponent(factors, [0.5 * f**2 for f in factors])
+
+    assert linear_exponent == pytest.approx(1.0)
+    assert quadratic_exponent == pytest.approx(2.0)
+
+
+def test_compare_to_baseline():
+
+    baseline = {"linear": {"exponent": 1.0}, "quadratic": {"exponent": 2.0}}
+    results = {
+        "linear": {"exponent": 2.0},
+        "quadratic": {"exponent": 2.2},
+        "new": {"exponent": 3.0},
+    }
+
+    regressions = scaling.compare_to_baseline(results, baseline, tolerance=0.4)
+
+    # only the linear hot path exceeds its baseline, and
+    # hot paths without a baseline are not compared
+    assert len(regressions) == 1
+    assert regressions[0].startswith("linear:")
+
+
+def test_baseline_contains_all_hot_paths():
+
+    with open(BASELINE_FILE) as f:
+        baseline = json.load(f)
+
+    assert set(baseline.keys()) == set(scaling.HOT_PATHS.keys())
+
+
+@pytest.mark.parametrize("hot_path", list(scaling.HOT_PATHS.keys()))
+def test_scaling_against_baseline(hot_path):
+
+    if hot_path in SLOW_HOT_PATHS:
+        if not os.environ.get(SLOW_VARIABLE):
+            pytest.skip(f"set {SLOW_VARIABLE} to measure the scaling of {hot_path}")
+    elif not (os.environ.get(SCALING_VARIABLE) or os.environ.get(SLOW_VARIABLE)):
+        pytest.skip(f"set {SCALING_VARIABLE} to measure the scaling of {hot_path}")
+
+    with open(BASELINE_FILE) as f:
+        baseline = json.load(f)
+
+    results = scaling.measure_scaling([hot_path])
+
+    assert scaling.compare_to_baseline(results, baseline) == []
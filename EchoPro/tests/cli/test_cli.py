@@ -0,0 +1,67 @@
+import json
+import sys
+
+import pytest
+
+from EchoPro.cli import EXIT_FAILURE, get_parser, load_kriging_params, main
+from EchoPro.computation import SemiVariogram
+
+
+def test_load_kriging_params(tmp_path):
+
+    file_path = tmp_path / "kriging.yml"
+    file_path.write_text(
+        "k_max: 10\nk_min: 3\nR: 0.0226287\nratio: 0.001\n"
+        "s_v_params: {nugget: 0.0, sill: 0.95279}\n"
+        "s_v_model: generalized_exp_bessel\n"
+    )
+
+    params = load_kriging_params(file_path)
+
+    assert params["k_max"] == 10
+    assert params["s_v_params"] == {"nugget": 0.0, "sill": 0.95279}
+    assert params["s_v_model"] is SemiVariogram.generalized_exp_bessel
+
+
+@pytest.mark.parametrize("model_name", ["not_a_model", "_create_widgets"])
+def test_load_kriging_params_unknown_model(tmp_path, model_name):
+
+    file_path = tmp_path / "kriging.yml"
+    file_path.write_text(f"k_max: 10\ns_v_model: {model_name}\n")
+
+    with pytest.raises(ValueError):
+        load_kriging_params(file_path)
+
+
+def test_parser_rejects_unknown_target():
+
+    with pytest.raises(SystemExit) as e:
+        get_parser().parse_args(["init.yml", "survey.yml", "--targets", "not_a_stage"])
+
+    assert e.value.code == 2
+
+
+def test_error_status(tmp_path, capsys):
+
+    exit_code = main(
+        [str(tmp_path / "init.yml"), str(tmp_path / "survey.yml"), "--profile"]
+    )
+
+    status = json.loads(capsys.readouterr().out)
+
+    assert exit_code == EXIT_FAILURE
+    assert status["status"] == "error"
+    assert status["stages_ran"] == []
+    assert status["error"]["type"] == "FileNotFoundError"
+    assert status["stage_times"] == {}
+    assert status["peak_memory_mb"] > 0
+
+
+def test_peak_memory_without_resource(tmp_path, capsys, monkeypatch):
+
+    # the module resource is not available on Windows
+    monkeypatch.setitem(sys.modules, "resource", None)
+
+    main([str(tmp_path / "init.yml"), str(tmp_path / "survey.yml"), "--profile"])
+
+    assert json.loads(capsys.readouterr().out)["peak_memory_mb"] is None
@@ -0,0 +1,76 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from EchoPro import SurveyCollection
+from EchoPro.survey_collection import get_length_age_results
+
+
+def write_configs(tmp_path, survey_years):
+
+    init_file = tmp_path / "init.yml"
+    init_file.write_text(
+        "bio_hake_len_bin: [2, 6, 3]\nbio_hake_age_bin: [1, 2, 2]\nsig_b_coeff_power: -6.8\n"
+    )
+
+    survey_year_files = []
+    for i, survey_year in enumerate(survey_years):
+        survey_year_file = tmp_path / f"survey_year_{i}.yml"
+        survey_year_file.write_text(
+            f"survey_year: {survey_year}\ndata_root_dir: {tmp_path}\n"
+        )
+        survey_year_files.append(survey_year_file)
+
+    return init_file, survey_year_files
+
+
+def test_survey_years(tmp_path):
+
+    collection = SurveyCollection(*write_configs(tmp_path, [2019, 2017]))
+
+    assert collection.survey_years == [2019, 2017]
+
+
+def test_duplicate_survey_year(tmp_path):
+
+    with pytest.raises(ValueError):
+        SurveyCollection(*write_configs(tmp_path, [2019, 2019]))
+
+
+def test_get_length_age_results():
+
+    len_bin = np.array([2, 4])
+    age_bin = np.array([1, 2, 3])
+
+    index = [f"len_bin_{length}" for length in len_bin]
+    age_columns = [f"age_bin_{age}" for age in age_bin]
+
+    bio_calc = SimpleNamespace()
+    for var in ["abundance", "biomass"]:
+        for offset, suffix in enumerate(["", "_male", "_female"]):
+            df = pd.DataFrame(
+                np.arange(6).reshape(2, 3) + 10 * offset,
+                index=index,
+                columns=age_columns,
+            )
+            if suffix != "_male":
+                df["un-aged"] = [100.0 + offset, 200.0 + offset]
+            setattr(bio_calc, f"transect_bin_{var}{suffix}_df", df)
+
+    survey = SimpleNamespace(
+        params={"bio_hake_len_bin": len_bin, "bio_hake_age_bin": age_bin},
+        bio_calc=bio_calc,
+    )
+
+    ds = get_length_age_results(survey, "transect")
+
+    assert ds["transect_len_age_biomass"].dims == ("gender", "len_bin", "age_bin")
+    assert (
+        ds["transect_len_age_abundance"].sel(gender="male", len_bin=4, age_bin=1) == 13
+    )
+    assert np.array_equal(
+        ds["transect_len_unaged_biomass"].sel(gender="female").values, [102.0, 202.0]
+    )
+    assert ds["transect_len_unaged_abundance"].sel(gender="male").isnull().all()
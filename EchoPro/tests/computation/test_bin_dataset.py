@@ -0,0 +1,505 @@
+import contextlib
+import io
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+from EchoPro import Survey
+from EchoPro.computation import generate_bin_ds
+from EchoPro.computation.bin_dataset import _get_bin_codes, _get_bin_codes_age
+from EchoPro.utils.synthetic_data import generate_synthetic_survey
+
+
+def _per_stratum_get_bin_ind(
+    input_data: np.ndarray, bin_edges: np.ndarray
+) -> List[np.ndarray]:
+    """
+    Finds the indices of ``input_data`` in each length bin.
+    """
+
+    hist_ind = []
+
+    for i in range(len(bin_edges) - 1):
+
+        # get values greater or equal than lower bound
+        g_lb = bin_edges[i] <= input_data
+
+        # get values less than the upper bound
+        le_ub = input_data < bin_edges[i + 1]
+
+        # fill bin
+        hist_ind.append(np.argwhere(g_lb & le_ub).flatten())
+
+    # fill in the last bin
+    hist_ind.append(np.argwhere(input_data >= bin_edges[-1]).flatten())
+
+    return hist_ind
+
+
+def _per_stratum_get_bin_ind_age(
+    input_data: np.ndarray, age_bins: np.ndarray
+) -> List[np.ndarray]:
+    """
+    Finds the indices of ``input_data`` equal to each age.
+    """
+
+    return [np.argwhere(input_data == age).flatten() for age in age_bins]
+
+
+def _per_stratum_initialize_ds(
+    stratum_ind: np.ndarray, len_bin: np.ndarray, age_bin: np.ndarray
+) -> xr.Dataset:
+    """
+    Initializes the parameter Dataset.
+    """
+
+    # initialize variable that will hold all Dataset initialized variables
+    data_vars_dict = {
+        "total_weight": ("stratum_num", np.zeros(len(stratum_ind))),
+        "aged_proportion": ("stratum_num", np.zeros(len(stratum_ind))),
+        "unaged_proportion": ("stratum_num", np.zeros(len(stratum_ind))),
+        "station_1_N": ("stratum_num", np.zeros(len(stratum_ind))),
+        "weight_len_all_normalized": (
+            ["stratum_num", "len_bin"],
+            np.zeros((len(stratum_ind), len(len_bin))),
+        ),
+    }
+
+    # add all variables that have only male and female versions
+    for sex in ["M", "F"]:
+        data_vars_dict[f"num_{sex}"] = ("stratum_num", np.zeros(len(stratum_ind)))
+        data_vars_dict[f"station_1_N_{sex}"] = (
+            "stratum_num",
+            np.zeros(len(stratum_ind)),
+        )
+        data_vars_dict[f"unaged_{sex}_wgt_proportion"] = (
+            "stratum_num",
+            np.zeros(len(stratum_ind)),
+        )
+        data_vars_dict[f"len_dist_station1_normalized_{sex}"] = (
+            ["stratum_num", "len_bin"],
+            np.zeros((len(stratum_ind), len(len_bin))),
+        )
+
+    # add all variables that have male, female, and all versions
+    for sex in ["M", "F", "all"]:
+        data_vars_dict[f"len_age_weight_prop_{sex}"] = (
+            "stratum_num",
+            np.zeros(len(stratum_ind)),
+        )
+        data_vars_dict[f"len_age_dist_{sex}"] = (
+            ["stratum_num", "len_bin", "age_bin"],
+            np.zeros((len(stratum_ind), len(len_bin), len(age_bin))),
+        )
+        data_vars_dict[f"len_age_weight_dist_{sex}"] = (
+            ["stratum_num", "len_bin", "age_bin"],
+            np.zeros((len(stratum_ind), len(len_bin), len(age_bin))),
+        )
+
+        data_vars_dict[f"len_age_weight_dist_{sex}_normalized"] = (
+            ["stratum_num", "len_bin", "age_bin"],
+            np.zeros((len(stratum_ind), len(len_bin), len(age_bin))),
+        )
+
+    return xr.Dataset(
+        data_vars=data_vars_dict,
+        coords={
+            "stratum_num": ("stratum_num", stratum_ind),
+            "len_bin": ("len_bin", len_bin),
+            "age_bin": ("age_bin", age_bin),
+        },
+    )
+
+
+def _per_stratum_get_len_wgt_distributions(
+    survey,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Computes the length-weight distributions for each gender and all animals.
+    """
+
+    specimen_df = survey.bio_calc.specimen_df
+
+    len_wgt_M = survey.bio_calc._generate_length_val_conversion(
+        len_name="length", val_name="weight", df=specimen_df[specimen_df["sex"] == 1]
+    )
+    len_wgt_F = survey.bio_calc._generate_length_val_conversion(
+        len_name="length", val_name="weight", df=specimen_df[specimen_df["sex"] == 2]
+    )
+    len_wgt_all = survey.bio_calc._generate_length_val_conversion(
+        len_name="length", val_name="weight", df=specimen_df
+    )
+
+    return len_wgt_M, len_wgt_F, len_wgt_all
+
+
+def _per_stratum_set_age_distribution_data(
+    survey, stratum: int, ds: xr.Dataset, df_M: pd.DataFrame, df_F: pd.DataFrame
+) -> None:
+    """
+    Computes the length-age distributions of a stratum and assigns them to ``ds``.
+    """
+
+    # account for the case when df is a Series
+    if isinstance(df_M, pd.Series):
+        input_arr_len_M = np.array([df_M.length])
+        input_arr_age_M = np.array([df_M.age])
+        input_arr_wgt_M = np.array([df_M.weight])
+
+        input_arr_len_F = np.array([df_F.length])
+        input_arr_age_F = np.array([df_F.age])
+        input_arr_wgt_F = np.array([df_F.weight])
+
+    else:
+        input_arr_len_M = df_M.length.values
+        input_arr_age_M = df_M.age.values
+        input_arr_wgt_M = df_M.weight.values
+
+        input_arr_len_F = df_F.length.values
+        input_arr_age_F = df_F.age.values
+        input_arr_wgt_F = df_F.weight.values
+
+    # bin the ages
+    age_bins_ind_M = _per_stratum_get_bin_ind_age(
+        input_arr_age_M, survey.bio_calc.bio_hake_age_bin
+    )
+    age_bins_ind_F = _per_stratum_get_bin_ind_age(
+        input_arr_age_F, survey.bio_calc.bio_hake_age_bin
+    )
+
+    # round input lengths
+    input_arr_len_M = np.round(input_arr_len_M)
+    input_arr_len_F = np.round(input_arr_len_F)
+
+    # compute distributions for each age bin
+    for age_bin in range(len(age_bins_ind_M)):
+
+        for sex in ["M", "F"]:
+
+            if sex == "M":
+                input_arr_len = input_arr_len_M
+                age_bins_ind = age_bins_ind_M
+                input_arr_wgt = input_arr_wgt_M
+            else:
+                input_arr_len = input_arr_len_F
+                age_bins_ind = age_bins_ind_F
+                input_arr_wgt = input_arr_wgt_F
+
+            len_bin_ind = _per_stratum_get_bin_ind(
+                input_arr_len[age_bins_ind[age_bin]],
+                survey.bio_calc.bio_hake_len_bin,
+            )
+
+            # get the distribution of weight for a particular age bin
+            ds[f"len_age_weight_dist_{sex}"].sel(stratum_num=stratum)[
+                :, age_bin
+            ] = np.array(
+                [np.sum(input_arr_wgt[age_bins_ind[age_bin]][i]) for i in len_bin_ind]
+            )
+
+            # get the distribution of lengths for a particular age bin
+            ds[f"len_age_dist_{sex}"].sel(stratum_num=stratum)[:, age_bin] = np.array(
+                [len(i) for i in len_bin_ind]
+            )
+
+        # get the distribution of weight for a particular age bin for all genders
+        ds.sel(stratum_num=stratum).len_age_weight_dist_all[:, age_bin] = (
+            ds.sel(stratum_num=stratum).len_age_weight_dist_M[:, age_bin]
+            + ds.sel(stratum_num=stratum).len_age_weight_dist_F[:, age_bin]
+        )
+
+        # get the distribution of lengths for a particular age bin for all genders
+        ds.sel(stratum_num=stratum).len_age_dist_all[:, age_bin] = (
+            ds.sel(stratum_num=stratum).len_age_dist_M[:, age_bin]
+            + ds.sel(stratum_num=stratum).len_age_dist_F[:, age_bin]
+        )
+
+    # obtain normalized distributions
+    for sex in ["all", "M", "F"]:
+        ds[f"len_age_weight_dist_{sex}_normalized"].sel(stratum_num=stratum)[:, :] = ds[
+            f"len_age_weight_dist_{sex}"
+        ].sel(stratum_num=stratum) / np.nansum(
+            ds[f"len_age_weight_dist_{sex}"].sel(stratum_num=stratum)
+        )
+
+
+def _per_stratum_set_total_weight(
+    survey, haul_nums: np.ndarray, stratum: int, ds: xr.Dataset
+) -> float:
+    """
+    Assigns the total weight of a stratum to ``ds`` and returns
+    the total weight at station 1.
+    """
+
+    # calculate the total weight within the stratum for station 1
+    wgt_station_1 = np.array(
+        [
+            survey.catch_df.loc[j]["haul_weight"].sum()
+            for j in haul_nums
+            if (j in survey.catch_df.index) and (j in survey.length_df.index)
+        ]
+    ).sum()
+
+    # calculate the total weight within the stratum for station 2
+    wgt_station_2 = survey.bio_calc.specimen_df.loc[stratum]["weight"].sum()
+
+    ds.total_weight.loc[stratum] = wgt_station_1 + wgt_station_2
+
+    return wgt_station_1
+
+
+def _per_stratum_get_length_based_wgt_interp(
+    haul_nums: np.ndarray, df: pd.DataFrame, len_bin: np.ndarray, len_wgt: np.ndarray
+) -> float:
+    """
+    Obtains the weight of animals within a stratum using the length data.
+    """
+
+    final_wgt = 0.0
+
+    # obtain the hauls that are within df
+    len_haul = [round(df.loc[j]["length"]) for j in haul_nums if j in df.index]
+
+    if len_haul:
+
+        # get the number of lengths for each haul
+        len_haul_counts = np.concatenate(
+            [df.loc[j]["length_count"].values for j in haul_nums if j in df.index]
+        )
+
+        # calculate the weight of animals within the stratum
+        len_haul = np.concatenate(len_haul)
+        final_wgt = (np.interp(len_haul, len_bin, len_wgt) * len_haul_counts).sum()
+
+    return final_wgt
+
+
+def _per_stratum_get_length_df_based_wgt(
+    survey,
+    stratum: int,
+    ds: xr.Dataset,
+    haul_nums: np.ndarray,
+    length_df_M: pd.DataFrame,
+    length_df_F: pd.DataFrame,
+    len_bin: np.ndarray,
+    len_wgt_M: np.ndarray,
+    len_wgt_F: np.ndarray,
+    len_wgt_all: np.ndarray,
+) -> Tuple[float, float]:
+    """
+    Computes the weight of females and males within a stratum based off
+    of the length data and assigns the station 1 distributions to ``ds``.
+    """
+
+    male_wgt = _per_stratum_get_length_based_wgt_interp(
+        haul_nums, length_df_M, len_bin, len_wgt_M
+    )
+    female_wgt = _per_stratum_get_length_based_wgt_interp(
+        haul_nums, length_df_F, len_bin, len_wgt_F
+    )
+
+    # obtain all haul numbers within the stratum and in length_df
+    hauls_in_all = [j for j in haul_nums if j in survey.length_df.index]
+
+    if hauls_in_all:
+
+        for sex, df in [("M", length_df_M), ("F", length_df_F)]:
+
+            # get normalized length distribution of length_df gender data
+            ds[f"len_dist_station1_normalized_{sex}"].sel(stratum_num=stratum)[
+                :
+            ] = survey.bio_calc._get_distribution_lengths_station_1(
+                df.loc[hauls_in_all]
+            )
+
+            # store the number of animals in station 1 for the stratum
+            ds[f"station_1_N_{sex}"].loc[stratum] = df.loc[hauls_in_all][
+                "length_count"
+            ].sum()
+
+        # get normalized length distribution of length_df data
+        len_dist_station1_normalized = (
+            survey.bio_calc._get_distribution_lengths_station_1(
+                survey.length_df.loc[hauls_in_all]
+            )
+        )
+
+        # store the number of animals in station 1 for the stratum
+        ds.station_1_N.loc[stratum] = survey.length_df.loc[hauls_in_all][
+            "length_count"
+        ].sum()
+
+        # normalized weight per unit length distribution
+        weight_len_all = len_wgt_all * len_dist_station1_normalized
+        ds.sel(stratum_num=stratum).weight_len_all_normalized[:] = (
+            weight_len_all / weight_len_all.sum()
+        )
+
+    return female_wgt, male_wgt
+
+
+def _per_stratum_set_proportion_parameters(
+    stratum: int,
+    ds: xr.Dataset,
+    male_wgt: float,
+    female_wgt: float,
+    wgt_station_1: float,
+) -> None:
+    """
+    Calculates and assigns the proportion parameters of a stratum to ``ds``.
+    """
+
+    # calculate and assign the len_age_weight proportions
+    for sex in ["all", "M", "F"]:
+        ds[f"len_age_weight_prop_{sex}"].loc[stratum] = np.nansum(
+            ds[f"len_age_weight_dist_{sex}"].sel(stratum_num=stratum)
+        ) / ds.total_weight.sel(stratum_num=stratum)
+
+    # calculate and assign aged and unaged proportions
+    ds.aged_proportion.loc[stratum] = (
+        ds.len_age_weight_prop_M.loc[stratum] + ds.len_age_weight_prop_F.loc[stratum]
+    )
+    ds.unaged_proportion.loc[stratum] = 1.0 - ds.aged_proportion.loc[stratum]
+
+    # obtain the normalized weight of station 1 for males and females
+    if (male_wgt != 0.0) and (female_wgt != 0.0):
+        nM_wgt1 = wgt_station_1 * male_wgt / (male_wgt + female_wgt)
+        nF_wgt1 = wgt_station_1 * female_wgt / (male_wgt + female_wgt)
+    else:
+        nM_wgt1 = 0.0
+        nF_wgt1 = 0.0
+
+    # obtain length and gender based weight proportion
+    Len_M_wgt_proportion = nM_wgt1 / ds.total_weight.sel(stratum_num=stratum).values
+    Len_F_wgt_proportion = nF_wgt1 / ds.total_weight.sel(stratum_num=stratum).values
+
+    # obtain the proportion of males and females
+    if (Len_M_wgt_proportion == 0.0) and (Len_F_wgt_proportion == 0.0):
+        M_proportion = 0.5
+        F_proportion = 0.5
+    else:
+        M_proportion = Len_M_wgt_proportion / (
+            Len_M_wgt_proportion + Len_F_wgt_proportion
+        )
+        F_proportion = Len_F_wgt_proportion / (
+            Len_M_wgt_proportion + Len_F_wgt_proportion
+        )
+
+    # calculate and assign the unaged weight proportion of males and females
+    ds.unaged_M_wgt_proportion.loc[stratum] = (
+        ds.unaged_proportion.loc[stratum].values * M_proportion
+    )
+    ds.unaged_F_wgt_proportion.loc[stratum] = (
+        ds.unaged_proportion.loc[stratum].values * F_proportion
+    )
+
+
+def _per_stratum_generate_bin_ds(survey) -> xr.Dataset:
+    """
+    Creates the bin Dataset by computing the parameters of each stratum
+    separately, which is the implementation of ``generate_bin_ds`` before
+    the parameters of all strata were computed at once.
+    """
+
+    # obtain specimen DataFrames without NA values
+    spec_drop = survey.bio_calc.specimen_df.dropna(how="any")
+    spec_drop_M = spec_drop[spec_drop["sex"] == 1]
+    spec_drop_F = spec_drop[spec_drop["sex"] == 2]
+
+    # obtain gender based length DataFrames
+    length_df_M = survey.length_df[survey.length_df["sex"] == 1]
+    length_df_F = survey.length_df[survey.length_df["sex"] == 2]
+
+    # get all unique stratum values that are contained in all specimen DataFrames
+    stratum_ind = np.intersect1d(spec_drop.index.unique(), spec_drop_M.index.unique())
+    stratum_ind = np.intersect1d(stratum_ind, spec_drop_F.index.unique())
+
+    len_bin = survey.params["bio_hake_len_bin"]
+    age_bin = survey.params["bio_hake_age_bin"]
+
+    ds = _per_stratum_initialize_ds(stratum_ind, len_bin, age_bin)
+
+    # obtain a mapping of hauls to strata
+    haul_vs_stratum = survey.bio_calc.strata_df.reset_index()[
+        ["haul_num", "stratum_num"]
+    ]
+
+    # get length-weight distributions (includes all ages in quantity)
+    len_wgt_M, len_wgt_F, len_wgt_all = _per_stratum_get_len_wgt_distributions(survey)
+
+    for i in stratum_ind:
+
+        # obtain haul numbers that are in the stratum i
+        haul_nums = haul_vs_stratum[haul_vs_stratum["stratum_num"] == i][
+            "haul_num"
+        ].values
+
+        # calculate and set the number of animals in the stratum based on gender
+        ds.num_M.loc[i] = len(spec_drop_M.loc[i])
+        ds.num_F.loc[i] = len(spec_drop_F.loc[i])
+
+        _per_stratum_set_age_distribution_data(
+            survey, i, ds, spec_drop_M.loc[i], spec_drop_F.loc[i]
+        )
+
+        wgt_station_1 = _per_stratum_set_total_weight(survey, haul_nums, i, ds)
+
+        female_wgt, male_wgt = _per_stratum_get_length_df_based_wgt(
+            survey,
+            i,
+            ds,
+            haul_nums,
+            length_df_M,
+            length_df_F,
+            len_bin,
+            len_wgt_M,
+            len_wgt_F,
+            len_wgt_all,
+        )
+
+        _per_stratum_set_proportion_parameters(
+            i, ds, male_wgt, female_wgt, wgt_station_1
+        )
+
+    return ds
+
+
+def test_bin_codes():
+
+    bin_edges = np.linspace(2, 80, 40, dtype=np.int64)
+    input_data = np.array([0.0, 1.9, 2.0, 3.0, 3.9, 4.0, 79.9, 80.0, 100.0, np.nan])
+
+    # values below the first edge and NaN values are not placed in a bin
+    assert np.array_equal(
+        _get_bin_codes(input_data, bin_edges), [-1, -1, 0, 0, 0, 1, 38, 39, 39, -1]
+    )
+
+
+def test_bin_codes_age():
+
+    age_bins = np.linspace(1, 22, 22, dtype=np.int64)
+    input_data = np.array([0.0, 1.0, 1.5, 2.0, 22.0, 23.0, np.nan])
+
+    # only values equal to an age are placed in a bin
+    assert np.array_equal(
+        _get_bin_codes_age(input_data, age_bins), [-1, 0, -1, 1, 21, -1, -1]
+    )
+
+
+def test_bin_ds_matches_per_stratum(tmp_path):
+
+    files = generate_synthetic_survey(tmp_path, num_mesh_cells=100)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        survey = Survey(*files)
+        survey.load_survey_data()
+        survey.compute_transect_results()
+
+    bin_ds = generate_bin_ds(survey)
+    expected_ds = _per_stratum_generate_bin_ds(survey)
+
+    # the distributions and proportions of each stratum are unchanged
+    assert set(bin_ds.data_vars) == set(expected_ds.data_vars)
+    xr.testing.assert_allclose(bin_ds[list(expected_ds.data_vars)], expected_ds)
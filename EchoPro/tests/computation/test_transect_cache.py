@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+from EchoPro.computation.transect_cache import (
+    get_transect_cache_path,
+    load_transect_results,
+    save_transect_results,
+)
+from EchoPro.computation.transect_results import ComputeTransectVariables
+
+
+def get_survey():
+
+    params = {
+        "bio_hake_len_bin": np.linspace(2, 80, 40, dtype=np.int64),
+        "bio_hake_age_bin": np.linspace(1, 22, 22, dtype=np.int64),
+    }
+
+    df = pd.DataFrame({"haul_num": [1, 2, 3], "length": [10.0, 20.5, 31.0]})
+
+    return SimpleNamespace(
+        params=params,
+        length_df=df,
+        specimen_df=df,
+        strata_df=df,
+        geo_strata_df=df,
+        strata_sig_b=pd.Series([0.5, 0.25], index=[1, 2]),
+        nasc_df=df,
+        catch_df=df,
+        haul_to_transect_mapping_df=df,
+    )
+
+
+def test_cache_path_depends_on_inputs(tmp_path):
+
+    survey = get_survey()
+    cache_path = get_transect_cache_path(survey, None, tmp_path)
+
+    assert cache_path == get_transect_cache_path(survey, None, tmp_path)
+    assert cache_path != get_transect_cache_path(survey, [1, 2], tmp_path)
+
+    # changing any of the loaded data changes the path
+    for name in ["length_df", "catch_df", "haul_to_transect_mapping_df"]:
+        df = getattr(survey, name)
+        setattr(survey, name, df.assign(length=[10.0, 20.5, 31.5]))
+        assert cache_path != get_transect_cache_path(survey, None, tmp_path)
+        setattr(survey, name, df)
+
+
+def test_save_and_load_transect_results(tmp_path):
+
+    survey = get_survey()
+
+    bio_calc = ComputeTransectVariables(survey)
+    bio_calc.weight_fraction_all_ages_df = pd.DataFrame(
+        np.random.default_rng(0).random((2, 3)), index=[1, 2], columns=[1, 2, 3]
+    )
+    bio_calc.mix_sa_ratio = pd.Series([0.5, 1.0], name="hake_mix_coefficient")
+    bio_calc.nasc_stratum_codes = np.array([0, 1], dtype=np.int32)
+    bio_calc.bin_ds = xr.Dataset(
+        data_vars={"total_weight": ("stratum_num", np.array([1.5, 2.5]))},
+        coords={"stratum_num": ("stratum_num", np.array([1, 2], dtype=np.int64))},
+    )
+
+    cache_path = get_transect_cache_path(survey, None, tmp_path)
+    save_transect_results(bio_calc, cache_path)
+
+    # saving the same results again is allowed
+    save_transect_results(bio_calc, cache_path)
+
+    loaded = load_transect_results(survey, cache_path)
+
+    assert loaded.survey is survey
+    assert loaded.weight_fraction_all_ages_df.equals(
+        bio_calc.weight_fraction_all_ages_df
+    )
+    assert loaded.mix_sa_ratio.equals(bio_calc.mix_sa_ratio)
+    assert np.array_equal(loaded.nasc_stratum_codes, bio_calc.nasc_stratum_codes)
+    assert loaded.transect_results_gdf is None
+    xr.testing.assert_identical(loaded.bin_ds, bio_calc.bin_ds)
+
+    # no temporary directories are left behind
+    assert [path.name for path in tmp_path.iterdir()] == [cache_path.name]
@@ -0,0 +1,148 @@
+import contextlib
+import io
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from EchoPro import Survey
+from EchoPro.utils.binning import get_bin_ind
+from EchoPro.utils.synthetic_data import generate_synthetic_survey
+
+
+def _per_age_bin_weight_proportion(
+    df: pd.DataFrame,
+    age_bin_ind: int,
+    len_bins: np.ndarray,
+    age_bins: np.ndarray,
+    exclude_age1: bool,
+) -> float:
+    """
+    Computes the weight proportion of animals in an age bin, which is
+    the implementation of ``_get_all_age_weight_proportions`` before the
+    weight of all strata and age bins was accumulated at once.
+    """
+
+    # account for the case when df is a Series
+    if isinstance(df, pd.Series):
+        input_arr_len = np.array([df.length])
+        input_arr_age = np.array([df.age])
+        input_arr_wgt = np.array([df.weight])
+    else:
+        input_arr_len = df.length.values
+        input_arr_age = df.age.values
+        input_arr_wgt = df.weight.values
+
+    # bin the ages
+    age_bins_ind = get_bin_ind(input_arr_age, age_bins)
+
+    # bin those lengths that correspond to the lengths in the given age bin
+    len_bin_ind = get_bin_ind(input_arr_len[age_bins_ind[age_bin_ind]], len_bins)
+
+    if exclude_age1 is True:
+
+        # return 0.0, since no data should be included here
+        if age_bin_ind == 0:
+            return 0.0
+
+        # bin those lengths that correspond to the lengths in the first age bin
+        len_bin_ind_0 = get_bin_ind(input_arr_len[age_bins_ind[0]], len_bins)
+
+        # get the weight of the first age bin
+        wgt_age_0 = np.array(
+            [np.sum(input_arr_wgt[age_bins_ind[0][i]]) for i in len_bin_ind_0]
+        ).sum()
+
+        # get total weight minus the first age bin weight
+        denominator_wgt = input_arr_wgt.sum() - wgt_age_0
+    else:
+
+        # get total weight
+        denominator_wgt = input_arr_wgt.sum()
+
+    # the weight of animals in a given age bin
+    numerator_wgt = np.array(
+        [np.sum(input_arr_wgt[age_bins_ind[age_bin_ind][i]]) for i in len_bin_ind]
+    ).sum()
+
+    # the weight proportion of animals for a given age
+    if denominator_wgt != 0.0:
+        return numerator_wgt / denominator_wgt
+    else:
+        return numerator_wgt
+
+
+def _per_stratum_weight_fraction_all_ages(
+    bio_calc, exclude_age1: bool
+) -> Dict[str, pd.DataFrame]:
+    """
+    Computes the weight fraction of all age bins with a loop over the
+    strata, age bins, and sexes, which is the implementation of
+    ``_get_weight_fraction_all_ages`` before it was vectorized.
+    """
+
+    spec_drop = bio_calc.specimen_df.dropna(how="any")
+
+    # obtain the male and female entries of spec_drop
+    spec_drop_M = spec_drop[spec_drop["sex"] == 1]
+    spec_drop_F = spec_drop[spec_drop["sex"] == 2]
+
+    age_bins = bio_calc.bio_hake_age_bin
+    bin_columns = ["age_bin_" + str(i + 1) for i in range(len(age_bins))]
+
+    dfs = {
+        name: pd.DataFrame(
+            columns=bin_columns, index=bio_calc.all_strata, dtype=np.float64
+        )
+        for name in ["all", "male", "female"]
+    }
+
+    for stratum in bio_calc.all_strata:
+
+        # select specimen data
+        spec_in = {
+            "all": spec_drop.loc[bio_calc.stratum_choices[stratum]],
+            "male": spec_drop_M.loc[bio_calc.stratum_choices[stratum]],
+            "female": spec_drop_F.loc[bio_calc.stratum_choices[stratum]],
+        }
+
+        # obtain the weight fraction for all age bins and a given stratum
+        for j in range(len(age_bins)):
+            for name, df in spec_in.items():
+                dfs[name].loc[stratum, bin_columns[j]] = _per_age_bin_weight_proportion(
+                    df, j, bio_calc.bio_hake_len_bin, age_bins, exclude_age1
+                )
+
+    return dfs
+
+
+@pytest.mark.parametrize("exclude_age1", [True, False])
+def test_weight_fraction_all_ages_matches_loop(tmp_path, exclude_age1):
+
+    files = generate_synthetic_survey(tmp_path, num_mesh_cells=100)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        survey = Survey(*files)
+        survey.load_survey_data()
+        survey.compute_transect_results()
+
+    # age 1 data can only be loaded when it is excluded, so the
+    # weight fractions are recomputed with the requested setting
+    survey.params["exclude_age1"] = exclude_age1
+    bio_calc = survey.bio_calc
+    bio_calc._get_weight_fraction_all_ages()
+
+    expected_dfs = _per_stratum_weight_fraction_all_ages(bio_calc, exclude_age1)
+
+    for name, df in [
+        ("all", bio_calc.weight_fraction_all_ages_df),
+        ("male", bio_calc.weight_fraction_all_ages_male_df),
+        ("female", bio_calc.weight_fraction_all_ages_female_df),
+    ]:
+        pd.testing.assert_frame_equal(df, expected_dfs[name])
+
+    # the first age bin is only excluded when requested
+    assert (bio_calc.weight_fraction_all_ages_df["age_bin_1"] == 0.0).all() == (
+        exclude_age1
+    )
@@ -0,0 +1,211 @@
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import Point, Polygon, box
+from shapely.ops import unary_union
+
+from EchoPro.data_loader import KrigingMesh, load_mesh_store, save_mesh_store
+
+
+@pytest.fixture
+def krig_mesh() -> KrigingMesh:
+    """
+    Constructs a KrigingMesh with a regular mesh, where many
+    points lie on the edges and vertices of the test polygon.
+    """
+
+    lon, lat = np.meshgrid(np.linspace(-131.0, -119.0, 97), np.linspace(34.0, 46.0, 97))
+
+    mesh_df = pd.DataFrame(
+        {
+            "centroid_latitude": lat.ravel(),
+            "centroid_longitude": lon.ravel(),
+            "fraction_cell_in_polygon": 1.0,
+        }
+    )
+    mesh_gdf = gpd.GeoDataFrame(
+        mesh_df,
+        geometry=gpd.points_from_xy(
+            mesh_df["centroid_longitude"], mesh_df["centroid_latitude"]
+        ),
+    )
+
+    contour_df = pd.DataFrame(
+        {
+            "latitude": np.linspace(33.0, 47.0, 15),
+            "longitude": np.linspace(-125.0, -124.0, 15),
+        }
+    )
+    smoothed_contour_gdf = gpd.GeoDataFrame(
+        contour_df,
+        geometry=gpd.points_from_xy(contour_df["longitude"], contour_df["latitude"]),
+    )
+
+    return KrigingMesh(
+        None, mesh_gdf=mesh_gdf, smoothed_contour_gdf=smoothed_contour_gdf
+    )
+
+
+@pytest.mark.parametrize("num_grid_cells", [None, 1, 7, 16, 64])
+def test_within_mask_matches_within(krig_mesh, num_grid_cells):
+
+    # a polygon with a hole, combined with a disjoint circle
+    transect_polygon = (
+        box(-130.0, 35.0, -125.0, 45.0)
+        .difference(box(-129.0, 38.0, -127.0, 40.0))
+        .union(Point(-122.0, 40.0).buffer(1.5))
+    )
+
+    expected = krig_mesh.mesh_gdf["geometry"].within(transect_polygon).to_numpy()
+
+    in_poly = krig_mesh.get_within_mask(transect_polygon, num_grid_cells)
+
+    assert np.array_equal(in_poly, expected)
+
+    reduced_mesh_gdf = krig_mesh.reduce_grid_points(transect_polygon, num_grid_cells)
+    assert reduced_mesh_gdf.index.equals(krig_mesh.mesh_gdf.index[expected])
+
+
+@pytest.mark.parametrize("n_close", [2, 3, 5, 40])
+def test_polygon_of_transects(krig_mesh, n_close):
+
+    rng = np.random.default_rng(0)
+
+    # transects of varying length spread along the coast, where the last
+    # transect has two points, so that its convex hull is a LineString
+    num_points = list(rng.integers(3, 30, 24)) + [2]
+    latitude = [
+        35.0 + 0.4 * i + rng.normal(0, 0.05, n) for i, n in enumerate(num_points)
+    ]
+    transect_df = pd.DataFrame(
+        {
+            "latitude": np.concatenate(latitude),
+            "longitude": np.concatenate(
+                [rng.uniform(-126.0, -123.0, n) for n in num_points]
+            ),
+        },
+        index=pd.Index(
+            np.repeat(np.arange(len(num_points)) + 1, num_points), name="transect_num"
+        ),
+    )
+    gdf = gpd.GeoDataFrame(
+        transect_df,
+        geometry=gpd.points_from_xy(transect_df["longitude"], transect_df["latitude"]),
+    )
+
+    # construct the polygon by searching for the closest transects of each transect
+    gdf_tran_mean = krig_mesh._get_coordinate_mean(gdf)
+    transect_polygons = []
+    for transect in gdf_tran_mean.index:
+        closest_trans = gdf_tran_mean.geometry.distance(
+            gdf_tran_mean.loc[transect, "geometry"]
+        ).nsmallest(n_close)
+        transect_polygons.append(
+            Polygon(list(gdf.loc[closest_trans.index, "geometry"])).convex_hull
+        )
+    expected = unary_union(transect_polygons).buffer(1.25 / 60.0)
+
+    transect_polygon = krig_mesh.get_polygon_of_transects(gdf, n_close)
+
+    assert transect_polygon.symmetric_difference(expected).area == pytest.approx(
+        0.0, abs=1e-12
+    )
+
+
+def test_mesh_transformation_cache(krig_mesh):
+    def get_expected(d_x, d_y):
+        mesh_df = krig_mesh.align_longitude(krig_mesh.mesh_gdf)
+        return krig_mesh.apply_distance_transformation(mesh_df, d_x, d_y)
+
+    krig_mesh.transect_d_x, krig_mesh.transect_d_y = 1.5, 2.0
+    krig_mesh.apply_coordinate_transformation(coord_type="mesh")
+    aligned_mesh_gdf = krig_mesh._get_aligned_mesh()[0]
+    transformed_mesh_df = krig_mesh.transformed_mesh_df
+
+    # the same parameters reuse the transformed mesh
+    krig_mesh.apply_coordinate_transformation(coord_type="mesh")
+    assert krig_mesh.transformed_mesh_df is transformed_mesh_df
+
+    # new transect distances reuse the aligned mesh
+    krig_mesh.transect_d_x, krig_mesh.transect_d_y = 3.0, 0.5
+    krig_mesh.apply_coordinate_transformation(coord_type="mesh")
+    assert krig_mesh._get_aligned_mesh()[0] is aligned_mesh_gdf
+
+    x_mesh, y_mesh = get_expected(3.0, 0.5)
+    assert np.array_equal(krig_mesh.transformed_mesh_df["x_mesh"].to_numpy(), x_mesh)
+    assert np.array_equal(krig_mesh.transformed_mesh_df["y_mesh"].to_numpy(), y_mesh)
+
+    # a new mesh is aligned again
+    krig_mesh.mesh_gdf = krig_mesh.mesh_gdf.iloc[::2]
+    krig_mesh.apply_coordinate_transformation(coord_type="mesh")
+
+    x_mesh, _ = get_expected(3.0, 0.5)
+    assert len(krig_mesh.transformed_mesh_df) == len(krig_mesh.mesh_gdf)
+    assert np.array_equal(krig_mesh.transformed_mesh_df["x_mesh"].to_numpy(), x_mesh)
+
+
+def test_transform_coords_matches_gdf_transformation(krig_mesh):
+
+    # include points outside of the latitude range of the contour
+    lat = np.array([30.0, 34.5, 40.0, 45.5, 50.0])
+    lon = np.array([-126.0, -125.0, -124.5, -123.0, -122.0])
+    gdf = gpd.GeoDataFrame(geometry=gpd.points_from_xy(lon, lat))
+
+    aligned_gdf = krig_mesh.align_longitude(gdf)
+    d_x = aligned_gdf.geometry.x.max() - aligned_gdf.geometry.x.min()
+    d_y = aligned_gdf.geometry.y.max() - aligned_gdf.geometry.y.min()
+    x_expected, y_expected = krig_mesh.apply_distance_transformation(
+        aligned_gdf, d_x, d_y
+    )
+
+    lon_aligned, x, y, d_x_coords, d_y_coords = krig_mesh.transform_coords(lon, lat)
+
+    assert np.array_equal(
+        lon_aligned, aligned_gdf["longitude_transformed"], equal_nan=True
+    )
+    assert (d_x_coords, d_y_coords) == (d_x, d_y)
+    assert np.array_equal(x, x_expected, equal_nan=True)
+    assert np.array_equal(y, y_expected, equal_nan=True)
+
+
+def test_mesh_store(krig_mesh, tmp_path):
+
+    save_mesh_store(krig_mesh.mesh_gdf, tmp_path / "mesh_store")
+
+    with pytest.raises(ValueError):
+        save_mesh_store(krig_mesh.mesh_gdf, tmp_path / "mesh_store")
+
+    mesh_df = load_mesh_store(tmp_path / "mesh_store")
+
+    pd.testing.assert_frame_equal(
+        mesh_df,
+        pd.DataFrame(krig_mesh.mesh_gdf.drop(columns="geometry")),
+        check_exact=True,
+    )
+
+    # the mesh is memory-mapped in read-only mode
+    assert not mesh_df["centroid_latitude"].to_numpy().flags.writeable
+
+
+def test_lazy_mesh_geometry(krig_mesh):
+
+    mesh_gdf = krig_mesh.mesh_gdf
+    lazy_mesh = KrigingMesh(
+        None,
+        mesh_gdf=pd.DataFrame(mesh_gdf.drop(columns="geometry")),
+        smoothed_contour_gdf=krig_mesh.smoothed_contour_gdf,
+    )
+
+    # the mask and the transformation do not construct the mesh points
+    transect_polygon = Point(-125.0, 40.0).buffer(3.0)
+    in_poly = lazy_mesh.get_within_mask(transect_polygon)
+    lazy_mesh.transect_d_x, lazy_mesh.transect_d_y = 1.5, 2.0
+    lazy_mesh.apply_coordinate_transformation(coord_type="mesh")
+    assert lazy_mesh._mesh_gdf is None
+
+    assert np.array_equal(in_poly, mesh_gdf["geometry"].within(transect_polygon))
+
+    # the points are constructed when first accessed
+    assert lazy_mesh.mesh_gdf.geometry.geom_equals(mesh_gdf.geometry).all()
+    assert lazy_mesh.mesh_gdf is lazy_mesh.mesh_gdf
@@ -0,0 +1,212 @@
+from types import SimpleNamespace
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+
+from EchoPro.computation import (
+    ComputeTransectVariables,
+    add_biomass_age_columns,
+    compute_biomass_age,
+    get_kriging_results_ds,
+    get_kriging_results_gdf,
+    get_kriging_results_gdfs,
+    open_kriging_results,
+    save_kriging_results,
+)
+from EchoPro.utils.coded_index import CodedIndex
+
+
+@pytest.fixture
+def bio_calc() -> ComputeTransectVariables:
+    """
+    Constructs a ComputeTransectVariables object with Kriging
+    results that have the same layout as those of ``Kriging``,
+    over a mesh with a non-contiguous index.
+    """
+
+    rng = np.random.default_rng(0)
+    num_cells = 50
+    age_bins = np.arange(1, 23)
+
+    survey = SimpleNamespace(
+        params={"bio_hake_len_bin": np.arange(2, 82, 2), "bio_hake_age_bin": age_bins}
+    )
+    bio_calc = ComputeTransectVariables(survey)
+
+    results_gdf = gpd.GeoDataFrame(
+        {
+            "centroid_latitude": rng.uniform(34.0, 55.0, num_cells),
+            "centroid_longitude": rng.uniform(-135.0, -120.0, num_cells),
+            "fraction_cell_in_polygon": rng.uniform(0.0, 1.0, num_cells),
+        },
+        index=np.arange(0, 2 * num_cells, 2),
+    )
+    results_gdf["geometry"] = gpd.points_from_xy(
+        results_gdf["centroid_longitude"], results_gdf["centroid_latitude"]
+    )
+    results_gdf["stratum_num"] = pd.Categorical(
+        rng.integers(1, 9, num_cells), categories=np.arange(1, 9)
+    )
+    for col in [
+        "biomass_density_adult_mean",
+        "biomass_adult",
+        "abundance_adult",
+        "NASC",
+    ]:
+        results_gdf[col] = rng.uniform(0.0, 1e4, num_cells)
+
+    bio_calc.kriging_results_male_gdf = results_gdf[
+        ["centroid_latitude", "centroid_longitude", "geometry", "stratum_num"]
+    ].copy()
+    bio_calc.kriging_results_female_gdf = bio_calc.kriging_results_male_gdf.copy()
+
+    for gdf in [bio_calc.kriging_results_male_gdf, bio_calc.kriging_results_female_gdf]:
+        gdf["biomass_adult"] = rng.uniform(0.0, 1e4, num_cells)
+        gdf["abundance_adult"] = rng.uniform(0.0, 1e4, num_cells)
+
+    for gdf in [
+        results_gdf,
+        bio_calc.kriging_results_male_gdf,
+        bio_calc.kriging_results_female_gdf,
+    ]:
+        for age_bin in age_bins:
+            gdf[f"biomass_age_bin_{age_bin}"] = rng.uniform(0.0, 1e3, num_cells)
+
+    bio_calc.kriging_results_gdf = results_gdf
+
+    return bio_calc
+
+
+def _get_gdfs(bio_calc) -> dict:
+    return {
+        name: getattr(bio_calc, name)
+        for name in [
+            "kriging_results_gdf",
+            "kriging_results_male_gdf",
+            "kriging_results_female_gdf",
+        ]
+    }
+
+
+def test_kriging_results_ds_layout(bio_calc):
+
+    ds = get_kriging_results_ds(bio_calc)
+
+    assert ds["biomass_age"].dims == ("cell", "sex", "age_bin")
+    assert ds["biomass_adult"].dims == ("cell", "sex")
+    assert ds["NASC"].dims == ("cell",)
+    assert list(ds["sex"].values) == ["all", "male", "female"]
+
+    assert np.array_equal(
+        ds["biomass_age"].sel(sex="male", age_bin=3).values,
+        bio_calc.kriging_results_male_gdf["biomass_age_bin_3"].values,
+    )
+
+
+def test_kriging_results_round_trip(bio_calc, tmp_path):
+
+    expected_gdfs = _get_gdfs(bio_calc)
+    ds = get_kriging_results_ds(bio_calc)
+
+    for name, gdf in get_kriging_results_gdfs(ds).items():
+        pd.testing.assert_frame_equal(gdf, expected_gdfs[name], check_exact=True)
+
+    save_kriging_results(ds, tmp_path / "results.nc")
+
+    with open_kriging_results(tmp_path / "results.nc") as ds_file:
+        for name, gdf in get_kriging_results_gdfs(ds_file).items():
+            pd.testing.assert_frame_equal(gdf, expected_gdfs[name], check_exact=True)
+
+
+def test_kriging_results_from_ds(bio_calc):
+
+    expected_gdfs = _get_gdfs(bio_calc)
+
+    bio_calc.kriging_results_ds = get_kriging_results_ds(bio_calc)
+    bio_calc.kriging_results_gdf = None
+    bio_calc.kriging_results_male_gdf = None
+    bio_calc.kriging_results_female_gdf = None
+
+    # the GeoDataFrames are constructed from the Dataset when accessed
+    for name, gdf in _get_gdfs(bio_calc).items():
+        pd.testing.assert_frame_equal(gdf, expected_gdfs[name], check_exact=True)
+
+    # the constructed GeoDataFrames are kept
+    assert bio_calc.kriging_results_gdf is bio_calc.kriging_results_gdf
+
+
+def test_kriging_results_gdf_per_sex(bio_calc):
+
+    expected_gdfs = _get_gdfs(bio_calc)
+    ds = get_kriging_results_ds(bio_calc)
+
+    # only the GeoDataFrame of the accessed sex is constructed
+    bio_calc.kriging_results_ds = ds
+    pd.testing.assert_frame_equal(
+        bio_calc.kriging_results_male_gdf,
+        expected_gdfs["kriging_results_male_gdf"],
+        check_exact=True,
+    )
+    assert list(bio_calc._kriging_results_gdfs.keys()) == ["male"]
+
+    pd.testing.assert_frame_equal(
+        get_kriging_results_gdf(ds, "female"),
+        expected_gdfs["kriging_results_female_gdf"],
+        check_exact=True,
+    )
+
+    # the constructed GeoDataFrames are discarded when the results are replaced
+    bio_calc.kriging_results_ds = ds.assign(NASC=2.0 * ds["NASC"])
+    assert np.array_equal(
+        bio_calc.kriging_results_gdf["NASC"],
+        2.0 * expected_gdfs["kriging_results_gdf"]["NASC"],
+    )
+
+
+def test_compute_biomass_age():
+
+    rng = np.random.default_rng(1)
+    strata_index = CodedIndex(np.arange(1, 9))
+    stratum_num = rng.integers(1, 9, 40)
+    stratum_codes = strata_index.get_codes(stratum_num)
+
+    columns = [f"age_bin_{age_bin}" for age_bin in range(1, 23)]
+    weight_fraction_dfs = [
+        pd.DataFrame(
+            rng.uniform(0.0, 1.0, (8, 22)), index=np.arange(1, 9), columns=columns
+        )
+        for _ in range(3)
+    ]
+    biomass_columns = [pd.Series(rng.uniform(0.0, 1e4, 40)) for _ in range(3)]
+
+    biomass_age = compute_biomass_age(
+        strata_index, stratum_codes, weight_fraction_dfs, biomass_columns, dim="point"
+    )
+
+    assert biomass_age.dims == ("point", "sex", "age_bin")
+    assert biomass_age.values.flags["C_CONTIGUOUS"]
+
+    for i, sex in enumerate(["all", "male", "female"]):
+        results_df = add_biomass_age_columns(
+            pd.DataFrame(index=range(40)), biomass_age, sex
+        )
+
+        for col in columns:
+            expected = (
+                weight_fraction_dfs[i].loc[stratum_num, col].values * biomass_columns[i]
+            )
+            assert np.array_equal(results_df["biomass_" + col].values, expected.values)
+
+
+def test_save_kriging_results_float32(bio_calc, tmp_path):
+
+    ds = get_kriging_results_ds(bio_calc)
+    save_kriging_results(ds, tmp_path / "results.nc", precision="float32")
+
+    with open_kriging_results(tmp_path / "results.nc") as ds_file:
+        assert ds_file["biomass_age"].dtype == np.float32
+        assert ds_file["centroid_latitude"].dtype == np.float64
+
+        np.testing.assert_allclose(ds_file["biomass_age"], ds["biomass_age"], rtol=1e-7)
@@ -0,0 +1,130 @@
+import contextlib
+import io
+
+import numpy as np
+import pytest
+
+from EchoPro import Survey
+from EchoPro.computation import Kriging, SemiVariogram
+from EchoPro.computation.numba_functions import nb_dis_mat, nb_subtract_outer
+from EchoPro.utils.scaling import KRIGING_PARAMS
+from EchoPro.utils.synthetic_data import generate_synthetic_survey
+
+
+def _max_rel_err(expected: np.ndarray, actual: np.ndarray) -> float:
+    """
+    Obtains the maximum absolute error relative to the largest expected value.
+    """
+
+    expected = np.asarray(expected, dtype=np.float64)
+    actual = np.asarray(actual, dtype=np.float64)
+
+    finite = np.isfinite(expected) & np.isfinite(actual)
+    assert np.array_equal(finite, np.isfinite(expected))
+
+    return np.max(np.abs(expected[finite] - actual[finite])) / np.max(
+        np.abs(expected[finite])
+    )
+
+
+def test_numba_functions_float32():
+
+    rng = np.random.default_rng(0)
+    a, b = rng.uniform(-1.0, 1.0, (2, 100))
+
+    dis = nb_dis_mat(nb_subtract_outer(a, b), nb_subtract_outer(b, a))
+    dis_32 = nb_dis_mat(
+        nb_subtract_outer(a.astype(np.float32), b.astype(np.float32)),
+        nb_subtract_outer(b.astype(np.float32), a.astype(np.float32)),
+    )
+
+    assert dis_32.dtype == np.float32
+    assert _max_rel_err(dis, dis_32) < 1e-6
+
+
+def test_run_kriging_float32():
+
+    rng = np.random.default_rng(0)
+    x_mesh, y_mesh, x_data, y_data = rng.uniform(-0.1, 0.1, (4, 500))
+    field = rng.exponential(1.0, 500)
+
+    results = {
+        precision: Kriging(
+            None,
+            s_v_model=SemiVariogram.generalized_exp_bessel,
+            precision=precision,
+            **KRIGING_PARAMS,
+        ).run_kriging(x_mesh, x_data, y_mesh, y_data, field)
+        for precision in ["float64", "float32"]
+    }
+
+    # the Kriging systems are solved in float64
+    for expected, actual in zip(results["float64"], results["float32"]):
+        assert actual.dtype == np.float64
+        assert _max_rel_err(expected, actual) < 1e-6
+
+
+def test_semi_variogram_float32():
+
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(-0.1, 0.1, (2, 300))
+    field = rng.exponential(1.0, 300)
+
+    gamma = {}
+    for precision in ["float64", "float32"]:
+        semi_vario = SemiVariogram(
+            x, y, field, lag_res=0.002, nlag=30, precision=precision
+        )
+        semi_vario.calculate_semi_variogram()
+        gamma[precision] = semi_vario.gamma_normalized
+
+    assert _max_rel_err(gamma["float64"], gamma["float32"]) < 1e-5
+
+
+def test_survey_precision(tmp_path):
+
+    files = generate_synthetic_survey(tmp_path, num_mesh_cells=1000)
+
+    with pytest.raises(ValueError):
+        Survey(*files, precision="float16")
+
+    results = {}
+    for precision in ["float64", "float32"]:
+        with contextlib.redirect_stdout(io.StringIO()):
+            survey = Survey(*files, precision=precision)
+            survey.load_survey_data()
+            survey.compute_transect_results()
+
+            krig_mesh = survey.get_kriging_mesh()
+            krig_mesh.apply_coordinate_transformation(coord_type="transect")
+            krig_mesh.apply_coordinate_transformation(coord_type="mesh")
+
+            krig = survey.get_kriging(
+                dict(KRIGING_PARAMS, s_v_model=SemiVariogram.generalized_exp_bessel)
+            )
+            krig.run_biomass_kriging(krig_mesh)
+            krig.compute_kriging_variables()
+
+            results[precision] = (
+                survey.bio_calc.kriging_results_gdf,
+                survey.bio_calc.kriging_biomass_age,
+                survey.run_cv_analysis(kriged_data=True, seed=1),
+            )
+
+    results_gdf, biomass_age, cv = results["float64"]
+    results_gdf_32, biomass_age_32, cv_32 = results["float32"]
+
+    assert biomass_age_32.dtype == np.float32
+    assert _max_rel_err(biomass_age.values, biomass_age_32.values) < 1e-6
+
+    for col in [
+        "biomass_density_adult_mean",
+        "biomass_density_adult_var",
+        "biomass_adult",
+    ]:
+        assert _max_rel_err(results_gdf[col], results_gdf_32[col]) < 1e-6
+
+    assert results_gdf_32["biomass_adult"].sum() == pytest.approx(
+        results_gdf["biomass_adult"].sum(), rel=1e-7
+    )
+    assert cv_32 == pytest.approx(cv, rel=1e-7)
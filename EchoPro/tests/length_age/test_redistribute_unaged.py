@@ -0,0 +1,168 @@
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from EchoPro.computation.length_age_variables import _redistribute_unaged_kriged_biomass
+
+
+def _matlab_redistribute_unaged_kriged_biomass(
+    len_age_biomass_list: List[pd.DataFrame], biomass_unaged: np.ndarray
+) -> None:
+    """
+    Redistributes the unaged data to the rest of the age bins
+    by directly modifying the data in ``len_age_biomass_list``.
+
+    Parameters
+    ----------
+    len_age_biomass_list: list of pd.DataFrame
+        A list of DataFrames containing the male and female biomass at
+        each length and age bin
+    biomass_unaged: np.ndarray
+        The unaged biomass for all genders
+
+    Notes
+    -----
+    This code was directly copied from the Matlab version of EchoPro with
+    only small modifications made to account for Python syntax
+    """
+
+    # get numpy arrays of the male and female DataFrames
+    # scaling of variables was done to match Matlab code
+    male_arr = len_age_biomass_list[0].to_numpy() * 1e-6
+    female_arr = len_age_biomass_list[1].to_numpy() * 1e-6
+
+    # initialize matrices that will hold the unaged data to distribute to age bins
+    Uaged2aged_mat_M = np.zeros((male_arr.shape[0], male_arr.shape[1] - 1))
+    Uaged2aged_mat_F = np.zeros((male_arr.shape[0], male_arr.shape[1] - 1))
+
+    # establish constant variables (done to match Matlab code)
+    threshold = 1e-10
+    eps = 2.22044604925031e-16
+
+    # scale biomass_unaged to match Matlab code
+    biomass_unaged = 1e-6 * biomass_unaged
+
+    for i in range(male_arr.shape[0]):
+
+        if (sum(male_arr[i, :-1]) < threshold) and (
+            sum(female_arr[i, :-1]) < threshold
+        ):
+            # neither male and nor female hake at ith length bin is found
+            # for aged hake (bio-sample station 2)
+            if male_arr[i, -1] < threshold:
+                # no unaged hake found at bio-sample station 1
+                Uaged2aged_mat_M[i, :] = 0.0
+                Uaged2aged_mat_F[i, :] = 0.0
+            else:
+
+                # unaged hake found at bio-sample station 1
+                sum_over_ageM = male_arr[:, :-1].sum(axis=1)
+                ind_M = np.argwhere(sum_over_ageM > eps).flatten() + 1
+                ind_sel_M = np.argmin(abs(ind_M - (i + 1))) + 1
+                ind_sel_M = ind_sel_M + min(ind_M) - 1
+
+                sum_over_ageF = female_arr[:, :-1].sum(axis=1)
+                ind_F = np.argwhere(sum_over_ageF > eps).flatten() + 1
+                ind_sel_F = np.argmin(abs(ind_F - (i + 1))) + 1
+                ind_sel_F = ind_sel_F + min(ind_F) - 1
+
+                if ind_sel_F < ind_sel_M:
+                    # closest length bin has no aged female, using the smaller
+                    # length bin aged female data
+                    while sum(female_arr[ind_sel_F - 1, :-1]) == 0:
+                        ind_sel_F = ind_sel_F - 1
+                    Uaged2aged_mat_M[i, :] = (
+                        male_arr[i, -1]
+                        * female_arr[ind_sel_F - 1, :-1]
+                        / sum(female_arr[ind_sel_F - 1, :-1])
+                    )
+                    Uaged2aged_mat_F[i, :] = (
+                        female_arr[i, -1]
+                        * female_arr[ind_sel_F - 1, :-1]
+                        / sum(female_arr[ind_sel_F - 1, :-1])
+                    )
+                else:
+                    # closest length bin has no aged male, using the smaller
+                    # length bin aged male data
+                    while sum(male_arr[ind_sel_M - 1, :-1]) == 0:
+                        ind_sel_M = ind_sel_M - 1
+                    Uaged2aged_mat_M[i, :] = (
+                        male_arr[i, -1]
+                        * male_arr[ind_sel_M - 1, :-1]
+                        / sum(male_arr[ind_sel_M - 1, :-1])
+                    )
+                    Uaged2aged_mat_F[i, :] = (
+                        female_arr[i, -1]
+                        * male_arr[ind_sel_M - 1, :-1]
+                        / sum(male_arr[ind_sel_M - 1, :-1])
+                    )
+        elif (sum(male_arr[i, :-1]) < threshold) and (male_arr[i, -1] > threshold):
+            # no male hake at ith length bin for aged hake (bio-sample station 2)
+            # but has samples for unaged hake (bio-sample station 1)
+            Uaged2aged_mat_M[i, :] = (
+                male_arr[i, -1] * female_arr[i, :-1] / sum(female_arr[i, :-1])
+            )
+            Uaged2aged_mat_F[i, :] = (
+                female_arr[i, -1] * female_arr[i, :-1] / sum(female_arr[i, :-1])
+            )
+        elif (sum(female_arr[i, :-1]) < threshold) and (female_arr[i, -1] > threshold):
+            # no female hake at ith length bin for aged hake (bio-sample station 2)
+            # but has samples for unaged hake (bio-sample station 1)
+            Uaged2aged_mat_M[i, :] = (
+                male_arr[i, -1] * male_arr[i, :-1] / sum(male_arr[i, :-1])
+            )
+            Uaged2aged_mat_F[i, :] = (
+                female_arr[i, -1] * male_arr[i, :-1] / sum(male_arr[i, :-1])
+            )
+        elif (
+            (sum(male_arr[i, :-1]) > threshold)
+            and (sum(female_arr[i, :-1]) > threshold)
+            and (biomass_unaged[i] > threshold)
+        ):
+            # both male and female hake have samples at ith length bin for aged hake
+            # (bio-sample station 2) and unaged hake (bio-sample station 1)
+            Uaged2aged_mat_M[i, :] = (
+                male_arr[i, -1] * male_arr[i, :-1] / sum(male_arr[i, :-1])
+            )
+            Uaged2aged_mat_F[i, :] = (
+                female_arr[i, -1] * female_arr[i, :-1] / sum(female_arr[i, :-1])
+            )
+
+    # distributed the unaged data to the existing data at the age bins
+    # scaling is performed to return to the original values
+    len_age_biomass_list[0].iloc[:, :-1] += Uaged2aged_mat_M * 1e6
+    len_age_biomass_list[1].iloc[:, :-1] += Uaged2aged_mat_F * 1e6
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+def test_redistribute_unaged_kriged_biomass(seed):
+
+    rng = np.random.default_rng(seed)
+    num_len, num_age = 40, 22
+
+    # create male and female biomass (aged bins and an un-aged column)
+    # with empty length bins so that all cases of the algorithm are used
+    len_age_biomass = []
+    for _ in range(2):
+        arr = rng.uniform(0.0, 1e6, (num_len, num_age + 1))
+        arr[rng.uniform(size=num_len) < 0.3, :-1] = 0.0
+        arr[rng.uniform(size=num_len) < 0.2, -1] = 0.0
+        len_age_biomass.append(arr)
+
+    # length bins with no aged data for both genders
+    arr_M, arr_F = len_age_biomass
+    arr_M[[0, 5, 6, 30, 39], :-1] = 0.0
+    arr_F[[0, 5, 6, 30, 39], :-1] = 0.0
+    biomass_unaged = rng.uniform(0.0, 1e6, num_len)
+    biomass_unaged[rng.uniform(size=num_len) < 0.2] = 0.0
+
+    expected = [pd.DataFrame(arr.copy()) for arr in len_age_biomass]
+    _matlab_redistribute_unaged_kriged_biomass(expected, biomass_unaged)
+
+    result = [pd.DataFrame(arr.copy()) for arr in len_age_biomass]
+    _redistribute_unaged_kriged_biomass(result, biomass_unaged)
+
+    for res_df, exp_df in zip(result, expected):
+        pd.testing.assert_frame_equal(res_df, exp_df, check_exact=True)
@@ -0,0 +1,128 @@
+import pytest
+
+from EchoPro import Pipeline
+
+
+class RecordingSurvey:
+    """
+    A stand-in for ``Survey`` that records the routines the pipeline calls.
+    """
+
+    def __init__(self, tmp_path):
+        self.params = {"data_root_dir": tmp_path}
+        self.calls = []
+
+    def load_survey_data(self):
+        self.calls.append("load")
+
+    def get_kriging_mesh(self):
+        self.calls.append("mesh")
+        return RecordingMesh(self)
+
+    def compute_transect_results(self, selected_transects=None, cache_dir=None):
+        self.calls.append("transect_results")
+
+    def get_kriging(self, params):
+        return RecordingKriging(self)
+
+    def compute_length_age_variables(self, data="transect"):
+        self.calls.append(f"{data}_length_age")
+
+    def create_and_write_reports(self, output_path, format="excel", reports=None):
+        self.calls.append("reports")
+
+
+class RecordingMesh:
+    def __init__(self, survey):
+        self.survey = survey
+
+    def apply_coordinate_transformation(self, coord_type="transect", **kwargs):
+        self.survey.calls.append(f"transformation_{coord_type}")
+
+
+class RecordingKriging:
+    def __init__(self, survey):
+        self.survey = survey
+
+    def run_biomass_kriging(self, krig_mesh):
+        self.survey.calls.append("kriging_results")
+
+    def compute_kriging_variables(self):
+        pass
+
+
+def test_stages_ran_in_dependency_order(tmp_path):
+
+    survey = RecordingSurvey(tmp_path)
+    pipeline = Pipeline(survey, kriging_params={"k_max": 10}, report_path=tmp_path)
+
+    stages_ran = pipeline.run()
+
+    assert sorted(stages_ran) == sorted(
+        [
+            "load",
+            "mesh",
+            "transect_results",
+            "transformation",
+            "kriging_results",
+            "transect_length_age",
+            "kriging_length_age",
+            "reports",
+        ]
+    )
+
+    # each stage finishes after the stages it depends on
+    for stage in stages_ran:
+        for dependency in pipeline._get_dependencies(stage):
+            assert stages_ran.index(dependency) < stages_ran.index(stage)
+
+
+def test_only_changed_stages_are_ran(tmp_path):
+
+    survey = RecordingSurvey(tmp_path)
+    pipeline = Pipeline(survey, kriging_params={"k_max": 10}, report_path=tmp_path)
+    pipeline.run()
+
+    # nothing has changed
+    survey.calls = []
+    assert pipeline.run() == []
+    assert survey.calls == []
+
+    # only stages that depend on the Kriging parameters are ran
+    pipeline.kriging_params = {"k_max": 8}
+    assert sorted(pipeline.run()) == [
+        "kriging_length_age",
+        "kriging_results",
+        "reports",
+    ]
+
+    # stages that depend on the transect results are invalidated,
+    # even if they are not requested
+    pipeline.selected_transects = [1, 2]
+    assert sorted(pipeline.run(["transect_length_age"])) == [
+        "transect_length_age",
+        "transect_results",
+    ]
+    assert sorted(pipeline.run()) == [
+        "kriging_length_age",
+        "kriging_results",
+        "reports",
+        "transformation",
+    ]
+
+
+def test_stage_requirements(tmp_path):
+
+    pipeline = Pipeline(RecordingSurvey(tmp_path))
+
+    # without Kriging parameters and a report path, only transect stages are ran
+    assert sorted(pipeline.run()) == ["load", "transect_length_age", "transect_results"]
+
+    with pytest.raises(ValueError):
+        pipeline.run(["kriging_results"])
+
+    with pytest.raises(ValueError):
+        pipeline.run(["reports"])
+
+    with pytest.raises(ValueError):
+        pipeline.run(["unknown_stage"])
@@ -0,0 +1,154 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+from EchoPro.reports import Reports
+from EchoPro.utils.binning import get_bin_ind
+
+
+def _per_haul_bin_len_by_haul_df(
+    len_bins: np.ndarray, all_hauls: np.ndarray, df: pd.DataFrame, len_cnt_exists: bool
+) -> pd.DataFrame:
+    """
+    Bins the length data of each haul separately, which is
+    the implementation of ``Reports`` before the counts of
+    all hauls were obtained with a single ``np.bincount``.
+    """
+
+    bin_haul_df = pd.DataFrame(
+        data=0, columns=list(all_hauls), index=len_bins, dtype=np.int64
+    )
+    bin_haul_df.index.name = "length_bin"
+
+    for haul in df.index.unique().values:
+
+        # obtain length data
+        length_data = df.loc[haul]["length"]
+
+        if len_cnt_exists:
+            # obtain length count data
+            length_count_data = df.loc[haul]["length_count"]
+
+        # get numpy arrays of data accounting for single values
+        if not isinstance(length_data, pd.Series):
+            length_data = np.array([length_data])
+            if len_cnt_exists:
+                length_count_data = np.array([length_count_data])
+
+        else:
+            length_data = length_data.values.flatten()
+            if len_cnt_exists:
+                length_count_data = length_count_data.values.flatten()
+
+        # get bin indices of length data
+        len_bin_ind = get_bin_ind(length_data, len_bins)
+
+        # get total number of lengths in a bin
+        if len_cnt_exists:
+            bin_cnt = np.array([length_count_data[i].sum() for i in len_bin_ind])
+        else:
+            bin_cnt = np.array([i.shape[0] for i in len_bin_ind])
+
+        bin_haul_df[haul] = bin_cnt
+
+    return bin_haul_df
+
+
+def test_len_haul_counts_match_per_haul_binning():
+
+    rng = np.random.default_rng(0)
+
+    len_bins = np.linspace(2, 80, 40)
+    reports = Reports(SimpleNamespace(params={"bio_hake_len_bin": len_bins}))
+
+    # length data with missing lengths and animals that are not sexed
+    n = 500
+    df = pd.DataFrame(
+        {
+            "length": np.where(rng.random(n) < 0.05, np.nan, rng.uniform(0, 90, n)),
+            "sex": rng.choice([1, 2, 3], n),
+            "length_count": rng.integers(1, 10, n).astype(np.float64),
+        },
+        index=rng.choice([3, 7, 8, 12, 20], n),
+    )
+    all_hauls = np.array([1, 3, 7, 8, 12, 20])
+
+    for length_count in [df["length_count"].values, None]:
+        bin_cnt = reports._get_len_haul_counts(df, all_hauls, length_count)
+
+        assert bin_cnt.shape == (3, len(len_bins), len(all_hauls))
+
+        # compare against binning the data of each gender and haul separately
+        for i, sex_df in enumerate([df, df[df["sex"] == 1], df[df["sex"] == 2]]):
+            for j, haul in enumerate(all_hauls):
+                haul_df = sex_df[sex_df.index == haul]
+                len_bin_ind = get_bin_ind(haul_df["length"].values, len_bins)
+
+                if length_count is None:
+                    expected = [len(ind) for ind in len_bin_ind]
+                else:
+                    expected = [
+                        haul_df["length_count"].values[ind].sum() for ind in len_bin_ind
+                    ]
+
+                assert np.array_equal(bin_cnt[i, :, j], expected)
+
+        assert bin_cnt.dtype == np.int64
+
+
+def test_len_haul_dfs_match_per_haul_loop():
+
+    rng = np.random.default_rng(1)
+
+    len_bins = np.linspace(2, 80, 40)
+    n = 400
+
+    # the length counts are loaded as floats
+    length_df = pd.DataFrame(
+        {
+            "length": rng.uniform(0, 90, n),
+            "sex": rng.choice([1, 2, 3], n),
+            "length_count": rng.integers(1, 10, n).astype(np.float64),
+        },
+        index=rng.choice([3, 7, 8, 12], n),
+    )
+    specimen_df = pd.DataFrame(
+        {
+            "length": rng.uniform(0, 90, n),
+            "sex": rng.choice([1, 2, 3], n),
+            "age": np.where(rng.random(n) < 0.1, np.nan, rng.integers(1, 20, n)),
+        },
+        index=rng.choice([3, 7, 15, 20], n),
+    )
+    survey = SimpleNamespace(
+        params={"bio_hake_len_bin": len_bins},
+        length_df=length_df,
+        specimen_df=specimen_df,
+    )
+
+    len_haul_dfs = Reports(survey)._bin_len_by_haul_all_dfs()
+
+    spec_df = specimen_df.dropna(subset=["age"])
+    all_hauls = np.union1d(length_df.index.unique(), spec_df.index.unique())
+
+    expected_dfs = []
+    for sex in [None, 1, 2]:
+        sex_len_df = length_df if sex is None else length_df[length_df["sex"] == sex]
+        sex_spec_df = spec_df if sex is None else spec_df[spec_df["sex"] == sex]
+        expected_dfs += [
+            _per_haul_bin_len_by_haul_df(len_bins, all_hauls, sex_len_df, True),
+            _per_haul_bin_len_by_haul_df(len_bins, all_hauls, sex_spec_df, False),
+        ]
+
+    # the number of animals in each length bin and haul is an integer
+    for df, expected_df in zip(len_haul_dfs, expected_dfs):
+        assert (df.dtypes == np.int64).all()
+        pd.testing.assert_frame_equal(df, expected_df, check_dtype=False)
+
+    # the totals have the same layout and types as those of the per-haul loop
+    Reports.add_len_bin_haul_total(len_haul_dfs)
+    Reports.add_len_bin_haul_total(expected_dfs)
+
+    for df, expected_df in zip(len_haul_dfs, expected_dfs):
+        pd.testing.assert_frame_equal(df, expected_df)
@@ -0,0 +1,20 @@
+from EchoPro.reports import REPORT_DEPENDENCIES, RESULT_DEPENDENCIES, Reports
+
+
+def test_required_results():
+
+    # reports that only use transect based results do not need Kriging results
+    assert Reports._get_required_results(
+        ["kriging_input", "transect_based_core_output"]
+    ) == ["transect_results"]
+
+    # reports that only use the biological data need no results
+    assert Reports._get_required_results(["length_counts_haul"]) == []
+
+    # each result is placed after all results it depends on
+    required_results = Reports._get_required_results(list(REPORT_DEPENDENCIES.keys()))
+
+    assert sorted(required_results) == sorted(RESULT_DEPENDENCIES.keys())
+    for ind, result in enumerate(required_results):
+        for dependency in RESULT_DEPENDENCIES[result]:
+            assert required_results.index(dependency) < ind
@@ -0,0 +1,119 @@
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from EchoPro.reports import Reports, _write_columnar_files, _write_excel_file
+from EchoPro.utils.profiler import Profiler
+
+
+@pytest.mark.parametrize("chunk_rows", [2, 10000])
+def test_write_excel_file_matches_to_excel(tmp_path, monkeypatch, chunk_rows):
+
+    # the rows are written in chunks, which may split the DataFrame
+    monkeypatch.setattr("EchoPro.reports.EXCEL_CHUNK_ROWS", chunk_rows)
+
+    df = pd.DataFrame(
+        {
+            "Lat": [34.5, 35.0, np.nan],
+            "NASC": [0.0, np.inf, 12.25],
+            "stratum": [1, 2, 3],
+            "Region ID": pd.array([7, pd.NA, 9], dtype="Int64"),
+        },
+        index=pd.Index([3, 1, 2], name="Transect"),
+    )
+    sheet_names = ["all genders", "male"]
+
+    # write the same DataFrames with pandas and with the streaming writer
+    expected_path = tmp_path / "expected.xlsx"
+    with pd.ExcelWriter(expected_path) as writer:
+        for sheet_name in sheet_names:
+            df.to_excel(writer, sheet_name=sheet_name)
+
+    for include_index in [True, False]:
+        out_path = tmp_path / f"out_{include_index}.xlsx"
+        _write_excel_file(out_path, [df, df], sheet_names, include_index)
+
+        for sheet_name in sheet_names:
+            out_df = pd.read_excel(out_path, sheet_name=sheet_name)
+            expected_df = pd.read_excel(expected_path, sheet_name=sheet_name)
+
+            # without the index, only the index column should be missing
+            if not include_index:
+                expected_df = expected_df.drop(columns="Transect")
+
+            pd.testing.assert_frame_equal(out_df, expected_df, check_dtype=False)
+
+
+def test_write_columnar_files(tmp_path):
+
+    # length counts by haul, with a total row and column
+    df = pd.DataFrame(
+        {1: [1.0, 2.0, 3.0], 5: [0.0, 4.0, 4.0], "length_bin_total": [1.0, 6.0, 7.0]},
+        index=pd.Index([2, 4, "length_haul_total"], name="length_bin"),
+    )
+
+    for report_format in ["parquet", "arrow"]:
+        entries = _write_columnar_files(
+            tmp_path / "counts.xlsx", [df], ["all genders"], True, report_format
+        )
+
+        assert len(entries) == 1
+        assert entries[0]["path"] == f"counts/all_genders.{report_format}"
+        assert entries[0]["num_rows"] == 3
+
+        # mixed index values are stored as strings and column names as strings
+        assert [col["name"] for col in entries[0]["columns"]] == [
+            "length_bin",
+            "1",
+            "5",
+            "length_bin_total",
+        ]
+        assert [col["type"] for col in entries[0]["columns"]] == [
+            "string",
+            "double",
+            "double",
+            "double",
+        ]
+
+        if report_format == "parquet":
+            out_df = pd.read_parquet(tmp_path / entries[0]["path"])
+        else:
+            out_df = pd.read_feather(tmp_path / entries[0]["path"])
+
+        assert out_df["length_bin"].tolist() == ["2", "4", "length_haul_total"]
+        assert np.array_equal(out_df.iloc[:, 1:].values, df.values)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_report_file_writer(tmp_path, max_workers):
+
+    survey = SimpleNamespace(params={"survey_year": 2019}, profiler=Profiler())
+    report = Reports(survey)
+
+    df = pd.DataFrame({"NASC": [1.0, 2.0]}, index=pd.Index([1, 2], name="Transect"))
+
+    with report._report_file_writer(["excel", "parquet"], max_workers):
+        for i in range(3):
+            report._add_report_file(
+                [df, 2 * df], ["all", "male"], tmp_path / f"r{i}.xlsx"
+            )
+
+            # at most one report per worker is kept until it is written
+            max_pending = 0 if max_workers == 1 else max_workers
+            assert len(report._pending_report_files) <= max_pending
+
+        report._finish_report_files(tmp_path)
+
+    for i in range(3):
+        out_df = pd.read_excel(tmp_path / f"r{i}.xlsx", sheet_name="male", index_col=0)
+        pd.testing.assert_frame_equal(out_df, 2 * df, check_dtype=False)
+
+    with open(tmp_path / "manifest.json") as f:
+        assert len(json.load(f)["tables"]) == 6
+
+    # the writing of each report is recorded
+    names = survey.profiler.get_report()["name"].tolist()
+    assert sorted(names) == ["write_r0", "write_r1", "write_r2"]
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from EchoPro.utils.binning import get_bin_codes, get_bin_ind
+
+
+@pytest.mark.parametrize(
+    "centered_bins",
+    [
+        np.linspace(2, 80, 40, dtype=np.int64),
+        np.linspace(1, 22, 22, dtype=np.int64),
+        np.array([0.5, 1.0, 3.0, 3.5]),
+    ],
+)
+def test_bin_codes_match_bin_ind(centered_bins):
+
+    # include values that lie on the bin edges and outside of the bins
+    rng = np.random.default_rng(0)
+    edges = centered_bins[:-1] + np.diff(centered_bins) / 2.0
+    input_data = np.concatenate(
+        [
+            rng.uniform(centered_bins[0] - 5, centered_bins[-1] + 5, 1000),
+            edges,
+            centered_bins.astype(np.float64),
+            [np.nan],
+        ]
+    )
+
+    bin_codes = get_bin_codes(input_data, centered_bins)
+
+    # NaN values should not be placed in a bin
+    assert bin_codes[-1] == -1
+
+    # the codes should reproduce the indices obtained by get_bin_ind
+    for i, ind in enumerate(get_bin_ind(input_data, centered_bins)):
+        assert np.array_equal(np.argwhere(bin_codes == i).flatten(), ind)
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from EchoPro.utils.coded_index import CodedIndex
+
+
+def test_expand_matches_loc():
+
+    rng = np.random.default_rng(0)
+
+    # strata labels, values are only defined for a subset of them
+    index = CodedIndex(np.array([7, 0, 3, 1, 5, 3, 0]))
+    df = pd.DataFrame(rng.random((4, 3)), index=[5, 1, 7, 3])
+
+    keys = rng.choice(df.index.values, 100)
+    codes = index.get_codes(keys)
+
+    assert codes.dtype == np.int32
+    assert np.array_equal(index.categories.values, [0, 1, 3, 5, 7])
+
+    # the expansion should be the same as the label-based lookup
+    assert np.array_equal(index.expand(df, codes), df.loc[keys].values)
+    assert np.array_equal(index.expand(df[1], codes), df[1].loc[keys].values)
+
+
+def test_expand_missing_labels():
+
+    index = CodedIndex(np.arange(5))
+    vals = pd.Series([0.5, 0.25], index=[1, 3])
+    codes = index.get_codes(np.array([1, 0, 3, 4]))
+
+    with pytest.raises(KeyError):
+        index.expand(vals, codes)
+
+    assert np.array_equal(
+        index.expand(vals, codes, fill_value=0.0), [0.5, 0.0, 0.25, 0.0]
+    )
+
+    # labels that were not assigned a code
+    with pytest.raises(KeyError):
+        index.get_codes(np.array([1, 10]))
@@ -0,0 +1,125 @@
+import json
+import pickle
+import time
+
+import numpy as np
+import pytest
+
+from EchoPro.utils.profiler import Profiler, get_profiler, profile_method
+
+
+def test_nested_sections():
+
+    profiler = Profiler()
+
+    with profiler.section("outer"):
+        with profiler.section("inner"):
+            time.sleep(0.01)
+        profiler.add_record("step", 0.5, count=10, start_time=time.perf_counter())
+
+    report = profiler.get_report()
+
+    assert report["path"].tolist() == ["outer", "outer/inner", "outer/step"]
+    assert report["depth"].tolist() == [0, 1, 1]
+    assert report["count"].tolist() == [1, 1, 10]
+
+    outer, inner = report["duration"].iloc[:2]
+    assert outer >= inner >= 0.01
+    assert report["peak_memory_mb"].isnull().all()
+
+
+def test_section_records_errors():
+
+    profiler = Profiler()
+
+    with pytest.raises(ValueError):
+        with profiler.section("failing"):
+            raise ValueError
+
+    with profiler.section("after"):
+        pass
+
+    assert profiler.get_report()["path"].tolist() == ["failing", "after"]
+
+
+def test_peak_memory():
+
+    profiler = Profiler(track_memory=True)
+
+    with profiler.section("outer"):
+        with profiler.section("inner"):
+            arr = np.ones(2**20)  # 8 MB
+            del arr
+
+    report = profiler.get_report().set_index("path")
+
+    assert report.loc["outer/inner", "peak_memory_mb"] >= 8
+    assert (
+        report.loc["outer", "peak_memory_mb"]
+        >= report.loc["outer/inner", "peak_memory_mb"]
+    )
+
+
+def test_disabled():
+
+    profiler = Profiler(enabled=False)
+
+    with profiler.section("outer"):
+        profiler.add_record("step", 0.5)
+
+    assert profiler.get_report().empty
+
+
+def test_profile_method():
+    class Step:
+        def __init__(self, survey):
+            self.survey = survey
+
+        @profile_method
+        def _run(self, val):
+            return val + 1
+
+    survey = type("Survey", (), {"profiler": Profiler()})()
+
+    assert Step(survey)._run(1) == 2
+    assert Step(None)._run(1) == 2
+
+    assert survey.profiler.get_report()["name"].tolist() == ["run"]
+    assert not get_profiler(None).enabled
+
+
+def test_exports(tmp_path):
+
+    profiler = Profiler()
+
+    with profiler.section("outer"):
+        pass
+
+    profiler.to_json(tmp_path / "profile.json")
+    profiler.to_chrome_trace(tmp_path / "trace.json")
+
+    with open(tmp_path / "profile.json") as f:
+        records = json.load(f)
+    with open(tmp_path / "trace.json") as f:
+        trace_events = json.load(f)["traceEvents"]
+
+    assert records[0]["path"] == "outer"
+    assert records[0]["peak_memory_mb"] is None
+    assert trace_events[0]["name"] == "outer"
+    assert trace_events[0]["ph"] == "X"
+    assert trace_events[0]["dur"] == pytest.approx(records[0]["duration"] * 1e6)
+
+
+def test_pickle():
+
+    profiler = Profiler()
+
+    with profiler.section("outer"):
+        pass
+
+    loaded = pickle.loads(pickle.dumps(profiler))
+
+    with loaded.section("inner"):
+        pass
+
+    assert loaded.get_report()["path"].tolist() == ["outer", "inner"]
@@ -0,0 +1,42 @@
+import pandas as pd
+
+from EchoPro import Survey
+from EchoPro.utils.synthetic_data import SYNTHETIC_FILES, generate_synthetic_survey
+
+
+def test_generate_synthetic_survey(tmp_path):
+
+    init_file, survey_year_file = generate_synthetic_survey(
+        tmp_path / "a",
+        num_hauls=10,
+        num_transects=4,
+        num_points_per_transect=5,
+        num_mesh_cells=50,
+        survey_year=2021,
+    )
+    generate_synthetic_survey(
+        tmp_path / "b",
+        num_hauls=10,
+        num_transects=4,
+        num_points_per_transect=5,
+        num_mesh_cells=50,
+        survey_year=2021,
+    )
+
+    survey = Survey(init_file, survey_year_file)
+
+    assert survey.params["survey_year"] == 2021
+
+    # the same inputs produce the same data
+    for file_name, sheet_name in SYNTHETIC_FILES.values():
+        pd.testing.assert_frame_equal(
+            pd.read_excel(tmp_path / "a" / file_name, sheet_name=sheet_name),
+            pd.read_excel(tmp_path / "b" / file_name, sheet_name=sheet_name),
+        )
+
+    nasc_df = pd.read_excel(tmp_path / "a" / SYNTHETIC_FILES["nasc"][0])
+    mesh_df = pd.read_excel(tmp_path / "a" / SYNTHETIC_FILES["mesh"][0])
+
+    assert len(nasc_df) == 20
+    assert sorted(nasc_df["transect_num"].unique()) == [1, 2, 3, 4]
+    assert len(mesh_df) == 50
@@ -55,3 +55,44 @@ def get_bin_ind(input_data: np.ndarray, centered_bins: np.ndarray) -> List[np.nd
     )
 
     return hist_ind
+
+
+def get_bin_codes(input_data: np.ndarray, centered_bins: np.ndarray) -> np.ndarray:
+    """
+    Assigns each value of ``input_data`` the index of the bin it
+    belongs to, using the same centered bins as ``get_bin_ind``.
+    This provides the bin of every value in one pass, so that
+    binned quantities can be accumulated with ``np.bincount``
+    or ``np.add.at``.
+
+    Parameters
+    ----------
+    input_data: np.ndarray
+        The data to bin.
+    centered_bins: np.ndarray
+        An array that specifies the bin centers.
+
+    Returns
+    -------
+    bin_codes: np.ndarray
+        An integer array with the same shape as ``input_data`` specifying
+        the bin index of each value. Values that are NaN are assigned ``-1``.
+
+    Notes
+    -----
+    For non-NaN values, ``np.argwhere(bin_codes == i)`` is equivalent
+    to ``get_bin_ind(input_data, centered_bins)[i]``.
+    """
+
+    input_data = np.asarray(input_data, dtype=np.float64)
+
+    # the upper (inclusive) edge of all bins except the last one
+    bin_edges = centered_bins[:-1] + np.diff(centered_bins) / 2.0
+
+    # find the bin of each value, using bins that are closed on the right
+    bin_codes = np.searchsorted(bin_edges, input_data, side="left")
+
+    # NaN values do not belong to any bin
+    bin_codes[np.isnan(input_data)] = -1
+
+    return bin_codes
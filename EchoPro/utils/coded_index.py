@@ -0,0 +1,166 @@
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+class CodedIndex:
+    """
+    Assigns dense ``int32`` codes to a set of labels (e.g. stratum,
+    haul, or transect numbers), so that values labeled by a subset
+    of these labels can be expanded with an array ``take``, rather
+    than a label-based lookup (e.g. ``df.loc[labels]``).
+
+    Parameters
+    ----------
+    labels : array-like
+        The labels to assign codes to, these do not need to be
+        unique or sorted
+    """
+
+    def __init__(self, labels: np.ndarray):
+
+        # the code of a label is its position in the sorted unique labels
+        self.categories = pd.Index(np.unique(np.asarray(labels)))
+
+    def __len__(self) -> int:
+        return len(self.categories)
+
+    def get_codes(self, keys: Union[np.ndarray, pd.Index, pd.Series]) -> np.ndarray:
+        """
+        Obtains the code of each value in ``keys``.
+
+        Parameters
+        ----------
+        keys : np.ndarray or pd.Index or pd.Series
+            The labels to obtain codes for
+
+        Returns
+        -------
+        codes : np.ndarray
+            The ``int32`` code of each element of ``keys``
+
+        Raises
+        ------
+        KeyError
+            If a value of ``keys`` is not in ``self.categories``
+        """
+
+        keys = np.asarray(keys)
+        codes = self.categories.get_indexer(keys)
+
+        if np.any(codes < 0):
+            raise KeyError(f"{np.unique(keys[codes < 0])} not in index")
+
+        return codes.astype(np.int32)
+
+    def expand(
+        self,
+        vals: Union[pd.Series, pd.DataFrame],
+        codes: np.ndarray,
+        fill_value: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        Expands ``vals`` so that its rows correspond to ``codes``. This
+        is equivalent to ``vals.loc[labels].values``, where ``codes``
+        are the codes of ``labels``.
+
+        Parameters
+        ----------
+        vals : pd.Series or pd.DataFrame
+            Values with a unique index whose labels are in ``self.categories``
+        codes : np.ndarray
+            The codes of the labels that ``vals`` should be expanded to
+        fill_value : float or None
+            The value to use for labels that are not in the index of
+            ``vals``. If None, a KeyError is raised for such labels.
+
+        Returns
+        -------
+        np.ndarray
+            The rows of ``vals`` corresponding to ``codes``
+
+        Raises
+        ------
+        KeyError
+            If ``fill_value`` is None and ``codes`` contains a
+            label that is not in the index of ``vals``
+        """
+
+        # map each code to the row of vals with the same label
+        row_lookup = np.full(len(self.categories), -1, dtype=np.int64)
+        row_lookup[self.get_codes(vals.index)] = np.arange(len(vals))
+        rows = row_lookup.take(codes)
+
+        missing = rows < 0
+        if fill_value is None:
+            if np.any(missing):
+                raise KeyError(
+                    f"{self.categories.take(np.unique(codes[missing])).values} not in index"
+                )
+
+            return np.asarray(vals).take(rows, axis=0)
+
+        # use an appended row to supply values for the missing labels
+        vals_arr = np.asarray(vals, dtype=np.float64)
+        fill_row = np.full((1,) + vals_arr.shape[1:], fill_value, dtype=np.float64)
+        rows[missing] = len(vals_arr)
+
+        return np.concatenate([vals_arr, fill_row]).take(rows, axis=0)
+
+
+class SurveyIndex:
+    """
+    Survey-level index that assigns dense ``int32`` codes to all
+    strata, hauls, and transects of the loaded survey data.
+
+    Parameters
+    ----------
+    survey : Survey
+        An initialized Survey object with loaded data
+
+    Notes
+    -----
+    Only the data that has been loaded in ``survey`` contributes
+    labels to the index. The index is constructed by
+    ``Survey.load_survey_data``, so codes obtained from it remain
+    valid for any subset of the loaded data (e.g. selected transects).
+    """
+
+    def __init__(self, survey=None):
+
+        strata = []
+        hauls = []
+        transects = []
+
+        if survey.strata_df is not None:
+            strata.append(survey.strata_df.index.get_level_values("stratum_num"))
+            hauls.append(survey.strata_df.index.get_level_values("haul_num"))
+
+        if survey.geo_strata_df is not None:
+            strata.append(survey.geo_strata_df["stratum_num"].values)
+
+        for df in [survey.length_df, survey.specimen_df]:
+            if df is not None:
+                hauls.append(df.index.values)
+
+        if survey.nasc_df is not None:
+            strata.append(survey.nasc_df["stratum_num"].values)
+            hauls.append(survey.nasc_df["haul_num"].values)
+            transects.append(survey.nasc_df.index.values)
+
+        self.strata = CodedIndex(self._concat(strata))
+        self.hauls = CodedIndex(self._concat(hauls))
+        self.transects = CodedIndex(self._concat(transects))
+
+    @staticmethod
+    def _concat(labels: list) -> np.ndarray:
+        """
+        Concatenates a list of label arrays, returning an
+        empty integer array if the list is empty.
+        """
+
+        if labels:
+            return np.concatenate([np.asarray(label) for label in labels])
+
+        return np.array([], dtype=np.int64)
@@ -0,0 +1,127 @@
+"""
+Functions used to construct hashes of parameters, files, and data
+"""
+import hashlib
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+def _update_hash(hasher, obj: Any) -> None:
+    """
+    Updates ``hasher`` with the contents of ``obj``.
+
+    Parameters
+    ----------
+    hasher: hashlib._Hash
+        The hash object to update
+    obj: Any
+        The object to hash. Dictionaries, lists, tuples, numpy arrays,
+        and pandas objects are hashed by their contents, callables by
+        their qualified name, and all other objects by their ``repr``.
+    """
+
+    if isinstance(obj, dict):
+        hasher.update(f"dict{len(obj)}".encode())
+        for key in sorted(obj, key=str):
+            _update_hash(hasher, key)
+            _update_hash(hasher, obj[key])
+
+    elif isinstance(obj, (list, tuple)):
+        hasher.update(f"{type(obj).__name__}{len(obj)}".encode())
+        for val in obj:
+            _update_hash(hasher, val)
+
+    elif isinstance(obj, np.ndarray):
+        hasher.update(f"ndarray{obj.dtype.str}{obj.shape}".encode())
+        hasher.update(np.ascontiguousarray(obj).tobytes())
+
+    elif isinstance(obj, pd.DataFrame):
+        hasher.update(f"DataFrame{obj.shape}".encode())
+        _update_hash(hasher, [str(col) for col in obj.columns])
+        _update_hash(hasher, [str(dtype) for dtype in obj.dtypes])
+        hasher.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+
+    elif isinstance(obj, (pd.Series, pd.Index)):
+        hasher.update(f"{type(obj).__name__}{obj.shape}{obj.dtype}".encode())
+        hasher.update(pd.util.hash_pandas_object(obj).values.tobytes())
+
+    elif callable(obj):
+        hasher.update(f"callable{obj.__module__}.{obj.__qualname__}".encode())
+
+    else:
+        hasher.update(f"{type(obj).__name__}{obj!r}".encode())
+
+
+def get_hash(*objs: Any) -> str:
+    """
+    Constructs a hash of the contents of all provided objects.
+
+    Parameters
+    ----------
+    objs: Any
+        The objects to hash (see ``_update_hash`` for how each type is hashed)
+
+    Returns
+    -------
+    str
+        The hexadecimal SHA-256 digest of ``objs``
+    """
+
+    hasher = hashlib.sha256()
+    _update_hash(hasher, list(objs))
+
+    return hasher.hexdigest()
+
+
+def get_file_hash(file_path: Path) -> str:
+    """
+    Constructs a hash of the contents of a file.
+
+    Parameters
+    ----------
+    file_path: Path
+        The path to the file
+
+    Returns
+    -------
+    str
+        The hexadecimal SHA-256 digest of the file contents
+    """
+
+    hasher = hashlib.sha256()
+
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+
+    return hasher.hexdigest()
+
+
+def get_data_files_hash(params: dict) -> str:
+    """
+    Constructs a hash of the contents of all existing data files
+    specified by the ``filename`` parameters in ``params``.
+
+    Parameters
+    ----------
+    params: dict
+        Survey parameters, which contain ``data_root_dir`` and
+        parameters with ``filename`` in their name
+
+    Returns
+    -------
+    str
+        The hexadecimal SHA-256 digest of all file contents
+    """
+
+    file_hashes = {}
+    for param_name, param_val in params.items():
+        if "filename" in param_name:
+            file_path = Path(params["data_root_dir"]) / param_val
+            if file_path.is_file():
+                file_hashes[param_name] = get_file_hash(file_path)
+
+    return get_hash(file_hashes)
@@ -0,0 +1,36 @@
+from typing import Type
+
+import numpy as np
+
+# the floating point precision of the largest intermediate and
+# stored arrays e.g. the distance matrix used by Kriging
+PRECISION_DTYPES = {"float64": np.float64, "float32": np.float32}
+
+
+def get_precision_dtype(precision: str) -> Type[np.floating]:
+    """
+    Obtains the NumPy dtype of a precision.
+
+    Parameters
+    ----------
+    precision : str
+        The precision, which must be a key of ``PRECISION_DTYPES``
+
+    Returns
+    -------
+    type
+        The corresponding NumPy floating point dtype
+
+    Raises
+    ------
+    ValueError
+        If ``precision`` is not a key of ``PRECISION_DTYPES``
+    """
+
+    if precision not in PRECISION_DTYPES:
+        raise ValueError(
+            f"The precision must be one of {list(PRECISION_DTYPES.keys())}, "
+            f"but '{precision}' was provided!"
+        )
+
+    return PRECISION_DTYPES[precision]
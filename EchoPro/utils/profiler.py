@@ -0,0 +1,402 @@
+"""
+Tools for recording the time and memory used by the routines of a survey
+"""
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Union
+
+import pandas as pd
+
+# columns of the report constructed by ``Profiler.get_report``
+PROFILE_COLUMNS = [
+    "name",
+    "path",
+    "depth",
+    "thread",
+    "start",
+    "duration",
+    "count",
+    "peak_memory_mb",
+]
+
+
+class Profiler:
+    """
+    Records the time taken by, and optionally the peak memory used by, named
+    sections of code. Sections may be nested, in which case the names of the
+    enclosing sections form the path of a section e.g.
+    ``"compute_transect_results/generate_bin_ds"``.
+
+    Parameters
+    ----------
+    enabled : bool
+        If False, no sections are recorded
+    track_memory : bool
+        If True, the peak memory allocated within each section, above the
+        memory allocated when the section started, is recorded using
+        ``tracemalloc``, which slows down the run
+
+    Notes
+    -----
+    Sections ran by different threads are recorded separately, however
+    the memory allocated by concurrent sections cannot be separated, thus
+    their peak memory includes the memory allocated by all threads.
+    """
+
+    def __init__(self, enabled: bool = True, track_memory: bool = False):
+
+        self.enabled = enabled
+        self.track_memory = track_memory
+
+        # all recorded sections, in the order they finished
+        self.records = []
+
+        # the time that the start times of all records are relative to
+        self._origin = time.perf_counter()
+
+        # the stack of open sections of each thread
+        self._local = threading.local()
+
+        self._lock = threading.Lock()
+
+        # the number of open sections that track memory
+        self._num_tracking = 0
+        self._started_tracemalloc = False
+
+    def __getstate__(self) -> dict:
+        """
+        Excludes the open sections and the lock when pickling.
+        """
+
+        state = self.__dict__.copy()
+        del state["_local"], state["_lock"]
+        state["_num_tracking"] = 0
+        state["_started_tracemalloc"] = False
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+
+        self.__dict__.update(state)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _get_stack(self) -> List[dict]:
+        """
+        Obtains the open sections of the current thread.
+
+        Returns
+        -------
+        list of dict
+            The open sections, where the last section is the innermost
+        """
+
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+
+        return self._local.stack
+
+    def _get_path(self, name: str) -> str:
+        """
+        Constructs the path of a section opened in the current thread.
+
+        Parameters
+        ----------
+        name : str
+            The name of the section
+
+        Returns
+        -------
+        str
+            The names of all open sections and ``name`` joined by ``"/"``
+        """
+
+        return "/".join([entry["name"] for entry in self._get_stack()] + [name])
+
+    def _start_memory_tracking(self) -> None:
+        """
+        Starts ``tracemalloc``, if it is not already tracing.
+        """
+
+        with self._lock:
+            if self._num_tracking == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            self._num_tracking += 1
+
+    def _stop_memory_tracking(self) -> None:
+        """
+        Stops ``tracemalloc`` once all sections that track memory
+        have finished, if it was started by this object.
+        """
+
+        with self._lock:
+            self._num_tracking -= 1
+            if self._num_tracking == 0 and self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+
+    @contextmanager
+    def section(self, name: str) -> Iterator[None]:
+        """
+        Records the time taken by, and peak memory used by, the code
+        ran within this context.
+
+        Parameters
+        ----------
+        name : str
+            The name of the section
+        """
+
+        if not self.enabled:
+            yield
+            return
+
+        stack = self._get_stack()
+        track_memory = self.track_memory
+
+        entry = {"name": name, "path": self._get_path(name), "peak": 0}
+
+        if track_memory:
+            self._start_memory_tracking()
+
+            # the peak so far belongs to the enclosing section
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+            tracemalloc.reset_peak()
+            entry["start_memory"] = current
+            entry["peak"] = current
+
+        stack.append(entry)
+        start_time = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start_time
+            stack.pop()
+
+            peak_memory_mb = None
+            if track_memory:
+                entry["peak"] = max(entry["peak"], tracemalloc.get_traced_memory()[1])
+                if stack:
+                    stack[-1]["peak"] = max(stack[-1]["peak"], entry["peak"])
+                tracemalloc.reset_peak()
+                self._stop_memory_tracking()
+
+                peak_memory_mb = (entry["peak"] - entry["start_memory"]) / 1024**2
+
+            self._add_record(
+                name, entry["path"], len(stack), start_time, duration, 1, peak_memory_mb
+            )
+
+    def add_record(
+        self,
+        name: str,
+        duration: float,
+        count: int = 1,
+        start_time: Optional[float] = None,
+    ) -> None:
+        """
+        Records a section, within the innermost open section, whose time was
+        measured by the caller. This is used for steps that are ran many times
+        within a loop, where each run is too short to be recorded separately.
+
+        Parameters
+        ----------
+        name : str
+            The name of the section
+        duration : float
+            The total time, in seconds, taken by the section
+        count : int
+            The number of times the section was ran
+        start_time : float or None
+            The value of ``time.perf_counter()`` when the section started.
+            If None, the section is assumed to have just finished.
+        """
+
+        if not self.enabled:
+            return
+
+        if start_time is None:
+            start_time = time.perf_counter() - duration
+
+        self._add_record(
+            name,
+            self._get_path(name),
+            len(self._get_stack()),
+            start_time,
+            duration,
+            count,
+            None,
+        )
+
+    def _add_record(
+        self,
+        name: str,
+        path: str,
+        depth: int,
+        start_time: float,
+        duration: float,
+        count: int,
+        peak_memory_mb: Optional[float],
+    ) -> None:
+        """
+        Stores a finished section in ``self.records``.
+        """
+
+        record = {
+            "name": name,
+            "path": path,
+            "depth": depth,
+            "thread": threading.get_ident(),
+            "start": start_time - self._origin,
+            "duration": duration,
+            "count": count,
+            "peak_memory_mb": peak_memory_mb,
+        }
+
+        with self._lock:
+            self.records.append(record)
+
+    def reset(self) -> None:
+        """
+        Removes all recorded sections.
+        """
+
+        with self._lock:
+            self.records = []
+            self._origin = time.perf_counter()
+
+    def get_report(self) -> pd.DataFrame:
+        """
+        Constructs a report of all recorded sections.
+
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame with one row per section, sorted by start time, and the
+            columns ``PROFILE_COLUMNS``. Times are given in seconds, where the
+            start time is relative to the creation (or last reset) of this object.
+        """
+
+        with self._lock:
+            records = list(self.records)
+
+        return (
+            pd.DataFrame(records, columns=PROFILE_COLUMNS)
+            .sort_values(["start", "depth"], kind="stable")
+            .reset_index(drop=True)
+        )
+
+    def to_json(self, file_path: Union[str, Path]) -> None:
+        """
+        Writes all recorded sections to a JSON file, as a list of objects
+        with the keys ``PROFILE_COLUMNS``.
+
+        Parameters
+        ----------
+        file_path : str or Path
+            The path of the JSON file
+        """
+
+        report = self.get_report().astype(object)
+        report = report.where(report.notnull(), None)
+
+        with open(file_path, "w") as f:
+            json.dump(report.to_dict(orient="records"), f, indent=2)
+
+    def to_chrome_trace(self, file_path: Union[str, Path]) -> None:
+        """
+        Writes all recorded sections to a JSON file in the Chrome trace event
+        format, which can be viewed by e.g. ``chrome://tracing`` or Perfetto.
+
+        Parameters
+        ----------
+        file_path : str or Path
+            The path of the trace file
+        """
+
+        trace_events = []
+        for record in self.get_report().to_dict(orient="records"):
+
+            args = {"path": record["path"], "count": record["count"]}
+            if pd.notnull(record["peak_memory_mb"]):
+                args["peak_memory_mb"] = record["peak_memory_mb"]
+
+            # complete events with times in microseconds
+            trace_events.append(
+                {
+                    "name": record["name"],
+                    "cat": "EchoPro",
+                    "ph": "X",
+                    "ts": record["start"] * 1e6,
+                    "dur": record["duration"] * 1e6,
+                    "pid": os.getpid(),
+                    "tid": record["thread"],
+                    "args": args,
+                }
+            )
+
+        with open(file_path, "w") as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
+
+
+# a disabled profiler used by objects that are not associated with a survey
+_disabled_profiler = Profiler(enabled=False)
+
+
+def get_profiler(survey) -> Profiler:
+    """
+    Obtains the profiler of a survey.
+
+    Parameters
+    ----------
+    survey : Survey or None
+        A Survey object
+
+    Returns
+    -------
+    Profiler
+        The profiler of ``survey``, or a disabled profiler if
+        ``survey`` does not have a profiler
+    """
+
+    return getattr(survey, "profiler", _disabled_profiler)
+
+
+def profile_method(func: Callable) -> Callable:
+    """
+    Decorates a method so that each call is recorded as a section, named
+    after the method without leading underscores, by the profiler of the
+    survey the object belongs to.
+
+    Parameters
+    ----------
+    func : Callable
+        A method of a Survey object, or of an object with a ``survey`` attribute
+
+    Returns
+    -------
+    Callable
+        The decorated method
+    """
+
+    name = func.__name__.lstrip("_")
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+
+        survey = getattr(self, "survey", self)
+
+        with get_profiler(survey).section(name):
+            return func(self, *args, **kwargs)
+
+    return wrapper
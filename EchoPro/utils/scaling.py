@@ -0,0 +1,381 @@
+"""
+Measures how the run time of the main routines of EchoPro grows with the
+size of their inputs, and compares the growth with a stored baseline.
+
+The harness is ran from the command line with::
+
+    python -m EchoPro.utils.scaling --baseline <baseline JSON file> [--update]
+
+where ``--update`` replaces the baseline with the current measurements.
+"""
+import argparse
+import contextlib
+import json
+import shutil
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# the factors that all input sizes are multiplied by
+SCALING_FACTORS = (1, 2, 4, 8)
+
+# the default allowed increase of a complexity exponent over its baseline
+EXPONENT_TOLERANCE = 0.4
+
+# the sizes of the synthetic surveys at a scaling factor of 1, which are the
+# smallest sizes where the hauls and transects of the survey cover all strata
+SURVEY_BASE_SIZES = dict(
+    num_hauls=40, num_transects=16, num_points_per_transect=10, num_mesh_cells=250
+)
+
+# the sizes of the synthetic surveys used by ``generate_bin_ds``, whose run time
+# is dominated by a fixed overhead unless there are many hauls
+BIN_DS_BASE_SIZES = dict(SURVEY_BASE_SIZES, num_hauls=500)
+
+# Kriging parameters used by the hot paths that run Kriging
+KRIGING_PARAMS = dict(
+    k_max=10,
+    k_min=3,
+    R=0.0226287,
+    ratio=0.001,
+    s_v_params={
+        "nugget": 0.0,
+        "sill": 0.95279,
+        "ls": 0.0075429,
+        "exp_pow": 1.5,
+        "ls_hole_eff": 0.0,
+    },
+)
+
+
+def _setup_run_kriging(factor: int, work_dir: Path) -> Callable:
+    """
+    Sets up ``Kriging.run_kriging`` with ``250 * factor`` mesh and data points.
+    """
+
+    from ..computation import Kriging, SemiVariogram
+
+    rng = np.random.default_rng(factor)
+    num_points = 250 * factor
+
+    kriging = Kriging(
+        None, s_v_model=SemiVariogram.generalized_exp_bessel, **KRIGING_PARAMS
+    )
+
+    x_mesh, y_mesh, x_data, y_data = rng.uniform(-0.1, 0.1, (4, num_points))
+    field = rng.exponential(1.0, num_points)
+
+    return lambda: kriging.run_kriging(x_mesh, x_data, y_mesh, y_data, field)
+
+
+def _setup_calculate_semi_variogram(factor: int, work_dir: Path) -> Callable:
+    """
+    Sets up ``SemiVariogram.calculate_semi_variogram`` with ``250 * factor`` points.
+    """
+
+    from ..computation import SemiVariogram
+
+    rng = np.random.default_rng(factor)
+    num_points = 250 * factor
+
+    x, y = rng.uniform(-0.1, 0.1, (2, num_points))
+    semi_vario = SemiVariogram(
+        x, y, rng.exponential(1.0, num_points), lag_res=0.002, nlag=30
+    )
+
+    return semi_vario.calculate_semi_variogram
+
+
+def _setup_compute_jolly_hampton(factor: int, work_dir: Path) -> Callable:
+    """
+    Sets up ``compute_jolly_hampton`` with 1000 realizations
+    over ``256 * factor`` transects split into 8 strata.
+    """
+
+    from ..computation.numba_functions import compute_jolly_hampton
+
+    rng = np.random.default_rng(factor)
+    num_transects = np.full(8, 32 * factor)
+
+    s_e_ind = np.stack(
+        [np.cumsum(num_transects) - num_transects, np.cumsum(num_transects)], 1
+    )
+    distance = rng.uniform(10.0, 50.0, num_transects.sum())
+    field = rng.exponential(1e5, num_transects.sum())
+    total_transect_area = rng.uniform(1e3, 1e4, len(num_transects))
+
+    return lambda: compute_jolly_hampton(
+        1000, 0.75, num_transects, s_e_ind, distance, field, total_transect_area, 1
+    )
+
+
+def _get_synthetic_survey(
+    factor: int, work_dir: Path, base_sizes: Dict[str, int] = SURVEY_BASE_SIZES
+):
+    """
+    Constructs a Survey from a synthetic survey whose sizes are
+    ``base_sizes`` multiplied by ``factor``, with loaded
+    data and computed transect results.
+    """
+
+    from ..survey import Survey
+    from .synthetic_data import generate_synthetic_survey
+
+    sizes = {name: size * factor for name, size in base_sizes.items()}
+
+    survey = Survey(*generate_synthetic_survey(work_dir / f"survey_{factor}", **sizes))
+    survey.load_survey_data()
+    survey.compute_transect_results()
+
+    return survey
+
+
+def _setup_generate_bin_ds(factor: int, work_dir: Path) -> Callable:
+    """
+    Sets up ``generate_bin_ds`` for a synthetic survey
+    scaled from ``BIN_DS_BASE_SIZES``.
+    """
+
+    from ..computation import generate_bin_ds
+
+    survey = _get_synthetic_survey(factor, work_dir, BIN_DS_BASE_SIZES)
+
+    return lambda: generate_bin_ds(survey)
+
+
+def _setup_create_and_write_reports(factor: int, work_dir: Path) -> Callable:
+    """
+    Sets up ``Survey.create_and_write_reports`` for a scaled
+    synthetic survey with all results computed.
+    """
+
+    from ..computation import SemiVariogram
+
+    survey = _get_synthetic_survey(factor, work_dir)
+
+    krig_mesh = survey.get_kriging_mesh()
+    krig_mesh.apply_coordinate_transformation(coord_type="transect")
+    krig_mesh.apply_coordinate_transformation(coord_type="mesh")
+
+    kriging = survey.get_kriging(
+        dict(KRIGING_PARAMS, s_v_model=SemiVariogram.generalized_exp_bessel)
+    )
+    kriging.run_biomass_kriging(krig_mesh)
+    kriging.compute_kriging_variables()
+    survey.compute_length_age_variables(data="all")
+
+    return lambda: survey.create_and_write_reports(work_dir / f"reports_{factor}")
+
+
+# the routines whose scaling is measured and the functions that set them up
+# at a scaling factor, where all input sizes grow linearly with the factor
+HOT_PATHS = {
+    "run_kriging": _setup_run_kriging,
+    "calculate_semi_variogram": _setup_calculate_semi_variogram,
+    "compute_jolly_hampton": _setup_compute_jolly_hampton,
+    "generate_bin_ds": _setup_generate_bin_ds,
+    "create_and_write_reports": _setup_create_and_write_reports,
+}
+
+
+def time_call(func: Callable, repeats: int) -> float:
+    """
+    Times a function.
+
+    Parameters
+    ----------
+    func : Callable
+        The function to time, which takes no arguments
+    repeats : int
+        The number of times the function is timed
+
+    Returns
+    -------
+    float
+        The minimum time, in seconds, taken by the function
+    """
+
+    times = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start_time)
+
+    return min(times)
+
+
+def fit_exponent(factors: Sequence[float], times: Sequence[float]) -> float:
+    """
+    Fits the empirical complexity exponent ``k`` of ``time ~ factor ** k``.
+
+    Parameters
+    ----------
+    factors : sequence of float
+        The scaling factors of the inputs
+    times : sequence of float
+        The time taken at each scaling factor
+
+    Returns
+    -------
+    float
+        The slope of the least squares line through ``(log(factors), log(times))``
+    """
+
+    return float(np.polyfit(np.log(factors), np.log(times), 1)[0])
+
+
+def measure_scaling(
+    hot_paths: Optional[List[str]] = None,
+    factors: Sequence[int] = SCALING_FACTORS,
+    repeats: int = 3,
+) -> Dict[str, dict]:
+    """
+    Times each hot path at each scaling factor and fits its complexity exponent.
+
+    Parameters
+    ----------
+    hot_paths : list of str or None
+        The names of the hot paths to measure, which must be keys
+        of ``HOT_PATHS``. If None, all hot paths are measured.
+    factors : sequence of int
+        The scaling factors of the inputs
+    repeats : int
+        The number of times each hot path is timed at each factor
+
+    Returns
+    -------
+    results : dict
+        For each hot path, a dictionary with the keys ``factors``, ``times``
+        (in seconds), and ``exponent``
+    """
+
+    if hot_paths is None:
+        hot_paths = list(HOT_PATHS.keys())
+    elif any(name not in HOT_PATHS for name in hot_paths):
+        raise ValueError(
+            f"hot_paths must only contain values in {list(HOT_PATHS.keys())}!"
+        )
+
+    work_dir = Path(tempfile.mkdtemp(prefix="echopro_scaling_"))
+
+    results = {}
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+
+            for name in hot_paths:
+                times = []
+                for i, factor in enumerate(factors):
+                    func = HOT_PATHS[name](factor, work_dir)
+
+                    # the first run compiles the Numba functions of the hot path
+                    if i == 0:
+                        func()
+
+                    times.append(time_call(func, repeats))
+
+                results[name] = {
+                    "factors": list(factors),
+                    "times": times,
+                    "exponent": fit_exponent(factors, times),
+                }
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return results
+
+
+def compare_to_baseline(
+    results: Dict[str, dict],
+    baseline: Dict[str, dict],
+    tolerance: float = EXPONENT_TOLERANCE,
+) -> List[str]:
+    """
+    Finds the hot paths whose complexity exponent exceeds its baseline.
+
+    Parameters
+    ----------
+    results : dict
+        The measurements produced by ``measure_scaling``
+    baseline : dict
+        Previous measurements produced by ``measure_scaling``
+    tolerance : float
+        The allowed increase of each exponent over its baseline
+
+    Returns
+    -------
+    list of str
+        A description of each regression. Hot paths that are not
+        contained in ``baseline`` are not compared.
+    """
+
+    regressions = []
+    for name, result in results.items():
+        if name in baseline:
+            baseline_exponent = baseline[name]["exponent"]
+            if result["exponent"] > baseline_exponent + tolerance:
+                regressions.append(
+                    f"{name}: the complexity exponent {result['exponent']:.2f} "
+                    f"exceeds the baseline {baseline_exponent:.2f} by more than {tolerance}"
+                )
+
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Measures the scaling of the hot paths, prints the exponents,
+    and compares them with (or stores them as) the baseline.
+
+    Parameters
+    ----------
+    argv : list of str or None
+        The command line arguments. If None, ``sys.argv`` is used.
+
+    Returns
+    -------
+    int
+        0 if no regressions were found, otherwise 1
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--baseline", type=Path, required=True, help="The baseline JSON file"
+    )
+    parser.add_argument("--update", action="store_true", help="Replace the baseline")
+    parser.add_argument(
+        "--hot-paths", nargs="+", choices=list(HOT_PATHS.keys()), default=None
+    )
+    parser.add_argument("--tolerance", type=float, default=EXPONENT_TOLERANCE)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    # messages printed while setting up the hot paths are sent to standard error
+    with contextlib.redirect_stdout(sys.stderr):
+        results = measure_scaling(args.hot_paths, repeats=args.repeats)
+
+    for name, result in results.items():
+        print(f"{name}: exponent {result['exponent']:.2f}")
+
+    if args.update:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    regressions = compare_to_baseline(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(regression)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,437 @@
+"""
+Generates synthetic survey data, with the file layout expected by ``Survey``,
+at a configurable scale. The data is only statistically plausible and is
+intended for testing and benchmarking.
+"""
+from pathlib import Path
+from typing import Tuple, Union
+
+import numpy as np
+import pandas as pd
+import yaml
+
+# the species considered by the synthetic survey
+SPECIES_ID = 22500
+
+# the haul number offset of the Canadian hauls, which is increased
+# by multiples of itself for surveys with more US hauls than this
+CAN_HAUL_OFFSET = 200
+
+# the latitude range covered by the synthetic survey
+LATITUDE_RANGE = (34.5, 54.5)
+
+# the inputs of ``generate_synthetic_survey`` for the
+# standard scales of a synthetic survey
+SYNTHETIC_SCALES = {
+    "small": dict(
+        num_hauls=40, num_transects=15, num_points_per_transect=40, num_mesh_cells=900
+    ),
+    "medium": dict(
+        num_hauls=80, num_transects=30, num_points_per_transect=60, num_mesh_cells=2500
+    ),
+    "large": dict(
+        num_hauls=160,
+        num_transects=60,
+        num_points_per_transect=120,
+        num_mesh_cells=10000,
+    ),
+}
+
+# the files of the synthetic survey, relative to its root directory, and their sheets
+SYNTHETIC_FILES = {
+    "length_US": ("Biological/US/length.xlsx", "biodata_length"),
+    "specimen_US": ("Biological/US/specimen.xlsx", "biodata_specimen"),
+    "catch_US": ("Biological/US/catch.xlsx", "biodata_catch"),
+    "length_CAN": ("Biological/CAN/length.xlsx", "biodata_length_CAN"),
+    "specimen_CAN": ("Biological/CAN/specimen.xlsx", "biodata_specimen_CAN"),
+    "catch_CAN": ("Biological/CAN/catch.xlsx", "biodata_catch_CAN"),
+    "haul_to_transect_US": ("Biological/US/haul_to_transect.xlsx", "Sheet1"),
+    "haul_to_transect_CAN": ("Biological/CAN/haul_to_transect.xlsx", "Sheet1"),
+    "strata": ("Stratification/strata.xlsx", "Base KS"),
+    "geo_strata": ("Stratification/geo_strata.xlsx", "stratification1"),
+    "nasc": ("Exports/nasc.xlsx", "Sheet1"),
+    "mesh": ("Kriging_files/mesh.xlsx", "mesh"),
+    "smoothed_contour": ("Kriging_files/smoothed_contour.xlsx", "Smoothing_EasyKrig"),
+}
+
+
+def _get_biological_data(
+    rng: np.random.Generator, hauls: np.ndarray
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Generates the length, specimen, and catch data of a set of hauls.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        The random number generator
+    hauls : np.ndarray
+        The haul numbers, as stored in the biological files
+
+    Returns
+    -------
+    length_df : pd.DataFrame
+        The length counts of each haul and sex
+    specimen_df : pd.DataFrame
+        The measured specimens of each haul, where a few
+        specimens have no age or weight
+    catch_df : pd.DataFrame
+        The catch of each haul
+    """
+
+    length_rows = []
+    specimen_rows = []
+    catch_rows = []
+    for haul in hauls:
+
+        for sex in [1, 2, 3]:
+            lengths = np.unique(np.round(rng.normal(40, 10, 15)).clip(5, 78))
+            for length in lengths:
+                length_rows.append(
+                    (haul, SPECIES_ID, sex, length, float(rng.integers(1, 20)))
+                )
+
+        # specimen lengths and weights follow the age of the specimen
+        num_specimens = int(rng.integers(20, 60))
+        sex = rng.choice([1, 2, 1, 2, 3], num_specimens)
+        age = rng.integers(1, 16, num_specimens).astype(np.float64)
+        length = np.clip(15 + 4 * age + rng.normal(0, 4, num_specimens), 5, 78)
+        weight = 1e-5 * length**3 * rng.uniform(0.85, 1.15, num_specimens)
+        age[rng.uniform(size=num_specimens) < 0.05] = np.nan
+        weight[rng.uniform(size=num_specimens) < 0.02] = np.nan
+
+        specimen_rows += zip(
+            np.full(num_specimens, haul),
+            np.full(num_specimens, SPECIES_ID),
+            sex,
+            length,
+            weight,
+            age,
+        )
+
+        catch_rows.append(
+            (
+                haul,
+                SPECIES_ID,
+                float(rng.integers(50, 500)),
+                float(rng.uniform(10, 200)),
+            )
+        )
+
+    # a length count of another species, which should be ignored
+    length_rows.append((hauls[0], SPECIES_ID + 1, 1, 30.0, 2.0))
+
+    length_df = pd.DataFrame(
+        length_rows, columns=["haul_num", "species_id", "sex", "length", "length_count"]
+    )
+    specimen_df = pd.DataFrame(
+        specimen_rows,
+        columns=["haul_num", "species_id", "sex", "length", "weight", "age"],
+    )
+    catch_df = pd.DataFrame(
+        catch_rows, columns=["haul_num", "species_id", "haul_count", "haul_weight"]
+    )
+
+    return length_df, specimen_df, catch_df
+
+
+def _get_nasc_df(
+    rng: np.random.Generator,
+    transect_latitudes: np.ndarray,
+    num_points: int,
+    latitude_edges: np.ndarray,
+    transect_hauls: dict,
+) -> pd.DataFrame:
+    """
+    Generates the NASC data along each transect.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        The random number generator
+    transect_latitudes : np.ndarray
+        The latitude of each transect, where transect ``i`` is at index ``i - 1``
+    num_points : int
+        The number of NASC intervals along each transect
+    latitude_edges : np.ndarray
+        The upper latitude of each stratum
+    transect_hauls : dict
+        The hauls, as numbered after combining the US and Canadian
+        data, that were performed along each transect
+
+    Returns
+    -------
+    pd.DataFrame
+        The NASC data, where transects run east from the coast and
+        some intervals have no NASC or no associated haul
+    """
+
+    nasc_dfs = []
+    vessel_log = 0.0
+    for transect_num, transect_latitude in enumerate(transect_latitudes, start=1):
+
+        latitude = transect_latitude + rng.normal(0, 0.005, num_points)
+        longitude = (
+            -125.5 + 0.3 * np.sin(transect_latitude) + np.linspace(0, 1.5, num_points)
+        )
+
+        hauls = transect_hauls.get(transect_num, np.array([], dtype=np.int64))
+        if len(hauls) > 0:
+            haul_num = np.where(
+                rng.uniform(size=num_points) < 0.8, rng.choice(hauls, num_points), 0
+            )
+        else:
+            haul_num = np.zeros(num_points, dtype=np.int64)
+
+        log_start = vessel_log + 0.5 * np.arange(num_points)
+
+        nasc_dfs.append(
+            pd.DataFrame(
+                {
+                    "transect_num": transect_num,
+                    "vessel_log_start": log_start,
+                    "vessel_log_end": log_start + 0.5,
+                    "latitude": latitude,
+                    "longitude": longitude,
+                    "stratum_num": np.searchsorted(latitude_edges, latitude) + 1,
+                    "transect_spacing": 10.0,
+                    "NASC": np.where(
+                        rng.uniform(size=num_points) < 0.6,
+                        rng.exponential(500, num_points),
+                        0.0,
+                    ),
+                    "haul_num": haul_num,
+                    "Region ID": rng.integers(1, 9999, num_points),
+                    "Bottom depth": rng.uniform(50, 500, num_points),
+                    "Layer mean depth": rng.uniform(20, 300, num_points),
+                    "Layer height": rng.uniform(1, 50, num_points),
+                }
+            )
+        )
+
+        # leave a gap in the vessel log between transects
+        vessel_log = log_start[-1] + 5.5
+
+    return pd.concat(nasc_dfs, ignore_index=True)
+
+
+def _get_mesh_df(rng: np.random.Generator, num_cells: int) -> pd.DataFrame:
+    """
+    Generates a mesh that covers the survey region.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        The random number generator
+    num_cells : int
+        The number of mesh cells
+
+    Returns
+    -------
+    pd.DataFrame
+        The mesh cells, which lie on a regular grid
+    """
+
+    num_lat = int(np.ceil(np.sqrt(num_cells)))
+    num_lon = int(np.ceil(num_cells / num_lat))
+
+    latitude, longitude = np.meshgrid(
+        np.linspace(*LATITUDE_RANGE, num_lat), np.linspace(-126.0, -123.5, num_lon)
+    )
+
+    return pd.DataFrame(
+        {
+            "centroid_latitude": latitude.ravel()[:num_cells],
+            "centroid_longitude": longitude.ravel()[:num_cells],
+            "fraction_cell_in_polygon": rng.uniform(0.2, 1.0, num_cells),
+        }
+    )
+
+
+def generate_synthetic_survey(
+    output_path: Union[str, Path],
+    num_hauls: int = 80,
+    num_transects: int = 30,
+    num_points_per_transect: int = 60,
+    num_mesh_cells: int = 2500,
+    num_strata: int = 8,
+    survey_year: int = 2019,
+    seed: int = 0,
+) -> Tuple[Path, Path]:
+    """
+    Writes the data files and configuration files of a synthetic survey.
+
+    Parameters
+    ----------
+    output_path : str or Path
+        The directory where all files are written
+    num_hauls : int
+        The total number of hauls, where half of them are Canadian hauls
+    num_transects : int
+        The number of transects
+    num_points_per_transect : int
+        The number of NASC intervals along each transect
+    num_mesh_cells : int
+        The number of cells in the Kriging mesh
+    num_strata : int
+        The number of strata, which split the survey region by latitude
+    survey_year : int
+        The survey year stored in the survey year configuration file
+    seed : int
+        The seed of the random number generator, such that
+        the same inputs always produce the same files
+
+    Returns
+    -------
+    init_file_path : Path
+        The path to the initialization configuration file
+    survey_year_file_path : Path
+        The path to the survey year configuration file
+    """
+
+    rng = np.random.default_rng(seed)
+    output_path = Path(output_path)
+
+    for file_name, _ in SYNTHETIC_FILES.values():
+        (output_path / file_name).parent.mkdir(parents=True, exist_ok=True)
+
+    # strata split the survey region into bands of latitude
+    latitude_edges = np.linspace(*LATITUDE_RANGE, num_strata + 1)[1:]
+    geo_strata_df = pd.DataFrame(
+        {
+            "stratum_num": np.arange(1, num_strata + 1),
+            "Latitude (upper limit)": latitude_edges,
+        }
+    )
+
+    # hauls, with the Canadian hauls numbered as they are after combining the data
+    num_hauls_us = num_hauls // 2
+    hauls_us = np.arange(1, num_hauls_us + 1)
+    hauls_can = np.arange(1, num_hauls - num_hauls_us + 1)
+    can_haul_offset = CAN_HAUL_OFFSET * (num_hauls_us // CAN_HAUL_OFFSET + 1)
+    all_hauls = np.concatenate([hauls_us, hauls_can + can_haul_offset])
+
+    haul_latitude = np.sort(rng.uniform(*LATITUDE_RANGE, num_hauls))
+    strata_df = pd.DataFrame(
+        {
+            "stratum_num": np.searchsorted(latitude_edges, haul_latitude) + 1,
+            "haul_num": all_hauls,
+            "fraction_hake": rng.uniform(0.3, 1.0, num_hauls),
+        }
+    )
+
+    # stratum 0 is removed by the transect calculations
+    strata_df = pd.concat(
+        [
+            strata_df,
+            pd.DataFrame(
+                {
+                    "stratum_num": [0],
+                    "haul_num": [max(999, all_hauls[-1] + 1)],
+                    "fraction_hake": [1.0],
+                }
+            ),
+        ]
+    )
+
+    # each haul is performed along the transect nearest to it
+    transect_latitudes = np.linspace(
+        LATITUDE_RANGE[0] + 0.2, LATITUDE_RANGE[1] - 0.2, num_transects
+    )
+    haul_transect = np.clip(
+        np.searchsorted(transect_latitudes, haul_latitude), 1, num_transects
+    )
+    transect_hauls = {
+        transect_num: all_hauls[haul_transect == transect_num]
+        for transect_num in np.unique(haul_transect)
+    }
+
+    dfs = {}
+    dfs["length_US"], dfs["specimen_US"], dfs["catch_US"] = _get_biological_data(
+        rng, hauls_us
+    )
+    dfs["length_CAN"], dfs["specimen_CAN"], dfs["catch_CAN"] = _get_biological_data(
+        rng, hauls_can
+    )
+    dfs["haul_to_transect_US"] = pd.DataFrame(
+        {"haul_num": hauls_us, "transect_num": haul_transect[:num_hauls_us]}
+    )
+    dfs["haul_to_transect_CAN"] = pd.DataFrame(
+        {"haul_num": hauls_can, "transect_num": haul_transect[num_hauls_us:]}
+    )
+    dfs["strata"] = strata_df
+    dfs["geo_strata"] = geo_strata_df
+    dfs["nasc"] = _get_nasc_df(
+        rng, transect_latitudes, num_points_per_transect, latitude_edges, transect_hauls
+    )
+    dfs["mesh"] = _get_mesh_df(rng, num_mesh_cells)
+
+    # the smoothed contour follows the coast
+    contour_latitude = np.linspace(LATITUDE_RANGE[0] - 1, LATITUDE_RANGE[1] + 1, 200)
+    dfs["smoothed_contour"] = pd.DataFrame(
+        {
+            "latitude": contour_latitude,
+            "longitude": -125.0 + 0.3 * np.sin(contour_latitude),
+        }
+    )
+
+    for name, df in dfs.items():
+        file_name, sheet_name = SYNTHETIC_FILES[name]
+        df.to_excel(output_path / file_name, sheet_name=sheet_name, index=False)
+
+    init_params = {
+        "JH_fac": 0.75,
+        "bio_hake_len_bin": [2, 80, 40],
+        "bio_hake_age_bin": [1, 22, 22],
+        "sig_b_coeff_power": -6.8,
+        "kriging_A0": 6.25,
+    }
+
+    files = {name: file_name for name, (file_name, _) in SYNTHETIC_FILES.items()}
+    sheets = {name: sheet_name for name, (_, sheet_name) in SYNTHETIC_FILES.items()}
+    survey_year_params = {
+        "survey_year": survey_year,
+        "species_id": SPECIES_ID,
+        "CAN_haul_offset": int(can_haul_offset),
+        "hemisphere": "NW",
+        "data_root_dir": str(output_path.absolute()),
+        "length_US_filename": files["length_US"],
+        "length_US_sheet": sheets["length_US"],
+        "specimen_US_filename": files["specimen_US"],
+        "specimen_US_sheet": sheets["specimen_US"],
+        "catch_US_filename": files["catch_US"],
+        "catch_US_sheet": sheets["catch_US"],
+        "length_CAN_filename": files["length_CAN"],
+        "length_CAN_sheet": sheets["length_CAN"],
+        "specimen_CAN_filename": files["specimen_CAN"],
+        "specimen_CAN_sheet": sheets["specimen_CAN"],
+        "catch_CAN_filename": files["catch_CAN"],
+        "catch_CAN_sheet": sheets["catch_CAN"],
+        "filename_haul_to_transect_US": files["haul_to_transect_US"],
+        "haul_to_transect_US_sheetname": sheets["haul_to_transect_US"],
+        "filename_haul_to_transect_CAN": files["haul_to_transect_CAN"],
+        "haul_to_transect_CAN_sheetname": sheets["haul_to_transect_CAN"],
+        "strata_filename": files["strata"],
+        "strata_sheetname": sheets["strata"],
+        "geo_strata_filename": files["geo_strata"],
+        "geo_strata_sheetname": sheets["geo_strata"],
+        "nasc_no_age1_filename": files["nasc"],
+        "nasc_no_age1_sheetname": sheets["nasc"],
+        "nasc_all_ages_filename": files["nasc"],
+        "nasc_all_ages_sheetname": sheets["nasc"],
+        "mesh_filename": files["mesh"],
+        "mesh_sheetname": sheets["mesh"],
+        "smoothed_contour_filename": files["smoothed_contour"],
+        "smoothed_contour_sheetname": sheets["smoothed_contour"],
+    }
+
+    init_file_path = output_path / "initialization_config.yml"
+    survey_year_file_path = output_path / f"survey_year_{survey_year}_config.yml"
+
+    with open(init_file_path, "w") as f:
+        yaml.safe_dump(init_params, f)
+
+    with open(survey_year_file_path, "w") as f:
+        yaml.safe_dump(survey_year_params, f)
+
+    return init_file_path, survey_year_file_path